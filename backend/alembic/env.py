@@ -11,7 +11,7 @@ from alembic import context
 # Import your models here
 from app.core.config import settings
 from app.db.base import Base
-from app.models import area, finding, photo, status_history, user  # noqa: F401
+from app.models import archived_photo, area, bot_persistence, digest_delivery, finding, finding_counter, finding_key, finding_lifecycle, job, notification_preference, outbox, photo, status_history, user, user_area  # noqa: F401
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,44 @@
+"""Add reporter keyset index on findings
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Built concurrently so large findings tables stay writable;
+    # the new index also serves every lookup the reporter_id index did
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_findings_reporter_reported_at",
+            "findings",
+            ["reporter_id", "reported_at", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index("ix_findings_reporter_id", "findings", postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_findings_reporter_id",
+            "findings",
+            ["reporter_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_findings_reporter_reported_at", "findings", postgresql_concurrently=True, if_exists=True
+        )
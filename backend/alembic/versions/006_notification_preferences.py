@@ -0,0 +1,36 @@
+"""Add notification preferences
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "006"
+down_revision: Union[str, None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "notification_preferences",
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("new_finding", sa.Boolean(), nullable=False, server_default=sa.true()),
+        sa.Column("status_change", sa.Boolean(), nullable=False, server_default=sa.true()),
+        sa.Column("daily_summary", sa.Boolean(), nullable=False, server_default=sa.true()),
+        sa.Column("weekly_summary", sa.Boolean(), nullable=False, server_default=sa.true()),
+        sa.Column("daily_summary_time", sa.String(length=5), nullable=False, server_default="09:00"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("notification_preferences")
@@ -0,0 +1,25 @@
+"""Add finding event sequence
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "007"
+down_revision: Union[str, None] = "006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # IDs of live feed events, unique across API and bot processes
+    op.execute("CREATE SEQUENCE finding_event_seq")
+
+
+def downgrade() -> None:
+    op.execute("DROP SEQUENCE finding_event_seq")
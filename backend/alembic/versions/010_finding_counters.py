@@ -0,0 +1,59 @@
+"""Add finding counters
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "010"
+down_revision: Union[str, None] = "009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "finding_counters",
+        sa.Column("area_id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("status", sa.String(length=20), primary_key=True),
+        sa.Column("severity", sa.String(length=20), primary_key=True),
+        sa.Column("count", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.ForeignKeyConstraint(["area_id"], ["areas.id"], ondelete="CASCADE"),
+    )
+    op.create_table(
+        "finding_daily_counts",
+        sa.Column("day", sa.Date(), primary_key=True),
+        sa.Column("count", sa.BigInteger(), nullable=False, server_default="0"),
+    )
+    op.execute("""
+        INSERT INTO finding_counters (area_id, status, severity, count)
+        SELECT area_id, status, severity, count(*)
+        FROM findings
+        GROUP BY area_id, status, severity
+    """)
+    op.execute("""
+        INSERT INTO finding_daily_counts (day, count)
+        SELECT (reported_at AT TIME ZONE 'UTC')::date, count(*)
+        FROM findings
+        GROUP BY 1
+    """)
+    # Serves the oldest open critical finding on the dashboard
+    op.create_index(
+        "ix_findings_open_critical_reported_at",
+        "findings",
+        ["reported_at"],
+        postgresql_where=sa.text("severity = 'critical' AND status IN ('open', 'in_progress')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_findings_open_critical_reported_at", table_name="findings")
+    op.drop_table("finding_daily_counts")
+    op.drop_table("finding_counters")
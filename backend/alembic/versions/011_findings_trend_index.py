@@ -0,0 +1,30 @@
+"""Add covering index for finding trends
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "011"
+down_revision: Union[str, None] = "010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Lets trend queries aggregate a date range from the index alone
+    op.create_index(
+        "ix_findings_reported_at_dimensions",
+        "findings",
+        ["reported_at"],
+        postgresql_include=["area_id", "severity", "status"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_findings_reported_at_dimensions", table_name="findings")
@@ -0,0 +1,74 @@
+"""Add finding lifecycles
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "012"
+down_revision: Union[str, None] = "011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "finding_lifecycles",
+        sa.Column("finding_id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("status_since", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("seconds_open", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("seconds_in_progress", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("seconds_resolved", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("resolved_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("reopen_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.ForeignKeyConstraint(["finding_id"], ["findings.id"], ondelete="CASCADE"),
+    )
+    # Replays each finding's history once: every entry lasts until the next one,
+    # and the last one is the current status
+    op.execute("""
+        INSERT INTO finding_lifecycles (
+            finding_id, status_since, seconds_open, seconds_in_progress,
+            seconds_resolved, resolved_at, reopen_count
+        )
+        SELECT
+            f.id,
+            coalesce(max(h.updated_at), f.reported_at),
+            coalesce(sum(h.seconds) FILTER (WHERE h.new_status = 'open'), 0),
+            coalesce(sum(h.seconds) FILTER (WHERE h.new_status = 'in_progress'), 0),
+            coalesce(sum(h.seconds) FILTER (WHERE h.new_status = 'resolved'), 0),
+            CASE WHEN f.status IN ('resolved', 'closed') THEN coalesce(
+                max(h.updated_at) FILTER (
+                    WHERE h.new_status IN ('resolved', 'closed')
+                    AND h.prev_status IS DISTINCT FROM 'resolved'
+                    AND h.prev_status IS DISTINCT FROM 'closed'
+                ),
+                f.closed_at
+            ) END,
+            count(*) FILTER (
+                WHERE h.new_status IN ('open', 'in_progress')
+                AND h.prev_status IN ('resolved', 'closed')
+            )
+        FROM findings f
+        LEFT JOIN (
+            SELECT
+                finding_id,
+                new_status,
+                updated_at,
+                lag(new_status) OVER w AS prev_status,
+                extract(epoch FROM lead(updated_at) OVER w - updated_at) AS seconds
+            FROM status_history
+            WINDOW w AS (PARTITION BY finding_id ORDER BY updated_at, id)
+        ) h ON h.finding_id = f.id
+        GROUP BY f.id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table("finding_lifecycles")
@@ -0,0 +1,149 @@
+"""Partition findings and status history by year
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-19 00:00:00.000000
+
+Postgres cannot partition a table in place, so both tables are rebuilt and
+their rows copied over. Writes to findings are blocked until the migration
+commits; run it in a maintenance window on large databases.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "013"
+down_revision: Union[str, None] = "012"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tables holding a finding's partition key next to its ID, to reference it
+CHILD_TABLES = ("photos", "finding_lifecycles")
+
+
+def _create_partitions(table: str, first_year: int, last_year: int) -> None:
+    for year in range(first_year, last_year + 1):
+        op.execute(
+            f"CREATE TABLE {table}_y{year} PARTITION OF {table} "
+            f"FOR VALUES FROM ('{year}-01-01 00:00:00+00:00') TO ('{year + 1}-01-01 00:00:00+00:00')"
+        )
+
+
+def _create_finding_indexes() -> None:
+    op.create_index("ix_findings_report_id", "findings", ["report_id"])
+    op.create_index("ix_findings_area_id", "findings", ["area_id"])
+    op.create_index("ix_findings_severity", "findings", ["severity"])
+    op.create_index("ix_findings_status", "findings", ["status"])
+    op.create_index("ix_findings_reported_at", "findings", ["reported_at"])
+    op.create_index("ix_findings_reporter_reported_at", "findings", ["reporter_id", "reported_at", "id"])
+    op.create_index(
+        "ix_findings_open_critical_reported_at",
+        "findings",
+        ["reported_at"],
+        postgresql_where=sa.text("severity = 'critical' AND status IN ('open', 'in_progress')"),
+    )
+    op.create_index(
+        "ix_findings_reported_at_dimensions",
+        "findings",
+        ["reported_at"],
+        postgresql_include=["area_id", "severity", "status"],
+    )
+    op.create_foreign_key(None, "findings", "users", ["reporter_id"], ["id"], ondelete="RESTRICT")
+    op.create_foreign_key(None, "findings", "areas", ["area_id"], ["id"], ondelete="RESTRICT")
+    op.create_foreign_key(None, "findings", "users", ["assigned_to"], ["id"], ondelete="SET NULL")
+    op.create_index("ix_status_history_finding_id", "status_history", ["finding_id"])
+    op.create_foreign_key(None, "status_history", "users", ["updated_by"], ["id"], ondelete="RESTRICT")
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    this_year, first_year, last_year = bind.execute(sa.text("""
+        SELECT
+            extract(year FROM now() AT TIME ZONE 'UTC')::int,
+            extract(year FROM min(reported_at) AT TIME ZONE 'UTC')::int,
+            extract(year FROM max(reported_at) AT TIME ZONE 'UTC')::int
+        FROM findings
+    """)).one()
+    first_year = min(first_year or this_year, this_year)
+    last_year = max(last_year or this_year, this_year + 1)
+
+    op.execute("ALTER TABLE findings RENAME TO findings_unpartitioned")
+    op.execute("ALTER TABLE status_history RENAME TO status_history_unpartitioned")
+    op.execute("""
+        CREATE TABLE findings (LIKE findings_unpartitioned INCLUDING DEFAULTS)
+        PARTITION BY RANGE (reported_at)
+    """)
+    op.execute("""
+        CREATE TABLE status_history (
+            LIKE status_history_unpartitioned INCLUDING DEFAULTS,
+            finding_reported_at timestamptz NOT NULL
+        )
+        PARTITION BY RANGE (finding_reported_at)
+    """)
+    _create_partitions("findings", first_year, last_year)
+    _create_partitions("status_history", first_year, last_year)
+
+    op.execute("INSERT INTO findings SELECT * FROM findings_unpartitioned")
+    op.execute("""
+        INSERT INTO status_history
+        SELECT h.*, f.reported_at
+        FROM status_history_unpartitioned h
+        JOIN findings_unpartitioned f ON f.id = h.finding_id
+    """)
+    for table in CHILD_TABLES:
+        op.add_column(table, sa.Column("finding_reported_at", sa.DateTime(timezone=True), nullable=True))
+        op.execute(f"""
+            UPDATE {table} c SET finding_reported_at = f.reported_at
+            FROM findings_unpartitioned f
+            WHERE f.id = c.finding_id
+        """)
+        op.alter_column(table, "finding_reported_at", nullable=False)
+
+    op.drop_table("status_history_unpartitioned")
+    # CASCADE drops the foreign keys of photos and finding_lifecycles, re-added below
+    op.execute("DROP TABLE findings_unpartitioned CASCADE")
+
+    # Unique constraints of a partitioned table must include its partition key
+    op.create_primary_key("findings_pkey", "findings", ["id", "reported_at"])
+    op.create_primary_key("status_history_pkey", "status_history", ["id", "finding_reported_at"])
+    _create_finding_indexes()
+    for table in ("status_history", *CHILD_TABLES):
+        op.create_foreign_key(
+            None,
+            table,
+            "findings",
+            ["finding_id", "finding_reported_at"],
+            ["id", "reported_at"],
+            ondelete="CASCADE",
+        )
+    op.execute("ANALYZE findings, status_history")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE findings RENAME TO findings_partitioned")
+    op.execute("ALTER TABLE status_history RENAME TO status_history_partitioned")
+    op.execute("CREATE TABLE findings (LIKE findings_partitioned INCLUDING DEFAULTS)")
+    op.execute("CREATE TABLE status_history (LIKE status_history_partitioned INCLUDING DEFAULTS)")
+    op.drop_column("status_history", "finding_reported_at")
+
+    op.execute("INSERT INTO findings SELECT * FROM findings_partitioned")
+    op.execute("""
+        INSERT INTO status_history (id, finding_id, old_status, new_status, notes, updated_by, updated_at)
+        SELECT id, finding_id, old_status, new_status, notes, updated_by, updated_at
+        FROM status_history_partitioned
+    """)
+    op.drop_table("status_history_partitioned")
+    op.execute("DROP TABLE findings_partitioned CASCADE")
+    for table in CHILD_TABLES:
+        op.drop_column(table, "finding_reported_at")
+
+    op.create_primary_key("findings_pkey", "findings", ["id"])
+    op.create_primary_key("status_history_pkey", "status_history", ["id"])
+    op.create_index("ix_findings_id", "findings", ["id"])
+    op.create_index("ix_status_history_id", "status_history", ["id"])
+    _create_finding_indexes()
+    for table in ("status_history", *CHILD_TABLES):
+        op.create_foreign_key(None, table, "findings", ["finding_id"], ["id"], ondelete="CASCADE")
@@ -0,0 +1,48 @@
+"""Add cold archive of closed findings
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "014"
+down_revision: Union[str, None] = "013"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("findings", sa.Column("archived_at", sa.DateTime(timezone=True), nullable=True))
+    op.add_column("findings", sa.Column("archive_key", sa.String(length=500), nullable=True))
+    op.create_index(
+        "ix_findings_archive_candidates",
+        "findings",
+        ["closed_at"],
+        postgresql_where=sa.text("archived_at IS NULL AND status = 'closed'"),
+    )
+    op.create_table(
+        "archived_photos",
+        sa.Column("s3_key", sa.String(length=500), primary_key=True),
+        sa.Column("finding_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("finding_reported_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["finding_id", "finding_reported_at"],
+            ["findings.id", "findings.reported_at"],
+            ondelete="CASCADE",
+        ),
+    )
+    op.create_index("ix_archived_photos_finding_id", "archived_photos", ["finding_id"])
+
+
+def downgrade() -> None:
+    op.drop_table("archived_photos")
+    op.drop_index("ix_findings_archive_candidates", table_name="findings")
+    op.drop_column("findings", "archive_key")
+    op.drop_column("findings", "archived_at")
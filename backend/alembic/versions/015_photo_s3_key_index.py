@@ -0,0 +1,24 @@
+"""Index photo storage keys for orphan collection
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "015"
+down_revision: Union[str, None] = "014"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_photos_s3_key", "photos", ["s3_key"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_photos_s3_key", table_name="photos")
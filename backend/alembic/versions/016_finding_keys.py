@@ -0,0 +1,65 @@
+"""Add finding key directory and report ID counters
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-10-19 00:00:00.000000
+
+Restores database-enforced report ID uniqueness, lost when findings were
+partitioned, and replaces the advisory lock and max() scan of report ID
+allocation by a counter per year.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "016"
+down_revision: Union[str, None] = "015"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    duplicates = op.get_bind().execute(sa.text("""
+        SELECT report_id FROM findings GROUP BY report_id HAVING count(*) > 1 LIMIT 10
+    """)).scalars().all()
+    if duplicates:
+        raise RuntimeError(
+            f"Duplicate report IDs must be renumbered before upgrading: {', '.join(duplicates)}"
+        )
+
+    op.create_table(
+        "finding_keys",
+        sa.Column("finding_id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("reported_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("report_id", sa.String(length=50), nullable=False, unique=True),
+        sa.ForeignKeyConstraint(
+            ["finding_id", "reported_at"],
+            ["findings.id", "findings.reported_at"],
+            ondelete="CASCADE",
+        ),
+    )
+    op.execute("INSERT INTO finding_keys SELECT id, reported_at, report_id FROM findings")
+
+    op.create_table(
+        "report_id_counters",
+        sa.Column("year", sa.Integer(), primary_key=True, autoincrement=False),
+        sa.Column("last_number", sa.Integer(), nullable=False),
+    )
+    # Report IDs are PREFIX-YYYY-N; compared as numbers, since N outgrows its padding.
+    # regexp_match rather than split_part with negative positions, which needs Postgres 14
+    op.execute("""
+        INSERT INTO report_id_counters (year, last_number)
+        SELECT parts[1]::int, max(parts[2]::int)
+        FROM (SELECT regexp_match(report_id, '-([0-9]{4})-([0-9]+)$') AS parts FROM findings) AS ids
+        WHERE parts IS NOT NULL
+        GROUP BY 1
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table("report_id_counters")
+    op.drop_table("finding_keys")
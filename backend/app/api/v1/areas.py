@@ -5,7 +5,7 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.deps import CurrentAdmin, CurrentSuperAdmin, CurrentUser, DbSession
+from app.core.deps import CurrentAdmin, CurrentSuperAdmin, CurrentUser, DbSession, ReadDbSession
 from app.repositories.area import AreaRepository
 from app.schemas.area import AreaCreate, AreaResponse, AreaUpdate
 
@@ -14,7 +14,7 @@ router = APIRouter()
 
 @router.get("", response_model=list[AreaResponse])
 async def list_areas(
-    db: DbSession,
+    db: ReadDbSession,
     current_user: CurrentUser,
     level: int | None = Query(None, ge=1, le=3),
     parent_id: uuid.UUID | None = None,
@@ -27,7 +27,7 @@ async def list_areas(
 
 @router.get("/tree", response_model=list[AreaResponse])
 async def get_area_tree(
-    db: DbSession,
+    db: ReadDbSession,
     current_user: CurrentUser,
 ):
     """Get areas as a tree structure."""
@@ -39,7 +39,7 @@ async def get_area_tree(
 @router.get("/{area_id}", response_model=AreaResponse)
 async def get_area(
     area_id: uuid.UUID,
-    db: DbSession,
+    db: ReadDbSession,
     current_user: CurrentUser,
 ):
     """Get area details."""
@@ -1,11 +1,12 @@
 """Authentication API endpoints."""
 from datetime import timedelta
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.deps import CurrentUser, DbSession
-from app.core.security import create_access_token, verify_password, get_password_hash
+from app.core.rate_limit import client_ip as get_client_ip, login_throttle
+from app.core.security import PasswordHasherBusy, create_access_token, verify_password_async
 from app.repositories.user import UserRepository
 from app.schemas.user import LoginRequest, LoginResponse, UserResponse
 
@@ -15,13 +16,24 @@ router = APIRouter()
 @router.post("/login", response_model=LoginResponse)
 async def login(
     credentials: LoginRequest,
+    request: Request,
     db: DbSession,
 ):
     """Login with staff ID and password (for admin users)."""
+    client_ip = get_client_ip(request)
+    retry_after = login_throttle.check(credentials.staff_id, client_ip)
+    if retry_after:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many login attempts. Please try again later.",
+            headers={"Retry-After": str(retry_after)},
+        )
+
     user_repo = UserRepository(db)
     user = await user_repo.get_by_staff_id(credentials.staff_id)
 
     if not user or not user.is_active:
+        login_throttle.record_failure(credentials.staff_id, client_ip)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials",
@@ -34,12 +46,24 @@ async def login(
             detail="Please use the Telegram bot to register first",
         )
 
-    if not verify_password(credentials.password, user.password_hash):
+    try:
+        password_valid = await verify_password_async(credentials.password, user.password_hash)
+    except PasswordHasherBusy:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Login service is busy. Please try again shortly.",
+            headers={"Retry-After": "1"},
+        )
+
+    if not password_valid:
+        login_throttle.record_failure(credentials.staff_id, client_ip)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials",
         )
 
+    login_throttle.record_success(credentials.staff_id, client_ip)
+
     access_token = create_access_token(
         subject=str(user.id),
         expires_delta=timedelta(minutes=60 * 24 * 7),  # 7 days
@@ -1,29 +1,49 @@
 """Findings API endpoints."""
 import uuid
-from datetime import datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 from typing import Annotated
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.deps import CurrentAdmin, CurrentUser, DbSession
+from app.core.config import settings
+from app.core.deps import CurrentAdmin, CurrentUser, DbSession, ReadDbSession, StreamUser
+from app.core.query_budget import QueryBudget
 from app.models.finding import Severity, Status
-from app.repositories.finding import FindingRepository
+from app.repositories.finding import OPEN_STATUSES, FindingRepository
 from app.repositories.user import UserRepository
 from app.schemas.finding import (
+    AreaCount,
+    FindingAge,
     FindingCreate,
     FindingListResponse,
     FindingResponse,
+    FindingStats,
     FindingStatusUpdate,
+    FindingTrends,
+    ResolutionGroup,
+    ResolutionGroupBy,
+    ResolutionStats,
     SummaryReport,
+    TrendGranularity,
+    TrendGroupBy,
 )
+from app.services.archive import finding_archive
+from app.services.finding_events import stream_frames
+from app.services.trends import bucket_count, get_trends
 
 router = APIRouter()
 
 
-@router.get("", response_model=FindingListResponse)
+@router.get(
+    "",
+    response_model=FindingListResponse,
+    dependencies=[Depends(QueryBudget(7))],
+)
 async def list_findings(
-    db: DbSession,
+    db: ReadDbSession,
     current_user: CurrentUser,
     area_id: uuid.UUID | None = None,
     severity: Severity | None = None,
@@ -50,6 +70,7 @@ async def list_findings(
         offset=offset,
         limit=page_size,
     )
+    await finding_archive.restore(db, findings)
 
     total_pages = (total + page_size - 1) // page_size
 
@@ -62,10 +83,205 @@ async def list_findings(
     )
 
 
-@router.get("/{finding_id}", response_model=FindingResponse)
+@router.get(
+    "/stats",
+    response_model=FindingStats,
+    dependencies=[Depends(QueryBudget(4))],
+)
+async def get_finding_stats(
+    db: ReadDbSession,
+    current_user: CurrentUser,
+):
+    """Get dashboard totals, in time independent of the number of findings."""
+    finding_repo = FindingRepository(db)
+    today = datetime.now(timezone.utc).date()
+    week_start = today - timedelta(days=today.weekday())
+
+    counters = await finding_repo.get_counters()
+    daily = await finding_repo.get_daily_counts(since=week_start)
+    oldest = await finding_repo.get_oldest_open_critical()
+
+    by_status = {s: 0 for s in Status}
+    by_severity = {s: 0 for s in Severity}
+    open_by_area: dict[uuid.UUID, AreaCount] = {}
+    for row in counters:
+        by_status[Status(row.status)] += row.count
+        by_severity[Severity(row.severity)] += row.count
+        if row.status in OPEN_STATUSES:
+            area = open_by_area.setdefault(
+                row.area_id, AreaCount(area_id=row.area_id, area_name=row.area_name, count=0)
+            )
+            area.count += row.count
+
+    return FindingStats(
+        total=sum(by_status.values()),
+        by_status=by_status,
+        by_severity=by_severity,
+        open_by_area=sorted(open_by_area.values(), key=lambda a: (-a.count, a.area_name)),
+        reported_today=daily.get(today, 0),
+        reported_this_week=sum(daily.values()),
+        oldest_open_critical=FindingAge.model_validate(oldest) if oldest else None,
+    )
+
+
+@router.get(
+    "/resolution",
+    response_model=ResolutionStats,
+    dependencies=[Depends(QueryBudget(2))],
+)
+async def get_resolution_stats(
+    db: ReadDbSession,
+    current_user: CurrentUser,
+    group_by: ResolutionGroupBy = ResolutionGroupBy.SEVERITY,
+    date_from: datetime | None = None,
+    date_to: datetime | None = None,
+    area_id: Annotated[list[uuid.UUID] | None, Query()] = None,
+):
+    """Get time to resolve and SLA breaches of findings reported in a range."""
+    sla_hours = {
+        Severity.CRITICAL: settings.SLA_HOURS_CRITICAL,
+        Severity.HIGH: settings.SLA_HOURS_HIGH,
+        Severity.MEDIUM: settings.SLA_HOURS_MEDIUM,
+        Severity.LOW: settings.SLA_HOURS_LOW,
+    }
+    rows = await FindingRepository(db).resolution_stats(
+        group_by, sla_hours, date_from=date_from, date_to=date_to, area_ids=area_id
+    )
+
+    def hours(seconds: float | None) -> float | None:
+        return round(seconds / 3600, 2) if seconds is not None else None
+
+    if group_by == ResolutionGroupBy.SEVERITY:
+        order = [s.value for s in reversed(Severity)]
+        rows.sort(key=lambda row: order.index(row.key))
+
+    groups = []
+    for row in rows:
+        if group_by == ResolutionGroupBy.SEVERITY:
+            label = row.label.capitalize()
+        else:
+            label = row.label or "Unassigned"
+        groups.append(ResolutionGroup(
+            key=row.key,
+            label=label,
+            findings=row.findings,
+            resolved=row.resolved,
+            reopened=row.reopened,
+            mttr_hours=hours(row.mttr),
+            p50_hours=hours(row.p50),
+            p90_hours=hours(row.p90),
+            sla_breached=row.sla_breached,
+            sla_breach_rate=round(row.sla_breached / row.findings, 4),
+            open_hours=hours(row.open_seconds),
+            in_progress_hours=hours(row.in_progress_seconds),
+        ))
+
+    return ResolutionStats(
+        group_by=group_by,
+        date_from=date_from,
+        date_to=date_to,
+        sla_hours=sla_hours,
+        groups=groups,
+    )
+
+
+# Range shown when the client gives no date_from, in days before date_to
+DEFAULT_TREND_DAYS = {
+    TrendGranularity.DAY: 29,
+    TrendGranularity.WEEK: 7 * 11,
+    TrendGranularity.MONTH: 365,
+}
+
+
+@router.get(
+    "/trends",
+    response_model=FindingTrends,
+    dependencies=[Depends(QueryBudget(2))],
+)
+async def get_finding_trends(
+    # The primary, since results are cached under the live feed's version and a
+    # lagging replica could cache stale counts under a newer version
+    db: DbSession,
+    current_user: CurrentUser,
+    granularity: TrendGranularity = TrendGranularity.DAY,
+    group_by: TrendGroupBy = TrendGroupBy.SEVERITY,
+    date_from: date | None = None,
+    date_to: date | None = None,
+    tz: str = "UTC",
+    area_id: Annotated[list[uuid.UUID] | None, Query()] = None,
+    severity: Annotated[list[Severity] | None, Query()] = None,
+):
+    """Get the number of findings reported per period, one series per group.
+
+    Days are calendar days in ``tz``. Periods without findings count as zero.
+    """
+    try:
+        zone = ZoneInfo(tz)
+    except (ZoneInfoNotFoundError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown timezone: {tz}",
+        )
+    if date_to is None:
+        date_to = datetime.now(zone).date()
+    if date_from is None:
+        date_from = date_to - timedelta(days=DEFAULT_TREND_DAYS[granularity])
+    if date_from > date_to:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="date_from must not be after date_to",
+        )
+    if bucket_count(date_from, date_to, granularity) > settings.FINDING_TRENDS_MAX_BUCKETS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Range spans more than {settings.FINDING_TRENDS_MAX_BUCKETS} {granularity.value}s",
+        )
+
+    return await get_trends(
+        db,
+        granularity,
+        group_by,
+        tz,
+        date_from,
+        date_to,
+        area_ids=area_id,
+        severities=severity,
+    )
+
+
+@router.get("/stream")
+async def stream_findings(
+    current_user: StreamUser,
+    area_id: Annotated[list[uuid.UUID] | None, Query()] = None,
+    severity: Annotated[list[Severity] | None, Query()] = None,
+    last_event_id: Annotated[str | None, Header()] = None,
+):
+    """Stream finding changes as Server-Sent Events.
+
+    Sends ``finding.created``, ``finding.status_changed`` and ``finding.assigned``
+    events carrying the changed finding, and ``reset`` when the client may have
+    missed events and should refetch.
+    """
+    frames = stream_frames(
+        area_ids={str(a) for a in area_id} if area_id else None,
+        severities={s.value for s in severity} if severity else None,
+        last_event_id=last_event_id,
+    )
+    return StreamingResponse(
+        frames,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get(
+    "/{finding_id}",
+    response_model=FindingResponse,
+    dependencies=[Depends(QueryBudget(6))],
+)
 async def get_finding(
     finding_id: uuid.UUID,
-    db: DbSession,
+    db: ReadDbSession,
     current_user: CurrentUser,
 ):
     """Get finding details."""
@@ -80,6 +296,7 @@ async def get_finding(
 
     # TODO: Check area access for non-super-admins
 
+    await finding_archive.restore(db, [finding])
     return FindingResponse.model_validate(finding)
 
 
@@ -100,6 +317,12 @@ async def update_finding_status(
             detail="Finding not found",
         )
 
+    if finding.archived_at is not None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Finding is archived",
+        )
+
     # TODO: Check area access
 
     await finding_repo.update_status(
@@ -127,6 +350,12 @@ async def assign_finding(
             detail="Finding not found",
         )
 
+    if finding.archived_at is not None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Finding is archived",
+        )
+
     if assigned_to:
         user = await user_repo.get_by_id(assigned_to)
         if not user:
@@ -140,10 +369,14 @@ async def assign_finding(
     return FindingResponse.model_validate(finding)
 
 
-@router.post("/summary", response_model=SummaryReport)
+@router.post(
+    "/summary",
+    response_model=SummaryReport,
+    dependencies=[Depends(QueryBudget(6))],
+)
 async def generate_summary(
     current_user: CurrentAdmin,
-    db: DbSession,
+    db: ReadDbSession,
     date_from: Annotated[datetime, Query()] = ...,
     date_to: Annotated[datetime | None, Query()] = None,
 ):
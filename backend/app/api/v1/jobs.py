@@ -0,0 +1,68 @@
+"""Background job queue API endpoints (super-admin only)."""
+from datetime import datetime, timezone
+
+from fastapi import APIRouter, HTTPException, Query, status
+
+from app.core.deps import CurrentSuperAdmin, DbSession, ReadDbSession
+from app.models.job import JobStatus
+from app.repositories.job import JobRepository
+from app.schemas.job import JobCount, JobResponse, JobStats
+
+router = APIRouter()
+
+
+@router.get("/stats", response_model=JobStats)
+async def get_job_stats(
+    db: ReadDbSession,
+    current_admin: CurrentSuperAdmin,
+):
+    """Get queue depth and failure counts by job name (super-admin only)."""
+    rows = await JobRepository(db).stats()
+    totals = {job_status: 0 for job_status in JobStatus}
+    oldest = None
+    for row in rows:
+        totals[JobStatus(row.status)] += row.count
+        if row.status == JobStatus.QUEUED and row.oldest_due_at is not None:
+            oldest = min(oldest or row.oldest_due_at, row.oldest_due_at)
+
+    max_wait = (datetime.now(timezone.utc) - oldest).total_seconds() if oldest else 0.0
+    return JobStats(
+        queued=totals[JobStatus.QUEUED],
+        running=totals[JobStatus.RUNNING],
+        failed=totals[JobStatus.FAILED],
+        max_wait_seconds=max(max_wait, 0.0),
+        by_name=[JobCount.model_validate(row, from_attributes=True) for row in rows],
+    )
+
+
+@router.get("/failed", response_model=list[JobResponse])
+async def list_failed_jobs(
+    db: ReadDbSession,
+    current_admin: CurrentSuperAdmin,
+    name: str | None = None,
+    page: int = Query(1, ge=1),
+    page_size: int = Query(50, ge=1, le=100),
+):
+    """List jobs that ran out of attempts, most recent first (super-admin only)."""
+    jobs, _ = await JobRepository(db).list_failed(
+        name=name,
+        offset=(page - 1) * page_size,
+        limit=page_size,
+    )
+    return [JobResponse.model_validate(job) for job in jobs]
+
+
+@router.post("/{job_id}/retry", response_model=JobResponse)
+async def retry_job(
+    job_id: int,
+    db: DbSession,
+    current_admin: CurrentSuperAdmin,
+):
+    """Requeue a failed job with fresh attempts (super-admin only)."""
+    job = await JobRepository(db).retry(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Failed job not found",
+        )
+    return JobResponse.model_validate(job)
@@ -1,50 +1,40 @@
 """Notification settings API endpoints."""
-from enum import Enum
+from fastapi import APIRouter, HTTPException, status
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from pydantic import BaseModel
-
-from app.core.deps import CurrentUser
+from app.bot.notifications import notification_dispatcher
+from app.core.deps import CurrentUser, DbSession, ReadDbSession
+from app.repositories.notification import NotificationPreferenceRepository
+from app.repositories.user import UserRepository
+from app.schemas.notification import NotificationSettings
 
 router = APIRouter()
 
 
-class NotificationType(str, Enum):
-    """Notification types."""
-
-    NEW_FINDING = "new_finding"
-    STATUS_CHANGE = "status_change"
-    DAILY_SUMMARY = "daily_summary"
-    WEEKLY_SUMMARY = "weekly_summary"
-
-
-class NotificationSettings(BaseModel):
-    """Notification settings model."""
-
-    new_finding: bool = True
-    status_change: bool = True
-    daily_summary: bool = True
-    weekly_summary: bool = True
-    daily_summary_time: str = "09:00"
-
-
 @router.get("/settings", response_model=NotificationSettings)
 async def get_notification_settings(
     current_user: CurrentUser,
+    db: ReadDbSession,
 ):
     """Get user's notification preferences."""
-    # TODO: Implement notification settings from database
-    return NotificationSettings()
+    preferences = await NotificationPreferenceRepository(db).get(current_user.id)
+    if preferences is None:
+        return NotificationSettings()
+    return NotificationSettings.model_validate(preferences)
 
 
 @router.patch("/settings", response_model=NotificationSettings)
 async def update_notification_settings(
     settings: NotificationSettings,
     current_user: CurrentUser,
+    db: DbSession,
 ):
     """Update user's notification preferences."""
-    # TODO: Implement notification settings update
-    return settings
+    preferences = await NotificationPreferenceRepository(db).upsert(
+        current_user.id, settings.model_dump(exclude_unset=True)
+    )
+    # Bot processes reload who receives which notifications
+    await UserRepository(db).notify_changed(current_user)
+    return NotificationSettings.model_validate(preferences)
 
 
 @router.post("/test")
@@ -52,11 +42,26 @@ async def send_test_notification(
     current_user: CurrentUser,
 ):
     """Send a test notification to the user."""
-    # TODO: Implement test notification via Telegram
     if not current_user.telegram_id:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="No Telegram account linked",
         )
+    if not notification_dispatcher.running:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Telegram notifications are not available",
+        )
+
+    sent = await notification_dispatcher.send(
+        current_user.telegram_id,
+        "🔔 *Test notification*\n\nNotifications from Easy Safety Inspection reach you here.",
+        "test",
+    )
+    if not sent:
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail="Telegram did not accept the message; make sure you have started the bot",
+        )
 
     return {"message": "Test notification sent"}
@@ -1,43 +1,22 @@
 """Setup endpoint for initial deployment configuration."""
-import asyncio
-import os
 import uuid
 
-from fastapi import APIRouter, HTTPException, status
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
+from fastapi import APIRouter
 from sqlalchemy import select
 
 from app.db.base import Base
+from app.db.session import async_session, engine
 from app.models import User, Area
-from app.core.security import get_password_hash
+from app.core.security import get_password_hash_async
 from app.models.user import Role
 from app.core.deps import CurrentSuperAdmin
 
 router = APIRouter()
-engine = None
-async_session = None
-
-
-def get_engine():
-    global engine, async_session
-    if engine is None:
-        database_url = os.environ.get("DATABASE_URL")
-        if not database_url:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="DATABASE_URL not configured",
-            )
-        engine = create_async_engine(database_url, echo=False)
-        async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-    return engine, async_session
 
 
 @router.post("/run-migrations")
 async def run_migrations(_: CurrentSuperAdmin):
     """Run database migrations and create initial data."""
-    engine, async_session = get_engine()
-
     # Create all tables
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
@@ -48,8 +27,6 @@ async def run_migrations(_: CurrentSuperAdmin):
 @router.post("/setup-initial-data")
 async def setup_initial_data(_: CurrentSuperAdmin):
     """Create initial super admin and default areas."""
-    engine, async_session = get_engine()
-
     async with async_session() as session:
         # Check if admin already exists
         result = await session.execute(select(User).where(User.staff_id == "ADMIN001"))
@@ -68,7 +45,7 @@ async def setup_initial_data(_: CurrentSuperAdmin):
             department="Administration",
             section="IT",
             role=Role.SUPER_ADMIN,
-            password_hash=get_password_hash("admin123"),
+            password_hash=await get_password_hash_async("admin123"),
             is_active=True,
         )
         session.add(admin)
@@ -0,0 +1,45 @@
+"""Telegram webhook endpoint."""
+import hmac
+
+from fastapi import APIRouter, Header, HTTPException, Request, status
+from telegram import Update
+
+from app.core.config import settings
+from app.core.deps import DbSession
+from app.repositories.telegram_update import TelegramUpdateRepository
+
+router = APIRouter()
+
+
+@router.post("/webhook", include_in_schema=False)
+async def telegram_webhook(
+    request: Request,
+    db: DbSession,
+    x_telegram_bot_api_secret_token: str | None = Header(default=None),
+):
+    """Receive an update from Telegram and queue it for the replica running the bot."""
+    if not x_telegram_bot_api_secret_token or not hmac.compare_digest(
+        x_telegram_bot_api_secret_token, settings.TELEGRAM_WEBHOOK_SECRET
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Invalid secret token",
+        )
+
+    try:
+        payload = await request.json()
+        update = Update.de_json(payload, None)
+    except (ValueError, KeyError, TypeError, AttributeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid update payload",
+        )
+    if update is None or not isinstance(update.update_id, int):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid update payload",
+        )
+
+    # Any replica accepts the update; the one holding the webhook lock handles it
+    await TelegramUpdateRepository(db).add(update.update_id, payload)
+    return {"ok": True}
@@ -5,18 +5,24 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.deps import CurrentSuperAdmin, DbSession
-from app.core.security import get_password_hash
+from app.core.deps import CurrentSuperAdmin, DbSession, ReadDbSession
+from app.core.query_budget import QueryBudget
+from app.core.security import get_password_hash_async
 from app.models.user import Role
+from app.repositories.area import AreaRepository
 from app.repositories.user import UserRepository
-from app.schemas.user import UserCreate, UserResponse, UserUpdate
+from app.schemas.user import UserAreas, UserCreate, UserResponse, UserUpdate
 
 router = APIRouter()
 
 
-@router.get("", response_model=list[UserResponse])
+@router.get(
+    "",
+    response_model=list[UserResponse],
+    dependencies=[Depends(QueryBudget(3))],
+)
 async def list_users(
-    db: DbSession,
+    db: ReadDbSession,
     current_admin: CurrentSuperAdmin,
     role: Role | None = None,
     is_active: bool | None = None,
@@ -38,7 +44,7 @@ async def list_users(
 @router.get("/{user_id}", response_model=UserResponse)
 async def get_user(
     user_id: uuid.UUID,
-    db: DbSession,
+    db: ReadDbSession,
     current_admin: CurrentSuperAdmin,
 ):
     """Get user details (super-admin only)."""
@@ -74,7 +80,7 @@ async def create_user(
     # Hash password if provided
     create_data = user_data.model_dump(exclude={"password"})
     if user_data.password:
-        create_data["password_hash"] = get_password_hash(user_data.password)
+        create_data["password_hash"] = await get_password_hash_async(user_data.password)
 
     user = await user_repo.create(create_data)
     return UserResponse.model_validate(user)
@@ -99,7 +105,7 @@ async def update_user(
 
     update_data = user_data.model_dump(exclude_unset=True, exclude={"password"})
     if user_data.password:
-        update_data["password_hash"] = get_password_hash(user_data.password)
+        update_data["password_hash"] = await get_password_hash_async(user_data.password)
 
     updated = await user_repo.update(user, update_data)
     return UserResponse.model_validate(updated)
@@ -148,3 +154,56 @@ async def activate_user(
 
     updated = await user_repo.update(user, {"is_active": True})
     return UserResponse.model_validate(updated)
+
+
+@router.get("/{user_id}/areas", response_model=UserAreas)
+async def get_user_areas(
+    user_id: uuid.UUID,
+    db: ReadDbSession,
+    current_admin: CurrentSuperAdmin,
+):
+    """Get the areas a user is responsible for (super-admin only)."""
+    user_repo = UserRepository(db)
+    user = await user_repo.get_by_id(user_id)
+
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found",
+        )
+
+    return UserAreas(area_ids=await user_repo.get_area_ids(user.id))
+
+
+@router.put("/{user_id}/areas", response_model=UserAreas)
+async def set_user_areas(
+    user_id: uuid.UUID,
+    areas: UserAreas,
+    db: DbSession,
+    current_admin: CurrentSuperAdmin,
+):
+    """Replace the areas a user is responsible for (super-admin only)."""
+    user_repo = UserRepository(db)
+    user = await user_repo.get_by_id(user_id)
+
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found",
+        )
+    if areas.area_ids and not user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Only admins can be assigned to areas",
+        )
+
+    area_ids = list(dict.fromkeys(areas.area_ids))
+    found = await AreaRepository(db).count_existing(area_ids)
+    if found != len(area_ids):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Unknown area ID",
+        )
+
+    await user_repo.set_areas(user, area_ids)
+    return UserAreas(area_ids=area_ids)
@@ -1,12 +1,30 @@
 """Telegram bot module."""
 from telegram.ext import Application
 
+from app.bot.concurrency import ChatOrderedUpdateProcessor
+from app.bot.instrumentation import instrument_handlers
+from app.bot.persistence import PostgresPersistence
 from app.core.config import settings
 
 
 def create_bot_application() -> Application:
     """Create and configure the Telegram bot application."""
-    application = Application.builder().token(settings.TELEGRAM_BOT_TOKEN).build()
+    builder = (
+        Application.builder()
+        .token(settings.TELEGRAM_BOT_TOKEN)
+        .concurrent_updates(ChatOrderedUpdateProcessor(settings.BOT_CONCURRENT_UPDATES))
+        .persistence(PostgresPersistence(update_interval=settings.BOT_PERSISTENCE_INTERVAL))
+        # Replies, photo downloads and notifications share this pool across all
+        # concurrent updates; size it above BOT_CONCURRENT_UPDATES
+        .connection_pool_size(settings.BOT_CONNECTION_POOL_SIZE)
+        .pool_timeout(settings.BOT_POOL_TIMEOUT)
+        .read_timeout(settings.BOT_READ_TIMEOUT)
+        .media_write_timeout(settings.BOT_MEDIA_WRITE_TIMEOUT)
+    )
+    if settings.TELEGRAM_API_BASE_URL:
+        base_url = settings.TELEGRAM_API_BASE_URL.rstrip("/")
+        builder = builder.base_url(f"{base_url}/bot").base_file_url(f"{base_url}/file/bot")
+    application = builder.build()
 
     # Register handlers - order matters! Conversation handlers first
     from app.bot.handlers import (
@@ -32,6 +50,9 @@ def create_bot_application() -> Application:
     application.add_handler(menu.callback_handler)
     application.add_handler(common.my_reports_detail_handler)
     application.add_handler(common.my_reports_back_handler)
+    application.add_handler(common.my_reports_more_handler)
+
+    instrument_handlers(application)
 
     return application
 
@@ -0,0 +1,87 @@
+"""Concurrent bot update processing that keeps each chat's updates in order."""
+import asyncio
+import contextlib
+import time
+from typing import Any, Awaitable, Hashable
+
+from telegram import Update
+from telegram.ext import BaseUpdateProcessor
+
+from app.core.metrics import Gauge, Histogram
+
+BOT_UPDATES_IN_FLIGHT = Gauge("bot_updates_in_flight", "Bot updates currently being handled")
+BOT_CHAT_WAIT_SECONDS = Histogram(
+    "bot_chat_wait_seconds",
+    "Time an update waited for earlier updates from the same chat",
+)
+
+
+def _ordering_key(update: object) -> Hashable | None:
+    """Get the chat (or user) whose updates must be handled in order."""
+    if not isinstance(update, Update):
+        return None
+    if update.effective_chat is not None:
+        return update.effective_chat.id
+    if update.effective_user is not None:
+        return ("user", update.effective_user.id)
+    return None
+
+
+class ChatOrderedUpdateProcessor(BaseUpdateProcessor):
+    """Process updates concurrently, but one at a time per chat.
+
+    ConversationHandler state must advance in message order, so two taps from the
+    same user never race, while different users are handled in parallel up to
+    ``max_concurrent_updates``. An update only takes a slot once its chat's
+    earlier updates are done, so a chat sending a burst cannot hold the slots
+    other users need.
+    """
+
+    __slots__ = ("_chat_locks", "_slots")
+
+    def __init__(self, max_concurrent_updates: int) -> None:
+        """Initialize processor."""
+        super().__init__(max_concurrent_updates)
+        # PTB acquires this before do_process_update, which would let updates
+        # waiting on their chat hold slots; slots are taken from _slots instead
+        self._semaphore = contextlib.nullcontext()
+        self._slots = asyncio.Semaphore(max_concurrent_updates)
+        # chat key -> [lock, number of updates holding or waiting for it]
+        self._chat_locks: dict[Hashable, list] = {}
+
+    async def do_process_update(self, update: object, coroutine: Awaitable[Any]) -> None:
+        """Run the handler coroutine once earlier updates from its chat are done."""
+        key = _ordering_key(update)
+        if key is None:
+            async with self._slots:
+                await self._run(coroutine)
+            return
+
+        entry = self._chat_locks.setdefault(key, [asyncio.Lock(), 0])
+        entry[1] += 1
+        started_at = time.perf_counter()
+        try:
+            # asyncio.Lock wakes waiters first-in first-out, and updates arrive here
+            # in the order they were fetched, so per-chat order is preserved.
+            # Only the update whose turn it is competes for a slot.
+            async with entry[0]:
+                BOT_CHAT_WAIT_SECONDS.observe(time.perf_counter() - started_at)
+                async with self._slots:
+                    await self._run(coroutine)
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del self._chat_locks[key]
+
+    async def _run(self, coroutine: Awaitable[Any]) -> None:
+        BOT_UPDATES_IN_FLIGHT.inc()
+        try:
+            await coroutine
+        finally:
+            BOT_UPDATES_IN_FLIGHT.dec()
+
+    async def initialize(self) -> None:
+        """Nothing to set up."""
+
+    async def shutdown(self) -> None:
+        """Nothing to release; in-flight updates are awaited by the application."""
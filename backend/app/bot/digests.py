@@ -0,0 +1,248 @@
+"""Scheduled daily and weekly digests of findings for admins.
+
+Admins get their digests at their own ``daily_summary_time``, so a digest
+period ends at a different time for each group of admins sharing one. A run
+every minute sends the periods that ended since the previous run. Each period
+is aggregated over every area in one query, each area is rendered once, and
+every admin in the group is sent the blocks for their areas (super-admins
+without areas get the top-level sites). Deliveries are recorded per batch, so a
+rerun after a crash or restart only sends to the admins who have not received
+that period's digest.
+An advisory lock keeps replicas from running the same digest at once.
+"""
+import asyncio
+import logging
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from zoneinfo import ZoneInfo
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.cron import CronTrigger
+from sqlalchemy import text
+
+from app.bot.notifications import notification_dispatcher
+from app.bot.rendering import md
+from app.bot.subscribers import Subscriber, subscriber_index
+from app.core.config import settings
+from app.core.metrics import Histogram
+from app.db.session import async_session, engine
+from app.repositories.digest import DigestRepository
+from app.repositories.finding import FindingRepository
+from app.schemas.notification import NotificationType
+
+logger = logging.getLogger(__name__)
+
+DIGEST_RUN_SECONDS = Histogram(
+    "bot_digest_run_seconds",
+    "Duration of scheduled digest runs",
+    labelnames=("kind",),
+    buckets=(0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0),
+)
+
+DAILY = NotificationType.DAILY_SUMMARY.value
+WEEKLY = NotificationType.WEEKLY_SUMMARY.value
+
+# pg_try_advisory_xact_lock(class, key); the class is arbitrary but fixed
+DIGEST_LOCK_CLASS = 4040
+DIGEST_LOCK_KEYS = {DAILY: 1, WEEKLY: 2}
+
+# Keeps a digest well under Telegram's 4096 character message limit
+DIGEST_MAX_AREAS = 15
+
+
+def digest_period(
+    kind: str, now: datetime, send_time: str | None = None
+) -> tuple[datetime, datetime]:
+    """Get the latest complete period of a digest sent at ``send_time``, as of ``now``, in UTC.
+
+    ``send_time`` is local ``HH:MM`` and defaults to ``DAILY_SUMMARY_TIME``.
+    """
+    tz = ZoneInfo(settings.DIGEST_TIMEZONE)
+    hour, minute = (int(part) for part in (send_time or settings.DAILY_SUMMARY_TIME).split(":"))
+    local_now = now.astimezone(tz)
+
+    # Local wall-clock arithmetic, so periods follow daylight saving changes
+    end = local_now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if end > local_now:
+        end -= timedelta(days=1)
+    if kind == WEEKLY:
+        end -= timedelta(days=(end.weekday() - settings.WEEKLY_SUMMARY_DAY) % 7)
+        start = end - timedelta(days=7)
+    else:
+        start = end - timedelta(days=1)
+    return start.astimezone(timezone.utc), end.astimezone(timezone.utc)
+
+
+def render_area_block(row: Any) -> str:
+    """Render the digest lines of one area from an aggregate row."""
+    lines = [f"📍 *{md(row.name)}*"]
+    if row.new_total:
+        urgent = []
+        if row.new_critical:
+            urgent.append(f"🔴 {row.new_critical} critical")
+        if row.new_high:
+            urgent.append(f"🟠 {row.new_high} high")
+        suffix = f" ({', '.join(urgent)})" if urgent else ""
+        lines.append(f"🆕 {row.new_total} new{suffix}")
+    if row.closed:
+        lines.append(f"✅ {row.closed} closed")
+    lines.append(f"📋 {row.open_now} open")
+    return "\n".join(lines)
+
+
+def render_digest(kind: str, start: datetime, end: datetime, blocks: list[str]) -> str:
+    """Put area blocks together into one digest message."""
+    tz = ZoneInfo(settings.DIGEST_TIMEZONE)
+    title = "Daily Safety Digest" if kind == DAILY else "Weekly Safety Digest"
+    header = (
+        f"📊 *{title}*\n"
+        f"{start.astimezone(tz):%d %b %H:%M} – {end.astimezone(tz):%d %b %Y %H:%M}"
+    )
+    message = "\n\n".join([header, *blocks[:DIGEST_MAX_AREAS]])
+    if len(blocks) > DIGEST_MAX_AREAS:
+        message += f"\n\n...and {len(blocks) - DIGEST_MAX_AREAS} more areas"
+    return message
+
+
+def _due_periods(
+    kind: str, since: datetime, now: datetime
+) -> dict[tuple[datetime, datetime], list[tuple[Subscriber, tuple[uuid.UUID, ...]]]]:
+    """Group a digest's recipients by the period of theirs that ended after ``since``."""
+    due: dict[tuple[datetime, datetime], list] = {}
+    for subscriber, area_ids in subscriber_index.scopes(NotificationType(kind)):
+        period = digest_period(kind, now, subscriber.summary_time)
+        if period[1] > since:
+            due.setdefault(period, []).append((subscriber, area_ids))
+    return due
+
+
+async def run_digest(kind: str, since: datetime, now: datetime | None = None) -> int | None:
+    """Send the digests of a kind whose period ended after ``since`` to admins who have not received them.
+
+    Returns the number of digests sent, or None if another replica holds the lock.
+    """
+    now = now or datetime.now(timezone.utc)
+    await subscriber_index.refresh()
+    due = _due_periods(kind, since, now)
+    if not due:
+        return 0
+
+    # Transaction-scoped so the lock also works behind PgBouncer in transaction mode
+    async with engine.connect() as lock_conn, lock_conn.begin():
+        locked = await lock_conn.scalar(
+            text("SELECT pg_try_advisory_xact_lock(:lock_class, :key)"),
+            {"lock_class": DIGEST_LOCK_CLASS, "key": DIGEST_LOCK_KEYS[kind]},
+        )
+        if not locked:
+            logger.info(f"Skipping {kind} at {now:%Y-%m-%d %H:%M}; another replica is sending it")
+            return None
+
+        started = time.perf_counter()
+        try:
+            sent = 0
+            for (start, end), recipients in sorted(due.items()):
+                sent += await _send_digests(kind, start, end, recipients)
+            return sent
+        finally:
+            DIGEST_RUN_SECONDS.observe(time.perf_counter() - started, kind=kind)
+
+
+async def _send_digests(
+    kind: str,
+    start: datetime,
+    end: datetime,
+    recipients: list[tuple[Subscriber, tuple[uuid.UUID, ...]]],
+) -> int:
+    """Aggregate, render and fan out one digest period."""
+    async with async_session() as db:
+        delivered = await DigestRepository(db).get_delivered_user_ids(kind, end)
+        recipients = [
+            (subscriber, area_ids)
+            for subscriber, area_ids in recipients
+            if subscriber.user_id not in delivered
+        ]
+        if not recipients:
+            return 0
+        rows = await FindingRepository(db).area_digest_stats(start, end)
+
+    blocks = {row.area_id: render_area_block(row) for row in rows}
+
+    messages: list[tuple[uuid.UUID, int, str]] = []
+    for subscriber, area_ids in recipients:
+        user_blocks = [blocks[area_id] for area_id in area_ids if area_id in blocks]
+        if user_blocks:
+            message = render_digest(kind, start, end, user_blocks)
+            messages.append((subscriber.user_id, subscriber.telegram_id, message))
+
+    sent = 0
+    batch_size = settings.DIGEST_CONCURRENCY
+    for offset in range(0, len(messages), batch_size):
+        batch = messages[offset:offset + batch_size]
+        results = await asyncio.gather(
+            *(notification_dispatcher.send(chat_id, message, kind) for _, chat_id, message in batch)
+        )
+        delivered_ids = [user_id for (user_id, _, _), ok in zip(batch, results) if ok]
+        # Recorded per batch, so a crash resends at most one batch
+        async with async_session() as db:
+            await DigestRepository(db).record_deliveries(kind, end, delivered_ids)
+            await db.commit()
+        sent += len(delivered_ids)
+
+    logger.info(f"Sent {sent} {kind} digests for {end:%Y-%m-%d}")
+    return sent
+
+
+class DigestScheduler:
+    """Runs digests every minute inside the bot process."""
+
+    def __init__(self) -> None:
+        """Initialize scheduler."""
+        self._scheduler: AsyncIOScheduler | None = None
+        self._running: set[asyncio.Task] = set()
+        # Periods ending after this were not sent yet, per kind
+        self._since: dict[str, datetime] = {}
+
+    def start(self) -> None:
+        """Schedule digests and catch up on those missed while the bot was down."""
+        tz = ZoneInfo(settings.DIGEST_TIMEZONE)
+        self._scheduler = AsyncIOScheduler(timezone=tz)
+        for kind in (DAILY, WEEKLY):
+            self._scheduler.add_job(
+                self._run, CronTrigger(minute="*", timezone=tz),
+                args=[kind], id=kind, coalesce=True, max_instances=1, misfire_grace_time=60,
+            )
+        self._scheduler.start()
+
+        now = datetime.now(timezone.utc)
+        for kind in (DAILY, WEEKLY):
+            self._since[kind] = now - timedelta(hours=settings.DIGEST_CATCHUP_HOURS)
+            asyncio.create_task(self._run(kind))
+
+    async def stop(self) -> None:
+        """Stop scheduling and cancel digests in progress; reruns resume them."""
+        if self._scheduler is not None:
+            self._scheduler.shutdown(wait=False)
+            self._scheduler = None
+        for task in self._running:
+            task.cancel()
+        await asyncio.gather(*self._running, return_exceptions=True)
+
+    async def _run(self, kind: str) -> None:
+        """Send the periods that ended since the last run, tracked so shutdown can cancel it."""
+        task = asyncio.current_task()
+        self._running.add(task)
+        now = datetime.now(timezone.utc)
+        since = max(self._since[kind], now - timedelta(hours=settings.DIGEST_CATCHUP_HOURS))
+        try:
+            # Not advanced when skipped or failed, so the next run retries the periods
+            if await run_digest(kind, since, now) is not None:
+                self._since[kind] = now
+        except Exception:
+            logger.exception(f"{kind} digest failed")
+        finally:
+            self._running.discard(task)
+
+
+digest_scheduler = DigestScheduler()
@@ -1,12 +1,25 @@
 """Common command handlers."""
+import base64
+import struct
 import uuid
+from datetime import datetime, timedelta, timezone
+
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import CommandHandler, CallbackQueryHandler, ContextTypes
 
-from app.repositories.user import UserRepository
+from app.bot.rendering import (
+    CARD_KEYBOARD,
+    cached_finding_card,
+    finding_button,
+    page_cache,
+    render_finding_card,
+    render_finding_line,
+)
+from app.bot.user_cache import user_cache
 from app.repositories.finding import FindingRepository
-from app.models.finding import Severity, Status
+from app.core.query_budget import bot_query_budget
 from app.db.session import async_session
+from app.services.archive import finding_archive
 
 
 async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -34,88 +47,114 @@ async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
     )
 
 
-async def my_reports_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    """Handle the /myreports command - show user's findings with interactive buttons."""
-    if not update.effective_user or not update.effective_message:
-        return
+REPORTS_PAGE_SIZE = 5
+MORE_PREFIX = "myreports_more_"
+# reported_at as epoch microseconds, number of findings already shown, finding id
+_CURSOR = struct.Struct(">qI16s")
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
 
-    telegram_id = update.effective_user.id
 
-    async with async_session() as db:
-        user_repo = UserRepository(db)
-        user = await user_repo.get_by_telegram_id(telegram_id)
+def encode_reports_cursor(reported_at: datetime, finding_id: uuid.UUID, shown: int) -> str:
+    """Pack a My Reports page position into callback data (max 64 bytes)."""
+    micros = (reported_at - _EPOCH) // timedelta(microseconds=1)
+    packed = _CURSOR.pack(micros, shown, finding_id.bytes)
+    return MORE_PREFIX + base64.urlsafe_b64encode(packed).decode().rstrip("=")
 
-        if not user:
-            await update.effective_message.reply_text(
-                "You need to register first! Use /register to get started."
-            )
-            return
 
-        # Get user's findings
-        finding_repo = FindingRepository(db)
-        findings, total = await finding_repo.list_findings(
-            reporter_id=user.id,
-            limit=10
+def decode_reports_cursor(data: str) -> tuple[datetime, uuid.UUID, int] | None:
+    """Unpack callback data from encode_reports_cursor, or None if malformed."""
+    encoded = data[len(MORE_PREFIX):]
+    try:
+        micros, shown, finding_id = _CURSOR.unpack(
+            base64.urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4))
         )
+    except (ValueError, struct.error):
+        return None
+    return _EPOCH + timedelta(microseconds=micros), uuid.UUID(bytes=finding_id), shown
+
+
+async def build_reports_page(
+    reporter_id: uuid.UUID,
+    cursor: tuple[datetime, uuid.UUID, int] | None = None,
+) -> tuple[str, InlineKeyboardMarkup | None]:
+    """Render one page of a reporter's findings, newest first."""
+    cache_key = (reporter_id, cursor)
+    cached = page_cache.get(cache_key)
+    if cached is not None:
+        return cached
 
+    before = cursor[:2] if cursor else None
+    shown = cursor[2] if cursor else 0
+
+    async with async_session() as db:
+        finding_repo = FindingRepository(db)
+        total = await finding_repo.count_by_reporter(reporter_id)
         if total == 0:
-            await update.effective_message.reply_text(
+            return (
                 "You haven't reported any findings yet.\n\n"
-                "Use /report to submit your first safety finding."
-            )
-            return
-
-        # Build response with buttons
-        severity_emoji = {
-            Severity.LOW: "🟢",
-            Severity.MEDIUM: "🟡",
-            Severity.HIGH: "🟠",
-            Severity.CRITICAL: "🔴",
-        }
-
-        status_emoji = {
-            Status.OPEN: "📋",
-            Status.IN_PROGRESS: "🔄",
-            Status.RESOLVED: "✅",
-            Status.CLOSED: "🔒",
-        }
-
-        message = f"📋 *Your Reported Findings* ({total} total)\n\n"
-
-        keyboard = []
-        for finding in findings[:5]:  # Show max 5
-            sev_emoji = severity_emoji.get(finding.severity, "⚪")
-            stat_emoji = status_emoji.get(finding.status, "📋")
-            area_name = finding.area.name if finding.area else "N/A"
-
-            keyboard.append([InlineKeyboardButton(
-                f"{finding.report_id} - {sev_emoji} {finding.severity.title()} - {stat_emoji} {finding.status.title()}",
-                callback_data=f"myreports_detail_{finding.id}"
-            )])
-
-            message += (
-                f"{stat_emoji} *{finding.report_id}*\n"
-                f"{sev_emoji} {finding.severity.title()} | 📍 {area_name}\n"
-                f"📝 {finding.description[:40]}{'...' if len(finding.description) > 40 else ''}\n"
-                f"━━━━━━━━━━━━━━━━\n"
+                "Use /report to submit your first safety finding.",
+                None,
             )
+        # One extra row tells whether another page exists
+        rows = await finding_repo.list_reporter_summaries(
+            reporter_id, limit=REPORTS_PAGE_SIZE + 1, before=before
+        )
 
-        # Add navigation button if more than 5 findings
-        if total > 5:
-            keyboard.append([InlineKeyboardButton(
-                f"📄 Load More ({total - 5} more)",
-                callback_data="myreports_more"
-            )])
+    has_more = len(rows) > REPORTS_PAGE_SIZE
+    rows = rows[:REPORTS_PAGE_SIZE]
+
+    message = f"📋 *Your Reported Findings* ({total} total)\n"
+    if shown and rows:
+        message += f"Showing {shown + 1}–{shown + len(rows)}\n"
+    message += "\n"
+    if not rows:
+        message += "No more findings.\n"
+    message += "".join(render_finding_line(row) for row in rows)
+
+    keyboard = [[finding_button(row)] for row in rows]
+
+    navigation = []
+    if shown:
+        navigation.append(InlineKeyboardButton("« Newest", callback_data="myreports_back"))
+    if has_more:
+        last = rows[-1]
+        remaining = max(total - shown - len(rows), 1)
+        navigation.append(InlineKeyboardButton(
+            f"📄 Load More ({remaining} more)",
+            callback_data=encode_reports_cursor(last.reported_at, last.id, shown + len(rows))
+        ))
+    if navigation:
+        keyboard.append(navigation)
+
+    page = (message, InlineKeyboardMarkup(keyboard) if keyboard else None)
+    page_cache.set(cache_key, page)
+    return page
+
+
+@bot_query_budget(3)
+async def my_reports_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Handle the /myreports command - show user's findings with interactive buttons."""
+    if not update.effective_user or not update.effective_message:
+        return
 
-        reply_markup = InlineKeyboardMarkup(keyboard)
+    user = await user_cache.get(update.effective_user.id)
 
+    if not user:
         await update.effective_message.reply_text(
-            message,
-            reply_markup=reply_markup,
-            parse_mode="Markdown"
+            "You need to register first! Use /register to get started."
         )
+        return
+
+    message, reply_markup = await build_reports_page(user.id)
+
+    await update.effective_message.reply_text(
+        message,
+        reply_markup=reply_markup,
+        parse_mode="Markdown"
+    )
 
 
+@bot_query_budget(7)
 async def my_reports_detail_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle viewing details of a specific finding."""
     query = update.callback_query
@@ -124,170 +163,99 @@ async def my_reports_detail_callback(update: Update, context: ContextTypes.DEFAU
 
     await query.answer()
 
-    finding_id = query.data.split("_")[-1]
+    try:
+        finding_id = uuid.UUID(query.data.split("_")[-1])
+    except ValueError:
+        return
+
+    user = await user_cache.get(update.effective_user.id)
+
+    if not user:
+        await query.edit_message_text(
+            "You need to register first! Use /register to get started."
+        )
+        return
 
     async with async_session() as db:
         finding_repo = FindingRepository(db)
-        finding = await finding_repo.get_by_id(uuid.UUID(finding_id))
+        # A cheap version check decides whether the cached card is still current
+        updated_at = await finding_repo.get_version(finding_id, reporter_id=user.id)
 
-        if not finding:
+        if updated_at is None:
             await query.edit_message_text(
                 "❌ Finding not found. It may have been deleted."
             )
             return
 
-        # Build detail message
-        severity_emoji = {
-            Severity.LOW: "🟢",
-            Severity.MEDIUM: "🟡",
-            Severity.HIGH: "🟠",
-            Severity.CRITICAL: "🔴",
-        }
-
-        status_emoji = {
-            Status.OPEN: "📋",
-            Status.IN_PROGRESS: "🔄",
-            Status.RESOLVED: "✅",
-            Status.CLOSED: "🔒",
-        }
-
-        sev_icon = severity_emoji.get(finding.severity, "")
-        stat_icon = status_emoji.get(finding.status, "")
-
-        message = f"""
-📋 *Finding Details*
-
-*Report ID:* {finding.report_id}
-*Severity:* {sev_icon} {finding.severity.title()}
-*Status:* {stat_icon} {finding.status.title().replace('_', ' ')}
-
-📍 *Area:* {finding.area.name if finding.area else 'N/A'}
-📍 *Location:* {finding.location or 'Not specified'}
-
-📝 *Description:*
-{finding.description}
-
-🕐 *Reported:* {finding.reported_at.strftime('%Y-%m-%d %H:%M')} UTC
-"""
-
-        if finding.closed_at:
-            message += f"🔒 *Closed:* {finding.closed_at.strftime('%Y-%m-%d %H:%M')} UTC\n"
-
-        if finding.assignee:
-            message += f"👤 *Assigned To:* {finding.assignee.full_name}\n"
-
-        # Add photos if available
-        if finding.photos:
-            message += f"\n📷 *Photos:* {len(finding.photos)} attached\n"
-
-        # Add status history
-        if finding.status_history:
-            message += "\n━━━━━━━━━━━━━━━━\n📜 *Status History:*\n"
-            for history in finding.status_history:
-                old_str = history.old_status or "Created"
-                old_formatted = old_str.title().replace('_', ' ')
-                new_formatted = history.new_status.title().replace('_', ' ')
-                message += f"  {old_formatted} → {new_formatted}"
-                if history.notes:
-                    message += f"\n    📝 {history.notes}"
-                if history.updated_by_user:
-                    message += f"\n    👤 {history.updated_by_user.full_name}"
-                message += f"\n    🕐 {history.updated_at.strftime('%Y-%m-%d %H:%M')}\n"
-
-        # Add back button
-        keyboard = [[InlineKeyboardButton("« Back to My Reports", callback_data="myreports_back")]]
-        reply_markup = InlineKeyboardMarkup(keyboard)
+        message = cached_finding_card(finding_id, updated_at)
+        if message is None:
+            finding = await finding_repo.get_by_id(finding_id)
+            await finding_archive.restore(db, [finding])
+            message = render_finding_card(finding)
 
-        await query.edit_message_text(
-            message,
-            reply_markup=reply_markup,
-            parse_mode="Markdown"
-        )
+    await query.edit_message_text(
+        message,
+        reply_markup=CARD_KEYBOARD,
+        parse_mode="Markdown"
+    )
 
 
+@bot_query_budget(3)
 async def my_reports_back_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    """Handle back to reports button."""
+    """Handle back to reports button - show the newest page."""
     query = update.callback_query
     if not query:
         return
 
     await query.answer()
 
-    # Get the user and refresh their reports
-    telegram_id = update.effective_user.id
+    user = await user_cache.get(update.effective_user.id)
 
-    async with async_session() as db:
-        user_repo = UserRepository(db)
-        user = await user_repo.get_by_telegram_id(telegram_id)
+    if not user:
+        await query.edit_message_text(
+            "You need to register first! Use /register to get started."
+        )
+        return
 
-        if not user:
-            await query.edit_message_text(
-                "You need to register first! Use /register to get started."
-            )
-            return
+    message, reply_markup = await build_reports_page(user.id)
 
-        # Get user's findings
-        finding_repo = FindingRepository(db)
-        findings, total = await finding_repo.list_findings(
-            reporter_id=user.id,
-            limit=10
-        )
+    await query.edit_message_text(
+        message,
+        reply_markup=reply_markup,
+        parse_mode="Markdown"
+    )
 
-        if total == 0:
-            await query.edit_message_text(
-                "You haven't reported any findings yet.\n\n"
-                "Use /report to submit your first safety finding."
-            )
-            return
 
-        # Build response with buttons
-        severity_emoji = {
-            Severity.LOW: "🟢",
-            Severity.MEDIUM: "🟡",
-            Severity.HIGH: "🟠",
-            Severity.CRITICAL: "🔴",
-        }
-
-        status_emoji = {
-            Status.OPEN: "📋",
-            Status.IN_PROGRESS: "🔄",
-            Status.RESOLVED: "✅",
-            Status.CLOSED: "🔒",
-        }
-
-        message = f"📋 *Your Reported Findings* ({total} total)\n\n"
-
-        keyboard = []
-        for finding in findings[:5]:
-            sev_emoji = severity_emoji.get(finding.severity, "⚪")
-            stat_emoji = status_emoji.get(finding.status, "📋")
-            area_name = finding.area.name if finding.area else "N/A"
-
-            keyboard.append([InlineKeyboardButton(
-                f"{finding.report_id} - {sev_emoji} {finding.severity.title()} - {stat_emoji} {finding.status.title()}",
-                callback_data=f"myreports_detail_{finding.id}"
-            )])
-
-            message += (
-                f"{stat_emoji} *{finding.report_id}*\n"
-                f"{sev_emoji} {finding.severity.title()} | 📍 {area_name}\n"
-                f"📝 {finding.description[:40]}{'...' if len(finding.description) > 40 else ''}\n"
-                f"━━━━━━━━━━━━━━━━\n"
-            )
+@bot_query_budget(3)
+async def my_reports_more_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle the Load More button - show the page after the cursor."""
+    query = update.callback_query
+    if not query:
+        return
 
-        if total > 5:
-            keyboard.append([InlineKeyboardButton(
-                f"📄 Load More ({total - 5} more)",
-                callback_data="myreports_more"
-            )])
+    cursor = decode_reports_cursor(query.data)
+    if cursor is None:
+        await query.answer("This button has expired. Use /myreports again.")
+        return
 
-        reply_markup = InlineKeyboardMarkup(keyboard)
+    await query.answer()
 
+    user = await user_cache.get(update.effective_user.id)
+
+    if not user:
         await query.edit_message_text(
-            message,
-            reply_markup=reply_markup,
-            parse_mode="Markdown"
+            "You need to register first! Use /register to get started."
         )
+        return
+
+    # The cursor only positions the page; results are always the caller's own findings
+    message, reply_markup = await build_reports_page(user.id, cursor)
+
+    await query.edit_message_text(
+        message,
+        reply_markup=reply_markup,
+        parse_mode="Markdown"
+    )
 
 
 async def cancel_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -315,6 +283,10 @@ my_reports_back_handler = CallbackQueryHandler(
     my_reports_back_callback,
     pattern=r"^myreports_back$"
 )
+my_reports_more_handler = CallbackQueryHandler(
+    my_reports_more_callback,
+    pattern=rf"^{MORE_PREFIX}"
+)
 
 # Export individual handlers
 __all__ = [
@@ -322,5 +294,6 @@ __all__ = [
     "my_reports_handler",
     "cancel_handler",
     "my_reports_detail_handler",
-    "my_reports_back_handler"
+    "my_reports_back_handler",
+    "my_reports_more_handler",
 ]
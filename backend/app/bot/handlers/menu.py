@@ -2,8 +2,9 @@
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup, BotCommand
 from telegram.ext import CommandHandler, CallbackQueryHandler, ContextTypes
 
-from app.repositories.user import UserRepository
-from app.db.session import async_session
+from app.bot.rendering import md
+from app.bot.user_cache import user_cache
+from app.models.user import Role
 
 
 async def menu_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -62,43 +63,40 @@ async def menu_callback_handler(update: Update, context: ContextTypes.DEFAULT_TY
 
         telegram_id = update.effective_user.id
 
-        async with async_session() as db:
-            user_repo = UserRepository(db)
-            user = await user_repo.get_by_telegram_id(telegram_id)
-
-            if not user:
-                await query.edit_message_text(
-                    "❌ You're not registered yet.\n\n"
-                    "Use /register to get started."
-                )
-                return
-
-            from app.models.user import UserRole
-            role_display = {
-                UserRole.REPORTER: "Reporter",
-                UserRole.ADMIN: "Admin",
-                UserRole.SUPER_ADMIN: "Super Admin",
-            }
-
-            message = f"""👤 *My Profile*
-
-*Name:* {user.full_name}
-*Staff ID:* {user.staff_id}
-*Department:* {user.department}
-*Section:* {user.section}
+        user = await user_cache.get(telegram_id)
+
+        if not user:
+            await query.edit_message_text(
+                "❌ You're not registered yet.\n\n"
+                "Use /register to get started."
+            )
+            return
+
+        role_display = {
+            Role.REPORTER: "Reporter",
+            Role.ADMIN: "Admin",
+            Role.SUPER_ADMIN: "Super Admin",
+        }
+
+        message = f"""👤 *My Profile*
+
+*Name:* {md(user.full_name)}
+*Staff ID:* {md(user.staff_id)}
+*Department:* {md(user.department)}
+*Section:* {md(user.section)}
 *Role:* {role_display.get(user.role, 'Reporter')}
 *Status:* {'✅ Active' if user.is_active else '❌ Inactive'}
 
 *Joined:* {user.created_at.strftime('%Y-%m-%d') if user.created_at else 'N/A'}"""
 
-            keyboard = [[InlineKeyboardButton("« Back to Menu", callback_data="menu_back")]]
-            reply_markup = InlineKeyboardMarkup(keyboard)
+        keyboard = [[InlineKeyboardButton("« Back to Menu", callback_data="menu_back")]]
+        reply_markup = InlineKeyboardMarkup(keyboard)
 
-            await query.edit_message_text(
-                message,
-                reply_markup=reply_markup,
-                parse_mode="Markdown"
-            )
+        await query.edit_message_text(
+            message,
+            reply_markup=reply_markup,
+            parse_mode="Markdown"
+        )
 
     elif action == "help":
         from app.bot.handlers.common import help_command
@@ -2,6 +2,7 @@
 from telegram import Update
 from telegram.ext import CommandHandler, ConversationHandler, MessageHandler, filters, ContextTypes
 
+from app.bot.user_cache import user_cache
 from app.models.user import Role
 from app.repositories.user import UserRepository
 from app.db.session import async_session
@@ -26,15 +27,13 @@ async def register_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -
     telegram_id = update.effective_user.id
 
     # Check if user already exists
-    async with async_session() as db:
-        user_repo = UserRepository(db)
-        user = await user_repo.get_by_telegram_id(telegram_id)
+    user = await user_cache.get(telegram_id)
 
-        if user:
-            await update.effective_message.reply_text(
-                "You are already registered! Use /report to submit findings."
-            )
-            return ConversationHandler.END
+    if user:
+        await update.effective_message.reply_text(
+            "You are already registered! Use /report to submit findings."
+        )
+        return ConversationHandler.END
 
     # Start registration
     context.user_data["registration"] = {}
@@ -151,6 +150,7 @@ async def confirm(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     response = update.effective_message.text.strip().lower()
 
     if response not in ("yes", "y"):
+        context.user_data.pop("registration", None)
         await update.effective_message.reply_text(
             "Registration cancelled. Use /register to start again."
         )
@@ -169,6 +169,7 @@ async def confirm(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
             await update.effective_message.reply_text(
                 "This Staff ID is already registered. Please contact support."
             )
+            context.user_data.pop("registration", None)
             return ConversationHandler.END
 
         user = await user_repo.create({
@@ -184,6 +185,9 @@ async def confirm(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
 
         await db.commit()
 
+    # Drop the cached "not registered" result so other commands work immediately
+    user_cache.invalidate(telegram_id)
+    context.user_data.pop("registration", None)
     await update.effective_message.reply_text(
         f"Registration complete! 🎉\n\n"
         f"Welcome, {user.full_name}!\n\n"
@@ -195,6 +199,7 @@ async def confirm(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
 
 async def cancel(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     """Cancel the conversation."""
+    context.user_data.pop("registration", None)
     await update.effective_message.reply_text(
         "Registration cancelled. Use /register to start again."
     )
@@ -203,6 +208,8 @@ async def cancel(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
 
 # Create the conversation handler
 handler = ConversationHandler(
+    name="register",
+    persistent=True,
     entry_points=[CommandHandler("register", register_command)],
     states={
         FULL_NAME: [MessageHandler(filters.TEXT & ~filters.COMMAND, full_name)],
@@ -13,7 +13,8 @@ from telegram.ext import (
 )
 
 from app.models.finding import Severity, Status
-from app.repositories.user import UserRepository
+from app.bot.rendering import invalidate_reporter_pages
+from app.bot.user_cache import user_cache
 from app.repositories.finding import FindingRepository
 from app.repositories.area import AreaRepository
 from app.db.session import async_session
@@ -38,16 +39,15 @@ async def report_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     telegram_id = update.effective_user.id
 
     # Check if user is registered
-    async with async_session() as db:
-        user_repo = UserRepository(db)
-        user = await user_repo.get_by_telegram_id(telegram_id)
+    user = await user_cache.get(telegram_id)
 
-        if not user:
-            await update.effective_message.reply_text(
-                "You need to register first! Use /register to get started."
-            )
-            return ConversationHandler.END
+    if not user:
+        await update.effective_message.reply_text(
+            "You need to register first! Use /register to get started."
+        )
+        return ConversationHandler.END
 
+    async with async_session() as db:
         # Get available areas
         area_repo = AreaRepository(db)
         areas = await area_repo.list_areas(level=1)  # Get top-level areas
@@ -131,19 +131,13 @@ async def photo(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     if update.effective_message.photo:
         # Get the largest photo (last in the list)
         photo = update.effective_message.photo[-1]
-        # Get file object
-        file = await photo.get_file()
-
-        # Download photo to bytes
-        photo_bytes = await file.download_as_bytearray()
-
-        # Store photo data in context (will be saved to S3 later)
+        # Keep only the Telegram file reference; conversation state is persisted,
+        # and the file can be downloaded by file_id when it is saved to S3
         context.user_data["report"]["photo"] = {
             "file_id": photo.file_id,
             "file_size": photo.file_size,
             "width": photo.width,
             "height": photo.height,
-            "data": photo_bytes,
         }
 
         await _proceed_to_severity(update)
@@ -204,74 +198,62 @@ async def location(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     else:
         context.user_data["report"]["location"] = None
 
-    # Create finding with retry for duplicate report ID
-    report_data = context.user_data["report"]
-    max_retries = 5
-
-    for attempt in range(max_retries):
-        try:
-            async with async_session() as db:
-                finding_repo = FindingRepository(db)
-
-                # Generate report ID
-                report_id = await finding_repo.get_next_report_id()
-
-                # Create finding
-                finding = await finding_repo.create({
-                    "report_id": report_id,
-                    "reporter_id": report_data["user_id"],
-                    "area_id": report_data["area_id"],
-                    "description": report_data["description"],
-                    "severity": report_data["severity"],
-                    "status": Status.OPEN,
-                    "location": report_data.get("location"),
-                })
-
-                await db.commit()
-
-                # Get severity emoji
-                severity_emoji = {
-                    Severity.LOW: "🟢",
-                    Severity.MEDIUM: "🟡",
-                    Severity.HIGH: "🟠",
-                    Severity.CRITICAL: "🔴",
-                }
-
-                photo_msg = " (with photo)" if report_data.get("photo") else ""
-
-                await update.effective_message.reply_text(
-                    f"Your safety finding has been recorded{photo_msg}! ✅\n\n"
-                    f"Report ID: {finding.report_id}\n"
-                    f"Severity: {severity_emoji[finding.severity]} {finding.severity.title()}\n"
-                    f"Status: {finding.status.title().replace('_', ' ')}\n\n"
-                    f"Thank you for helping keep our workplace safe! 🦺\n\n"
-                    f"Use /report to submit another finding."
-                )
-
-                break  # Success, exit retry loop
-
-        except Exception as e:
-            error_str = str(e)
-            # Check if this is a duplicate report ID error
-            if "ix_findings_report_id" in error_str and attempt < max_retries - 1:
-                # Retry with a new report ID
-                continue
-            else:
-                import traceback
-                traceback.print_exc()
-                await update.effective_message.reply_text(
-                    f"Sorry, there was an error saving your report. Please try again.\n\n"
-                    f"Error: {error_str[:200]}"
-                )
-                break
-
-    # TODO: Send notification to assigned admins
+    # Create finding
+    report_data = context.user_data.pop("report")
+
+    try:
+        async with async_session() as db:
+            finding_repo = FindingRepository(db)
+
+            # Generate report ID
+            report_id = await finding_repo.get_next_report_id()
+
+            # Create finding
+            finding = await finding_repo.create({
+                "report_id": report_id,
+                "reporter_id": report_data["user_id"],
+                "area_id": report_data["area_id"],
+                "description": report_data["description"],
+                "severity": report_data["severity"],
+                "status": Status.OPEN,
+                "location": report_data.get("location"),
+            })
+
+            await db.commit()
+            invalidate_reporter_pages(report_data["user_id"])
+
+            # Get severity emoji
+            severity_emoji = {
+                Severity.LOW: "🟢",
+                Severity.MEDIUM: "🟡",
+                Severity.HIGH: "🟠",
+                Severity.CRITICAL: "🔴",
+            }
+
+            photo_msg = " (with photo)" if report_data.get("photo") else ""
+
+            await update.effective_message.reply_text(
+                f"Your safety finding has been recorded{photo_msg}! ✅\n\n"
+                f"Report ID: {finding.report_id}\n"
+                f"Severity: {severity_emoji[finding.severity]} {finding.severity.title()}\n"
+                f"Status: {finding.status.title().replace('_', ' ')}\n\n"
+                f"Thank you for helping keep our workplace safe! 🦺\n\n"
+                f"Use /report to submit another finding."
+            )
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        await update.effective_message.reply_text(
+            f"Sorry, there was an error saving your report. Please try again.\n\n"
+            f"Error: {str(e)[:200]}"
+        )
 
     return ConversationHandler.END
 
 
 async def cancel_report(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     """Cancel the report conversation."""
+    context.user_data.pop("report", None)
     await update.effective_message.reply_text(
         "Report cancelled. Use /report to start again."
     )
@@ -280,6 +262,8 @@ async def cancel_report(update: Update, context: ContextTypes.DEFAULT_TYPE) -> i
 
 # Create the conversation handler
 handler = ConversationHandler(
+    name="report",
+    persistent=True,
     entry_points=[CommandHandler("report", report_command)],
     states={
         SELECT_AREA: [CallbackQueryHandler(area_selected)],
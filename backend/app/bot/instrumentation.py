@@ -0,0 +1,73 @@
+"""Latency instrumentation for bot handlers."""
+import functools
+import time
+from typing import Any, Callable
+
+from telegram.ext import Application, BaseHandler, ConversationHandler
+
+from app.core.config import settings
+from app.core.instrumentation import QUERY_COUNT_BUCKETS, QueryStats, current_query_stats
+from app.core.metrics import Histogram
+from app.core.query_budget import check_query_stats
+
+BOT_HANDLER_SECONDS = Histogram(
+    "bot_handler_seconds",
+    "Bot handler latency",
+    labelnames=("handler", "outcome"),
+)
+BOT_HANDLER_QUERIES = Histogram(
+    "bot_handler_db_queries",
+    "SQL statements executed per bot handler call",
+    labelnames=("handler",),
+    buckets=QUERY_COUNT_BUCKETS,
+)
+
+
+def _timed_callback(callback: Callable, name: str) -> Callable:
+    """Wrap a handler callback to record latency and query count."""
+    budget = getattr(callback, "query_budget", None)
+
+    @functools.wraps(callback)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        stats = QueryStats(track_shapes=settings.QUERY_BUDGET_MODE != "off")
+        stats.budget = budget
+        token = current_query_stats.set(stats)
+        started_at = time.perf_counter()
+        outcome = "error"
+        try:
+            result = await callback(*args, **kwargs)
+            outcome = "ok"
+            return result
+        finally:
+            current_query_stats.reset(token)
+            BOT_HANDLER_SECONDS.observe(time.perf_counter() - started_at, handler=name, outcome=outcome)
+            BOT_HANDLER_QUERIES.observe(stats.count, handler=name)
+            if stats.shapes is not None:
+                check_query_stats(stats, f"bot {name}")
+
+    wrapper.__instrumented__ = True
+    return wrapper
+
+
+def _instrument_handler(handler: BaseHandler) -> None:
+    """Instrument a handler, descending into conversation handlers."""
+    if isinstance(handler, ConversationHandler):
+        nested = list(handler.entry_points) + list(handler.fallbacks)
+        for state_handlers in handler.states.values():
+            nested.extend(state_handlers)
+        for child in nested:
+            _instrument_handler(child)
+        return
+
+    callback = handler.callback
+    if getattr(callback, "__instrumented__", False):
+        return
+    name = f"{callback.__module__.rsplit('.', 1)[-1]}.{callback.__name__}"
+    handler.callback = _timed_callback(callback, name)
+
+
+def instrument_handlers(application: Application) -> None:
+    """Record latency for every registered bot handler."""
+    for handlers in application.handlers.values():
+        for handler in handlers:
+            _instrument_handler(handler)
@@ -0,0 +1,294 @@
+"""Bot startup and shutdown shared by the polling worker and webhook mode."""
+import asyncio
+import contextlib
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+from telegram import Bot, BotCommand, Update
+from telegram.error import TelegramError
+from telegram.ext import Application
+
+from app.bot import get_bot
+from app.bot.digests import digest_scheduler
+from app.bot.notifications import notification_dispatcher
+from app.bot.user_cache import listen_for_changes
+from app.core.config import settings
+from app.db.listen import ListenSubscription, listener, wait
+from app.db.session import async_session, engine
+from app.repositories.telegram_update import TELEGRAM_UPDATES_CHANNEL, TelegramUpdateRepository
+from app.services.outbox import outbox_dispatcher
+
+logger = logging.getLogger(__name__)
+
+ALLOWED_UPDATES = ["message", "callback_query", "chosen_inline_result"]
+
+# pg_try_advisory_lock(class, key) held by the API replica running the bot in webhook mode
+WEBHOOK_LOCK_CLASS = 4041
+WEBHOOK_LOCK_KEY = 1
+
+# Queued webhook updates handed to the bot per database round trip
+UPDATE_BATCH_SIZE = 100
+
+_changes: ListenSubscription | None = None
+# Bot applications and outbound senders in this process relying on _changes
+_changes_users = 0
+
+
+def webhook_enabled() -> bool:
+    """Check whether the bot should run inside the API via webhook."""
+    return bool(settings.TELEGRAM_BOT_TOKEN and settings.TELEGRAM_WEBHOOK_URL)
+
+
+async def setup_bot_commands(application: Application) -> None:
+    """Set up bot commands for the Telegram command menu."""
+    commands = [
+        BotCommand("start", "Start the bot or view your profile"),
+        BotCommand("menu", "Show bot menu"),
+        BotCommand("register", "Register your account"),
+        BotCommand("report", "Report a new safety finding"),
+        BotCommand("myreports", "View your reported findings"),
+        BotCommand("help", "Show help information"),
+        BotCommand("cancel", "Cancel current operation"),
+    ]
+    await application.bot.set_my_commands(commands)
+    logger.info("Bot commands registered")
+
+
+async def error_handler(update, context) -> None:
+    """Log errors caused by updates."""
+    logger.error(f"Update {update} caused error {context.error}")
+
+
+def _start_listener() -> None:
+    """Start keeping the user cache, subscriber index and page cache current with the database."""
+    global _changes, _changes_users
+    _changes_users += 1
+    if _changes is None:
+        _changes = listen_for_changes()
+
+
+async def _stop_listener() -> None:
+    """Stop following changes once nothing in the process relies on them."""
+    global _changes, _changes_users
+    _changes_users = max(_changes_users - 1, 0)
+    if _changes_users == 0 and _changes is not None:
+        changes, _changes = _changes, None
+        await listener.unsubscribe(changes)
+
+
+async def _start_application() -> Application:
+    """Initialize and start the bot application without an updater."""
+    _start_listener()
+
+    application = get_bot()
+    application.add_error_handler(error_handler)
+    await application.initialize()
+    await application.start()
+    await setup_bot_commands(application)
+    return application
+
+
+async def start_bot() -> Application:
+    """Start the bot application along with its notification sender."""
+    application = await _start_application()
+    notification_dispatcher.start(application.bot)
+    outbox_dispatcher.start()
+    digest_scheduler.start()
+    return application
+
+
+async def start_webhook() -> Application:
+    """Start the bot and point Telegram at this deployment's webhook route.
+
+    Every API replica sends notifications with its own outbound bot, so only
+    the handlers and the digest scheduler start here.
+    """
+    application = await _start_application()
+    digest_scheduler.start()
+    try:
+        # Pending updates are kept so nothing sent during a restart is lost
+        await application.bot.set_webhook(
+            url=settings.TELEGRAM_WEBHOOK_URL,
+            secret_token=settings.TELEGRAM_WEBHOOK_SECRET,
+            allowed_updates=ALLOWED_UPDATES,
+            max_connections=settings.TELEGRAM_WEBHOOK_MAX_CONNECTIONS,
+        )
+    except BaseException:
+        await stop_webhook(application)
+        raise
+    logger.info("Telegram webhook set")
+    return application
+
+
+async def stop_webhook(application: Application) -> None:
+    """Stop the webhook bot, draining updates it has taken from the queue first."""
+    # The webhook is left registered, so updates queue until the next owner starts
+    await application.stop()
+    await digest_scheduler.stop()
+    await application.shutdown()
+    await _stop_listener()
+
+
+async def stop_bot(application: Application) -> None:
+    """Stop the bot application, draining queued updates first."""
+    if application.updater and application.updater.running:
+        await application.updater.stop()
+    await application.stop()
+    await digest_scheduler.stop()
+    await outbox_dispatcher.stop()
+    # After the handlers and the outbox have drained, so their notifications are sent too
+    await notification_dispatcher.stop()
+    await application.shutdown()
+    await _stop_listener()
+
+
+async def start_outbound() -> Bot | None:
+    """Start sending notifications from an API process, whether or not it runs the bot.
+
+    Returns None if Telegram cannot be reached; notifications are then unavailable.
+    """
+    kwargs = {}
+    if settings.TELEGRAM_API_BASE_URL:
+        base_url = settings.TELEGRAM_API_BASE_URL.rstrip("/")
+        kwargs = {"base_url": f"{base_url}/bot", "base_file_url": f"{base_url}/file/bot"}
+    bot = Bot(settings.TELEGRAM_BOT_TOKEN, **kwargs)
+    try:
+        await bot.initialize()
+    except TelegramError as e:
+        logger.warning(f"Telegram notifications disabled in this process: {e}")
+        return None
+    # Alert recipients come from the subscriber index, which this keeps current
+    _start_listener()
+    notification_dispatcher.start(bot)
+    outbox_dispatcher.start()
+    return bot
+
+
+async def stop_outbound(bot: Bot) -> None:
+    """Send queued notifications and close the outbound bot."""
+    await outbox_dispatcher.stop()
+    await notification_dispatcher.stop()
+    await bot.shutdown()
+    await _stop_listener()
+
+
+class WebhookRunner:
+    """Runs the bot in webhook mode in the one API replica holding the webhook lock.
+
+    Conversation state is read from the database only when the bot starts, so
+    two replicas handling updates would overwrite each other's conversations.
+    The lock is a Postgres session advisory lock on a connection held for as
+    long as the bot runs. Any replica accepts webhook calls into the
+    ``telegram_updates`` table, and the owner takes them from there in order.
+    Other replicas take over once the owner has stopped and flushed its
+    conversations, or its connection is lost.
+    """
+
+    def __init__(self) -> None:
+        """Initialize runner."""
+        self.application: Application | None = None
+        self._lock_conn: AsyncConnection | None = None
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Start waiting for the lock, then run the bot, in the background."""
+        if not settings.TELEGRAM_WEBHOOK_SECRET:
+            raise RuntimeError("TELEGRAM_WEBHOOK_SECRET must be set when TELEGRAM_WEBHOOK_URL is set")
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the bot, then release the lock to the next replica."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self._release()
+
+    async def _run(self) -> None:
+        """Own the bot while holding the lock, and give it up if the lock connection is lost."""
+        while True:
+            try:
+                await self._acquire()
+                self.application = await start_webhook()
+                await self._handle_updates()
+                logger.error("Lost the webhook lock connection; stopping the bot")
+            except Exception:
+                logger.exception("Webhook bot failed; retrying")
+            await self._release()
+            await asyncio.sleep(settings.TELEGRAM_WEBHOOK_LOCK_CHECK_SECONDS)
+
+    async def _acquire(self) -> None:
+        """Wait until this replica holds the webhook lock."""
+        waiting = False
+        while True:
+            conn = await engine.connect()
+            try:
+                locked = await conn.scalar(
+                    text("SELECT pg_try_advisory_lock(:lock_class, :key)"),
+                    {"lock_class": WEBHOOK_LOCK_CLASS, "key": WEBHOOK_LOCK_KEY},
+                )
+                # Session-level, so it outlives the transaction; don't sit idle in one
+                await conn.commit()
+            except BaseException:
+                await conn.close()
+                raise
+            if locked:
+                self._lock_conn = conn
+                logger.info("Acquired the webhook lock; starting the bot")
+                return
+            await conn.close()
+            if not waiting:
+                logger.info("Another replica runs the bot; waiting for the webhook lock")
+                waiting = True
+            await asyncio.sleep(settings.TELEGRAM_WEBHOOK_LOCK_CHECK_SECONDS)
+
+    async def _handle_updates(self) -> None:
+        """Hand queued updates to the bot for as long as the lock is held."""
+        wake = asyncio.Event()
+        queued = listener.subscribe(
+            {TELEGRAM_UPDATES_CHANNEL: lambda payload: wake.set()},
+            # Also picks up updates queued while no replica ran the bot
+            on_connect=wake.set,
+        )
+        try:
+            while await self._holds_lock():
+                wake.clear()
+                while await self._take_updates():
+                    pass
+                await wait(wake, settings.TELEGRAM_WEBHOOK_LOCK_CHECK_SECONDS)
+        finally:
+            await listener.unsubscribe(queued)
+
+    async def _take_updates(self) -> bool:
+        """Move a batch of queued updates to the bot; True if more may be waiting."""
+        async with async_session() as db:
+            payloads = await TelegramUpdateRepository(db).take(UPDATE_BATCH_SIZE)
+            await db.commit()
+        for payload in payloads:
+            update = Update.de_json(payload, self.application.bot)
+            await self.application.update_queue.put(update)
+        return len(payloads) == UPDATE_BATCH_SIZE
+
+    async def _holds_lock(self) -> bool:
+        """Check that the lock connection is still alive."""
+        try:
+            await self._lock_conn.scalar(text("SELECT 1"))
+            await self._lock_conn.commit()
+            return True
+        except Exception:
+            return False
+
+    async def _release(self) -> None:
+        """Stop the bot if it runs, then close the lock connection, which releases the lock."""
+        if self.application is not None:
+            application, self.application = self.application, None
+            await stop_webhook(application)
+        if self._lock_conn is not None:
+            conn, self._lock_conn = self._lock_conn, None
+            with contextlib.suppress(Exception):
+                await conn.close()
+
+
+webhook_runner = WebhookRunner()
@@ -0,0 +1,442 @@
+"""Rate-limited Telegram notifications to admins about new findings.
+
+Messages go through a single queue drained by one sender task. The sender keeps
+under Telegram's flood limits with a global and a per-chat token bucket, and
+pauses all sends when Telegram answers with ``RetryAfter``. Each admin gets at
+most one message per ``NOTIFY_DIGEST_WINDOW_SECONDS``: the first finding after a
+quiet period is sent right away, and the ones that follow are combined into a
+single digest at the end of the window. ``notify`` returns a future per chat
+that resolves once Telegram accepts the message carrying the notice, so callers
+can wait for delivery.
+"""
+import asyncio
+import functools
+import logging
+import time
+import uuid
+from dataclasses import dataclass, field
+
+from telegram import Bot
+from telegram.constants import ParseMode
+from telegram.error import BadRequest, Forbidden, RetryAfter, TelegramError
+
+from app.bot.rendering import SEVERITY_EMOJI, md
+from app.bot.subscribers import subscriber_index
+from app.core.config import settings
+from app.core.metrics import Counter, Gauge
+from app.models.finding import Severity
+from app.schemas.finding import FindingDelta
+from app.schemas.notification import NotificationType
+from app.services.outbox import outbox_dispatcher
+
+logger = logging.getLogger(__name__)
+
+BOT_NOTIFICATIONS = Counter(
+    "bot_notifications_total",
+    "Telegram notifications by kind and result",
+    labelnames=("kind", "result"),
+)
+BOT_NOTIFICATION_QUEUE = Gauge(
+    "bot_notification_queue_depth",
+    "Admin notifications waiting to be sent",
+)
+
+SEVERITY_RANK = {
+    Severity.LOW: 0,
+    Severity.MEDIUM: 1,
+    Severity.HIGH: 2,
+    Severity.CRITICAL: 3,
+}
+
+MAX_SEND_ATTEMPTS = 5
+MAX_RETRY_DELAY = 60.0
+DESCRIPTION_PREVIEW_LENGTH = 200
+# Keeps a digest well under Telegram's 4096 character message limit
+DIGEST_MAX_LINES = 20
+
+
+class TokenBucket:
+    """Allow ``rate`` events per second, with bursts of up to ``capacity``."""
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """Initialize bucket, full."""
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+
+    def try_acquire(self) -> float:
+        """Take a token if one is available.
+
+        Returns 0.0 on success, otherwise the seconds until a token will be.
+        """
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+    async def acquire(self) -> None:
+        """Wait for and take a token."""
+        while delay := self.try_acquire():
+            await asyncio.sleep(delay)
+
+
+@dataclass(frozen=True, slots=True)
+class FindingNotice:
+    """What an admin is told about a new finding."""
+
+    finding_id: uuid.UUID
+    report_id: str
+    severity: Severity
+    area_name: str
+    description: str
+    location: str | None
+
+    @classmethod
+    def from_finding(cls, finding: FindingDelta, area_name: str | None) -> "FindingNotice":
+        """Build a notice from a newly created finding."""
+        return cls(
+            finding_id=finding.id,
+            report_id=finding.report_id,
+            severity=finding.severity,
+            area_name=area_name or "N/A",
+            description=finding.description,
+            location=finding.location,
+        )
+
+
+@dataclass(eq=False, slots=True)
+class _Outgoing:
+    """A message waiting to be sent; hashed by identity."""
+
+    chat_id: int
+    text: str
+    kind: str
+    attempt: int = 0
+    sent: bool = False
+    # Resolved with whether the message was delivered, or failed if it never will be
+    receipts: list[asyncio.Future] = field(default_factory=list)
+
+    def settle(self, error: Exception | None = None) -> None:
+        """Resolve the receipts of the notices in this message."""
+        for receipt in self.receipts:
+            if receipt.done():
+                continue
+            if error is None:
+                receipt.set_result(self.sent)
+            else:
+                receipt.set_exception(error)
+
+
+def render_notice(notice: FindingNotice) -> str:
+    """Render the message about a single finding."""
+    preview = notice.description[:DESCRIPTION_PREVIEW_LENGTH]
+    ellipsis = "..." if len(notice.description) > DESCRIPTION_PREVIEW_LENGTH else ""
+    message = (
+        f"🚨 *New {notice.severity.title()} Finding* {SEVERITY_EMOJI.get(notice.severity, '')}\n\n"
+        f"*Report ID:* {md(notice.report_id)}\n"
+        f"📍 *Area:* {md(notice.area_name)}\n"
+    )
+    if notice.location:
+        message += f"📍 *Location:* {md(notice.location)}\n"
+    message += f"\n📝 {md(preview)}{ellipsis}"
+    return message
+
+
+def render_digest(notices: list[FindingNotice]) -> str:
+    """Render one message summarizing several findings, most severe first."""
+    ordered = sorted(notices, key=lambda n: SEVERITY_RANK[n.severity], reverse=True)
+    lines = [f"🚨 *{len(notices)} New Findings*\n"]
+    for notice in ordered[:DIGEST_MAX_LINES]:
+        lines.append(
+            f"{SEVERITY_EMOJI.get(notice.severity, '⚪')} *{md(notice.report_id)}* "
+            f"{notice.severity.title()} | 📍 {md(notice.area_name)}"
+        )
+    if len(ordered) > DIGEST_MAX_LINES:
+        lines.append(f"\n...and {len(ordered) - DIGEST_MAX_LINES} more")
+    return "\n".join(lines)
+
+
+class NotificationDispatcher:
+    """Queue, coalesce and send admin notifications within Telegram's limits."""
+
+    def __init__(self, window: float, global_rate: float, per_chat_rate: float) -> None:
+        """Initialize dispatcher."""
+        self.window = window
+        self.per_chat_rate = per_chat_rate
+        self._global_bucket = TokenBucket(global_rate, global_rate)
+        self._chat_buckets: dict[int, TokenBucket] = {}
+        self._last_sent: dict[int, float] = {}
+        # chat -> notices buffered until its window ends, and their receipts
+        self._pending: dict[int, tuple[list[FindingNotice], list[asyncio.Future]]] = {}
+        self._flush_timers: dict[int, asyncio.TimerHandle] = {}
+        self._delayed: dict[_Outgoing, asyncio.TimerHandle] = {}
+        self._paused_until = 0.0
+        self._sending = False
+        self._queue: asyncio.Queue[_Outgoing] | None = None
+        self._bot: Bot | None = None
+        self._task: asyncio.Task | None = None
+        BOT_NOTIFICATION_QUEUE.set_function(lambda: self._queue.qsize() if self._queue else 0)
+
+    @property
+    def running(self) -> bool:
+        """Check whether the sender task is running."""
+        return self._task is not None
+
+    def start(self, bot: Bot) -> None:
+        """Start sending through a bot."""
+        self._bot = bot
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Send buffered digests and queued messages, then stop."""
+        if self._task is None:
+            return
+        for chat_id in list(self._flush_timers):
+            self._flush_timers[chat_id].cancel()
+            self._flush(chat_id)
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while (self._sending or not self._queue.empty() or self._delayed) and loop.time() < deadline:
+            await asyncio.sleep(0.1)
+
+        unsent = self._queue.qsize() + len(self._delayed) + self._sending
+        if unsent:
+            logger.warning(f"Stopping with {unsent} admin notifications unsent")
+            BOT_NOTIFICATIONS.inc(unsent, kind="any", result="dropped")
+        stopped = RuntimeError("Notification dispatcher stopped before sending")
+        while not self._queue.empty():
+            self._queue.get_nowait().settle(stopped)
+        for message in self._delayed:
+            message.settle(stopped)
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        for handle in self._delayed.values():
+            handle.cancel()
+        self._delayed.clear()
+        self._task = None
+        self._bot = None
+
+    def notify(self, chat_ids: list[int], notice: FindingNotice) -> list[asyncio.Future]:
+        """Queue a notice for some chats, coalescing bursts per chat.
+
+        Returns one future per chat, resolved once the notice is delivered or
+        can never be (e.g. the admin blocked the bot), and failed if sending
+        gave up or the dispatcher stopped first.
+        """
+        if self._task is None:
+            raise RuntimeError("Notification dispatcher is not running")
+        return [self._route(chat_id, notice) for chat_id in chat_ids]
+
+    def _route(self, chat_id: int, notice: FindingNotice) -> asyncio.Future:
+        """Send a notice now, or buffer it until the chat's window ends."""
+        loop = asyncio.get_running_loop()
+        receipt = loop.create_future()
+        pending = self._pending.get(chat_id)
+        if pending is not None:
+            pending[0].append(notice)
+            pending[1].append(receipt)
+            return receipt
+
+        now = time.monotonic()
+        last = self._last_sent.get(chat_id)
+        if last is None or now - last >= self.window:
+            self._last_sent[chat_id] = now
+            self._enqueue(_Outgoing(chat_id, render_notice(notice), "single", receipts=[receipt]))
+            return receipt
+
+        self._pending[chat_id] = ([notice], [receipt])
+        self._flush_timers[chat_id] = loop.call_later(last + self.window - now, self._flush, chat_id)
+        return receipt
+
+    def _flush(self, chat_id: int) -> None:
+        """Send the notices buffered for a chat as one message."""
+        self._flush_timers.pop(chat_id, None)
+        pending = self._pending.pop(chat_id, None)
+        if not pending:
+            return
+        notices, receipts = pending
+        self._last_sent[chat_id] = time.monotonic()
+        if len(notices) == 1:
+            self._enqueue(_Outgoing(chat_id, render_notice(notices[0]), "single", receipts=receipts))
+        else:
+            self._enqueue(_Outgoing(chat_id, render_digest(notices), "digest", receipts=receipts))
+
+    def _enqueue(self, message: _Outgoing) -> None:
+        """Put a message on the send queue."""
+        self._delayed.pop(message, None)
+        self._queue.put_nowait(message)
+
+    def _retry_later(self, message: _Outgoing, delay: float) -> None:
+        """Put a message back on the queue after a delay."""
+        self._delayed[message] = asyncio.get_running_loop().call_later(
+            delay, self._enqueue, message
+        )
+
+    async def _run(self) -> None:
+        """Send queued messages one at a time."""
+        while True:
+            message = await self._queue.get()
+            self._sending = True
+            try:
+                await self._send(message)
+            except Exception as e:
+                logger.exception(f"Failed to send admin notification to chat {message.chat_id}")
+                BOT_NOTIFICATIONS.inc(kind=message.kind, result="failed")
+                message.settle(e)
+            finally:
+                self._sending = False
+
+    async def send(self, chat_id: int, text: str, kind: str) -> bool:
+        """Send a message now, waiting out rate limits; True if it was delivered.
+
+        For callers that fan out themselves, such as scheduled digests.
+        """
+        if self._bot is None:
+            return False
+        message = _Outgoing(chat_id, text, kind)
+        while True:
+            await self._wait_for_pause()
+            await self._chat_bucket(chat_id).acquire()
+            await self._global_bucket.acquire()
+            delay = await self._attempt(message)
+            if delay is None:
+                return message.sent
+            await asyncio.sleep(delay)
+
+    async def _send(self, message: _Outgoing) -> None:
+        """Send one queued message, honouring rate limits."""
+        await self._wait_for_pause()
+        delay = self._chat_bucket(message.chat_id).try_acquire()
+        if delay:
+            # Requeued rather than awaited so other chats are not held up
+            self._retry_later(message, delay)
+            return
+        await self._global_bucket.acquire()
+        delay = await self._attempt(message)
+        if delay is not None:
+            self._retry_later(message, delay)
+
+    async def _wait_for_pause(self) -> None:
+        """Wait until Telegram's last flood-control pause is over."""
+        pause = self._paused_until - time.monotonic()
+        if pause > 0:
+            await asyncio.sleep(pause)
+
+    def _chat_bucket(self, chat_id: int) -> TokenBucket:
+        """Get the rate limit of one chat."""
+        bucket = self._chat_buckets.get(chat_id)
+        if bucket is None:
+            bucket = self._chat_buckets[chat_id] = TokenBucket(self.per_chat_rate, 1)
+        return bucket
+
+    async def _attempt(self, message: _Outgoing) -> float | None:
+        """Try to send a message once.
+
+        Returns the seconds to wait before retrying, or None when done either way.
+        """
+        try:
+            await self._bot.send_message(
+                chat_id=message.chat_id,
+                text=message.text,
+                parse_mode=ParseMode.MARKDOWN,
+                disable_web_page_preview=True,
+            )
+        except RetryAfter as e:
+            # Flood control applies to the whole bot, so every send waits
+            logger.warning(f"Telegram flood control, pausing notifications for {e.retry_after}s")
+            self._paused_until = time.monotonic() + float(e.retry_after)
+            BOT_NOTIFICATIONS.inc(kind=message.kind, result="throttled")
+            return float(e.retry_after)
+        except (Forbidden, BadRequest) as e:
+            # Blocked bot, deleted chat or bad markup; retrying will not help
+            logger.warning(f"Dropping notification to chat {message.chat_id}: {e}")
+            BOT_NOTIFICATIONS.inc(kind=message.kind, result="dropped")
+            message.settle()
+        except TelegramError as e:
+            message.attempt += 1
+            if message.attempt < MAX_SEND_ATTEMPTS:
+                return min(2.0 ** message.attempt, MAX_RETRY_DELAY)
+            logger.error(f"Giving up on notification to chat {message.chat_id}: {e}")
+            BOT_NOTIFICATIONS.inc(kind=message.kind, result="failed")
+            message.settle(e)
+        else:
+            message.sent = True
+            BOT_NOTIFICATIONS.inc(kind=message.kind, result="sent")
+            message.settle()
+        return None
+
+
+notification_dispatcher = NotificationDispatcher(
+    window=settings.NOTIFY_DIGEST_WINDOW_SECONDS,
+    global_rate=settings.TELEGRAM_GLOBAL_RATE,
+    per_chat_rate=settings.TELEGRAM_PER_CHAT_RATE,
+)
+
+
+async def notify_new_finding(finding: FindingDelta, delivered: set[str] | None = None) -> None:
+    """Notify the admins covering a new finding's area, if it is severe enough.
+
+    Returns once Telegram accepted every alert, which may take up to
+    ``NOTIFY_DIGEST_WINDOW_SECONDS`` while alerts are being combined. Chats in
+    ``delivered`` are skipped, and the ones alerted now are added to it, so a
+    retry after some chats failed only alerts those.
+    """
+    if not settings.TELEGRAM_BOT_TOKEN:
+        # Alerts are disabled in this deployment, so there is nothing to deliver
+        return
+    threshold = SEVERITY_RANK[Severity(settings.NOTIFY_MIN_SEVERITY)]
+    if SEVERITY_RANK[finding.severity] < threshold:
+        return
+    if not notification_dispatcher.running:
+        # Raised so the outbox retries the event in a process that can send it
+        raise RuntimeError("Notification dispatcher is not running")
+
+    if delivered is None:
+        delivered = set()
+    await subscriber_index.refresh()
+    chat_ids = [
+        subscriber.telegram_id
+        for subscriber in subscriber_index.recipients(NotificationType.NEW_FINDING, finding.area_id)
+        if subscriber.user_id != finding.reporter_id and str(subscriber.telegram_id) not in delivered
+    ]
+    if not chat_ids:
+        return
+
+    notice = FindingNotice.from_finding(finding, subscriber_index.area_name(finding.area_id))
+    # The outbox event is only completed once the alerts are out, so a crash
+    # before then sends them again rather than losing them
+    receipts = notification_dispatcher.notify(chat_ids, notice)
+    for chat_id, receipt in zip(chat_ids, receipts):
+        # Recorded as each resolves, so a handler timeout keeps the progress so far
+        receipt.add_done_callback(functools.partial(_record_delivery, delivered, chat_id))
+    results = await asyncio.gather(*receipts, return_exceptions=True)
+    failed = [result for result in results if isinstance(result, Exception)]
+    if failed:
+        raise RuntimeError(
+            f"Alert for {finding.report_id} not delivered to {len(failed)} of {len(chat_ids)} chats: "
+            f"{failed[0]!r}"
+        )
+
+
+def _record_delivery(delivered: set[str], chat_id: int, receipt: asyncio.Future) -> None:
+    """Add a chat to the delivered ones once its alert is out, or can never be."""
+    if not receipt.cancelled() and receipt.exception() is None:
+        delivered.add(str(chat_id))
+
+
+async def _on_finding_created(payload: dict, delivered: set[str]) -> None:
+    """Outbox handler alerting admins about a new finding, skipping chats already alerted."""
+    await notify_new_finding(FindingDelta.model_validate(payload), delivered)
+
+
+outbox_dispatcher.register("finding.created", "admin_alert", _on_finding_created)
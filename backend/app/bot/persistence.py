@@ -0,0 +1,174 @@
+"""Postgres-backed persistence for bot conversations and user data."""
+import asyncio
+import json
+import logging
+import pickle
+import time
+from typing import Any
+
+from sqlalchemy import delete, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from telegram.ext import BasePersistence, PersistenceInput
+
+from app.core.metrics import Counter, Histogram
+from app.db.session import engine
+from app.models.bot_persistence import BotPersistence
+
+logger = logging.getLogger(__name__)
+
+BOT_PERSISTENCE_FLUSH_SECONDS = Histogram(
+    "bot_persistence_flush_seconds",
+    "Time to write one batch of bot state to Postgres",
+)
+BOT_PERSISTENCE_ROWS = Counter(
+    "bot_persistence_rows_total",
+    "Bot state rows written or deleted",
+    labelnames=("operation",),
+)
+
+USER_DATA = "user_data"
+CHAT_DATA = "chat_data"
+BOT_DATA = "bot_data"
+CONVERSATION = "conversation:"
+
+
+class PostgresPersistence(BasePersistence):
+    """Store user data and conversation states in the ``bot_persistence`` table.
+
+    PTB collects changed entries and hands them over every ``update_interval``
+    seconds. All entries from one such run are written in a single transaction,
+    so a user typing quickly costs at most one upsert per interval. Empty user
+    data and ended conversations are deleted rather than stored.
+    """
+
+    def __init__(self, update_interval: float) -> None:
+        """Initialize persistence."""
+        super().__init__(
+            store_data=PersistenceInput(bot_data=False, chat_data=False, user_data=True, callback_data=False),
+            update_interval=update_interval,
+        )
+        # (kind, key) -> pickled data, or None to delete the row
+        self._pending: dict[tuple[str, str], bytes | None] = {}
+        self._flush_task: asyncio.Task | None = None
+
+    async def _load(self, kind: str) -> list[tuple[str, Any]]:
+        async with engine.connect() as conn:
+            result = await conn.execute(
+                select(BotPersistence.key, BotPersistence.data).where(BotPersistence.kind == kind)
+            )
+            return [(key, pickle.loads(data)) for key, data in result.all()]
+
+    async def _stage(self, kind: str, key: str, value: Any) -> None:
+        """Queue a write, or a delete if value is None, and wait for its batch."""
+        self._pending[(kind, key)] = (
+            None if value is None else pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        )
+        if self._flush_task is None or self._flush_task.done():
+            # Created while PTB is still starting the other update coroutines of this
+            # run, so the task runs after all of them have staged their entries
+            self._flush_task = asyncio.create_task(self._write_pending())
+        await asyncio.shield(self._flush_task)
+
+    async def _write_pending(self) -> None:
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+
+        upserts = [
+            {"kind": kind, "key": key, "data": data}
+            for (kind, key), data in pending.items()
+            if data is not None
+        ]
+        deletes = [kind_key for kind_key, data in pending.items() if data is None]
+
+        started_at = time.perf_counter()
+        try:
+            async with engine.begin() as conn:
+                if upserts:
+                    stmt = insert(BotPersistence)
+                    await conn.execute(
+                        stmt.on_conflict_do_update(
+                            index_elements=[BotPersistence.kind, BotPersistence.key],
+                            set_={"data": stmt.excluded.data, "updated_at": stmt.excluded.updated_at},
+                        ),
+                        upserts,
+                    )
+                if deletes:
+                    await conn.execute(
+                        delete(BotPersistence).where(
+                            tuple_(BotPersistence.kind, BotPersistence.key).in_(deletes)
+                        )
+                    )
+        except Exception:
+            # Keep the entries for the next run unless newer values were staged meanwhile
+            for kind_key, data in pending.items():
+                self._pending.setdefault(kind_key, data)
+            raise
+        finally:
+            BOT_PERSISTENCE_FLUSH_SECONDS.observe(time.perf_counter() - started_at)
+
+        BOT_PERSISTENCE_ROWS.inc(len(upserts), operation="upsert")
+        BOT_PERSISTENCE_ROWS.inc(len(deletes), operation="delete")
+
+    async def get_user_data(self) -> dict[int, dict[Any, Any]]:
+        """Load all stored user data."""
+        return {int(key): data for key, data in await self._load(USER_DATA)}
+
+    async def get_chat_data(self) -> dict[int, dict[Any, Any]]:
+        """Chat data is not stored."""
+        return {}
+
+    async def get_bot_data(self) -> dict[Any, Any]:
+        """Bot data is not stored."""
+        return {}
+
+    async def get_callback_data(self) -> None:
+        """Callback data is not stored."""
+        return None
+
+    async def get_conversations(self, name: str) -> dict[tuple[int | str, ...], object]:
+        """Load the states of a named conversation handler."""
+        return {
+            tuple(json.loads(key)): state for key, state in await self._load(CONVERSATION + name)
+        }
+
+    async def update_conversation(self, name: str, key: tuple[int | str, ...], new_state: object | None) -> None:
+        """Store a conversation state; ``None`` means the conversation ended."""
+        await self._stage(CONVERSATION + name, json.dumps(key, separators=(",", ":")), new_state)
+
+    async def update_user_data(self, user_id: int, data: dict[Any, Any]) -> None:
+        """Store one user's data, deleting the row once it is empty."""
+        await self._stage(USER_DATA, str(user_id), data or None)
+
+    async def update_chat_data(self, chat_id: int, data: dict[Any, Any]) -> None:
+        """Chat data is not stored."""
+
+    async def update_bot_data(self, data: dict[Any, Any]) -> None:
+        """Bot data is not stored."""
+
+    async def update_callback_data(self, data: Any) -> None:
+        """Callback data is not stored."""
+
+    async def drop_chat_data(self, chat_id: int) -> None:
+        """Chat data is not stored."""
+
+    async def drop_user_data(self, user_id: int) -> None:
+        """Delete one user's data."""
+        await self._stage(USER_DATA, str(user_id), None)
+
+    async def refresh_user_data(self, user_id: int, user_data: dict[Any, Any]) -> None:
+        """Only the process running the bot writes the data, so there is nothing to refresh."""
+
+    async def refresh_chat_data(self, chat_id: int, chat_data: dict[Any, Any]) -> None:
+        """Chat data is not stored."""
+
+    async def refresh_bot_data(self, bot_data: dict[Any, Any]) -> None:
+        """Bot data is not stored."""
+
+    async def flush(self) -> None:
+        """Write anything still pending on shutdown."""
+        if self._flush_task is not None and not self._flush_task.done():
+            await asyncio.shield(self._flush_task)
+        if self._pending:
+            await self._write_pending()
+        logger.info("Bot persistence flushed")
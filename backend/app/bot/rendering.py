@@ -0,0 +1,189 @@
+"""Rendering of finding cards and lists for bot messages, with caching."""
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Hashable
+
+from telegram import InlineKeyboardButton, InlineKeyboardMarkup
+from telegram.helpers import escape_markdown
+
+from app.core.config import settings
+from app.core.metrics import Counter
+from app.models.finding import Finding, Severity, Status
+
+BOT_RENDER_CACHE = Counter(
+    "bot_render_cache_total",
+    "Bot render cache lookups by cache and result",
+    labelnames=("cache", "result"),
+)
+
+SEVERITY_EMOJI = {
+    Severity.LOW: "🟢",
+    Severity.MEDIUM: "🟡",
+    Severity.HIGH: "🟠",
+    Severity.CRITICAL: "🔴",
+}
+
+STATUS_EMOJI = {
+    Status.OPEN: "📋",
+    Status.IN_PROGRESS: "🔄",
+    Status.RESOLVED: "✅",
+    Status.CLOSED: "🔒",
+}
+
+DESCRIPTION_PREVIEW_LENGTH = 40
+SEPARATOR = "━━━━━━━━━━━━━━━━"
+
+CARD_KEYBOARD = InlineKeyboardMarkup(
+    [[InlineKeyboardButton("« Back to My Reports", callback_data="myreports_back")]]
+)
+
+
+def md(text: Any) -> str:
+    """Escape text for Telegram's legacy Markdown parse mode."""
+    return escape_markdown(str(text), version=1)
+
+
+def status_label(status: str) -> str:
+    """Format a status value for display, e.g. "In Progress"."""
+    return status.title().replace("_", " ")
+
+
+class RenderCache:
+    """Bounded LRU of rendered output, with an optional time-to-live."""
+
+    def __init__(self, name: str, max_size: int, ttl: float | None = None) -> None:
+        """Initialize cache."""
+        self.name = name
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Any | None:
+        """Get a cached value, or None on a miss."""
+        entry = self._entries.get(key)
+        if entry is None or (self.ttl is not None and entry[0] <= time.monotonic()):
+            BOT_RENDER_CACHE.inc(cache=self.name, result="miss")
+            return None
+        self._entries.move_to_end(key)
+        BOT_RENDER_CACHE.inc(cache=self.name, result="hit")
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else 0.0
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def discard(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Drop every entry whose key matches."""
+        for key in [key for key in self._entries if predicate(key)]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+
+
+# Keyed by (finding id, updated_at): any change to a finding changes the key
+card_cache = RenderCache("card", settings.BOT_RENDER_CACHE_SIZE)
+line_cache = RenderCache("line", settings.BOT_RENDER_CACHE_SIZE)
+# Keyed by (reporter id, page cursor); expires, and is cleared when any of the
+# reporter's findings changes
+page_cache = RenderCache("page", settings.BOT_RENDER_CACHE_SIZE, ttl=settings.BOT_RENDER_PAGE_TTL_SECONDS)
+
+
+def cached_finding_card(finding_id: uuid.UUID, updated_at: datetime) -> str | None:
+    """Get a previously rendered card if the finding has not changed since."""
+    return card_cache.get((finding_id, updated_at))
+
+
+def render_finding_card(finding: Finding) -> str:
+    """Render the detail card of a finding loaded with its relations."""
+    key = (finding.id, finding.updated_at)
+    cached = card_cache.get(key)
+    if cached is not None:
+        return cached
+
+    sev_icon = SEVERITY_EMOJI.get(finding.severity, "")
+    stat_icon = STATUS_EMOJI.get(finding.status, "")
+
+    message = f"""
+📋 *Finding Details*
+
+*Report ID:* {md(finding.report_id)}
+*Severity:* {sev_icon} {finding.severity.title()}
+*Status:* {stat_icon} {status_label(finding.status)}
+
+📍 *Area:* {md(finding.area.name) if finding.area else 'N/A'}
+📍 *Location:* {md(finding.location) if finding.location else 'Not specified'}
+
+📝 *Description:*
+{md(finding.description)}
+
+🕐 *Reported:* {finding.reported_at.strftime('%Y-%m-%d %H:%M')} UTC
+"""
+
+    if finding.closed_at:
+        message += f"🔒 *Closed:* {finding.closed_at.strftime('%Y-%m-%d %H:%M')} UTC\n"
+
+    if finding.assignee:
+        message += f"👤 *Assigned To:* {md(finding.assignee.full_name)}\n"
+
+    if finding.photos:
+        message += f"\n📷 *Photos:* {len(finding.photos)} attached\n"
+
+    if finding.status_history:
+        message += f"\n{SEPARATOR}\n📜 *Status History:*\n"
+        for history in sorted(finding.status_history, key=lambda h: h.updated_at):
+            message += f"  {status_label(history.old_status or 'Created')} → {status_label(history.new_status)}"
+            if history.notes:
+                message += f"\n    📝 {md(history.notes)}"
+            if history.updated_by_user:
+                message += f"\n    👤 {md(history.updated_by_user.full_name)}"
+            message += f"\n    🕐 {history.updated_at.strftime('%Y-%m-%d %H:%M')}\n"
+
+    card_cache.set(key, message)
+    return message
+
+
+def render_finding_line(row: Any) -> str:
+    """Render one entry of a findings list from a summary row."""
+    key = (row.id, row.updated_at)
+    cached = line_cache.get(key)
+    if cached is not None:
+        return cached
+
+    sev_emoji = SEVERITY_EMOJI.get(row.severity, "⚪")
+    stat_emoji = STATUS_EMOJI.get(row.status, "📋")
+    # Truncate before escaping so an escape sequence is never cut in half
+    preview = row.description[:DESCRIPTION_PREVIEW_LENGTH]
+    ellipsis = "..." if len(row.description) > DESCRIPTION_PREVIEW_LENGTH else ""
+
+    line = (
+        f"{stat_emoji} *{md(row.report_id)}*\n"
+        f"{sev_emoji} {row.severity.title()} | 📍 {md(row.area_name)}\n"
+        f"📝 {md(preview)}{ellipsis}\n"
+        f"{SEPARATOR}\n"
+    )
+    line_cache.set(key, line)
+    return line
+
+
+def finding_button(row: Any) -> InlineKeyboardButton:
+    """Build the button that opens a finding's detail card."""
+    sev_emoji = SEVERITY_EMOJI.get(row.severity, "⚪")
+    stat_emoji = STATUS_EMOJI.get(row.status, "📋")
+    # Button labels are plain text, so nothing is escaped here
+    return InlineKeyboardButton(
+        f"{row.report_id} - {sev_emoji} {row.severity.title()} - {stat_emoji} {row.status.title()}",
+        callback_data=f"myreports_detail_{row.id}",
+    )
+
+
+def invalidate_reporter_pages(reporter_id: uuid.UUID) -> None:
+    """Forget cached My Reports pages of a reporter."""
+    page_cache.discard(lambda key: key[0] == reporter_id)
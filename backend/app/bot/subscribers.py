@@ -0,0 +1,154 @@
+"""In-memory index of which admins receive which notifications.
+
+Built from one pass over the admins, their areas and their preferences, so
+alerts and digests resolve recipients without a query. Every process that sends
+notifications listens for changes and marks the index stale when a user, their preferences or the area tree change, and the
+next lookup reloads it; ``BOT_SUBSCRIBER_INDEX_TTL_SECONDS`` bounds how long a
+missed notification can leave it out of date.
+"""
+import asyncio
+import time
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass
+
+from app.core.config import settings
+from app.core.metrics import Counter
+from app.db.session import async_session
+from app.models.user import Role
+from app.repositories.area import AreaRepository
+from app.repositories.user import UserRepository
+from app.schemas.notification import NotificationType
+
+BOT_SUBSCRIBER_INDEX_RELOADS = Counter(
+    "bot_subscriber_index_reloads_total",
+    "Reloads of the notification subscriber index",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Subscriber:
+    """An admin who can be sent notifications."""
+
+    user_id: uuid.UUID
+    telegram_id: int
+    # Local HH:MM at which the admin's digests are sent
+    summary_time: str
+
+
+class SubscriberIndex:
+    """Subscribers per notification type and area."""
+
+    def __init__(self, ttl: float) -> None:
+        """Initialize index, empty and stale."""
+        self.ttl = ttl
+        self._stale = True
+        self._loaded_at = 0.0
+        self._lock = asyncio.Lock()
+        # area id -> (name, parent id)
+        self._areas: dict[uuid.UUID, tuple[str, uuid.UUID | None]] = {}
+        # Areas at least one admin is assigned to, whatever their preferences
+        self._covered: set[uuid.UUID] = set()
+        self._by_area: dict[NotificationType, dict[uuid.UUID, list[Subscriber]]] = {}
+        self._super_admins: dict[NotificationType, list[Subscriber]] = {}
+        self._scopes: dict[NotificationType, list[tuple[Subscriber, tuple[uuid.UUID, ...]]]] = {}
+
+    def mark_stale(self) -> None:
+        """Reload on the next refresh."""
+        self._stale = True
+
+    async def refresh(self) -> None:
+        """Reload the index if it is stale or expired."""
+        if not self._needs_reload():
+            return
+        async with self._lock:
+            if not self._needs_reload():
+                return
+            # Cleared first, so a change that lands during the load triggers another
+            self._stale = False
+            try:
+                async with async_session() as db:
+                    areas = await AreaRepository(db).list_nodes()
+                    subscriptions = await UserRepository(db).list_subscriptions()
+            except BaseException:
+                self._stale = True
+                raise
+            self._build(areas, subscriptions)
+            self._loaded_at = time.monotonic()
+            BOT_SUBSCRIBER_INDEX_RELOADS.inc()
+
+    def _needs_reload(self) -> bool:
+        """Check whether the index is stale or older than its TTL."""
+        return self._stale or time.monotonic() - self._loaded_at > self.ttl
+
+    def _build(self, areas: list, subscriptions: list) -> None:
+        """Replace the index with one built from area and subscription rows."""
+        sites = tuple(area.id for area in areas if area.parent_id is None)
+        covered: set[uuid.UUID] = set()
+        by_area = {kind: defaultdict(list) for kind in NotificationType}
+        super_admins = {kind: [] for kind in NotificationType}
+        scopes = {kind: [] for kind in NotificationType}
+
+        for row in subscriptions:
+            subscriber = Subscriber(
+                row.id, row.telegram_id, row.daily_summary_time or settings.DAILY_SUMMARY_TIME
+            )
+            area_ids = tuple(row.area_ids or ())
+            is_super_admin = row.role == Role.SUPER_ADMIN
+            covered.update(area_ids)
+            # Super-admins without areas oversee every site
+            scope = area_ids or (sites if is_super_admin else ())
+
+            for kind in NotificationType:
+                if not getattr(row, kind.value):
+                    continue
+                for area_id in area_ids:
+                    by_area[kind][area_id].append(subscriber)
+                if is_super_admin:
+                    super_admins[kind].append(subscriber)
+                if scope:
+                    scopes[kind].append((subscriber, scope))
+
+        self._areas = {area.id: (area.name, area.parent_id) for area in areas}
+        self._covered = covered
+        self._by_area = by_area
+        self._super_admins = super_admins
+        self._scopes = scopes
+
+    def area_name(self, area_id: uuid.UUID) -> str | None:
+        """Get an area's name."""
+        area = self._areas.get(area_id)
+        return area[0] if area else None
+
+    def _lineage(self, area_id: uuid.UUID) -> list[uuid.UUID]:
+        """Get an area followed by its ancestors."""
+        lineage = [area_id]
+        parent_id = self._areas.get(area_id, (None, None))[1]
+        while parent_id is not None and parent_id not in lineage:
+            lineage.append(parent_id)
+            parent_id = self._areas.get(parent_id, (None, None))[1]
+        return lineage
+
+    def recipients(self, kind: NotificationType, area_id: uuid.UUID) -> list[Subscriber]:
+        """Get the subscribers to notify about an area.
+
+        These are the admins assigned to the area or one of its parents, or the
+        super-admins when nobody is assigned there.
+        """
+        lineage = self._lineage(area_id)
+        if self._covered.isdisjoint(lineage):
+            return list(self._super_admins.get(kind, ()))
+
+        found: dict[uuid.UUID, Subscriber] = {}
+        by_area = self._by_area.get(kind, {})
+        for lineage_id in lineage:
+            for subscriber in by_area.get(lineage_id, ()):
+                found.setdefault(subscriber.user_id, subscriber)
+        return list(found.values())
+
+    def scopes(self, kind: NotificationType) -> list[tuple[Subscriber, tuple[uuid.UUID, ...]]]:
+        """Get each subscriber to a digest with the areas it covers."""
+        return self._scopes.get(kind, [])
+
+
+subscriber_index = SubscriberIndex(ttl=settings.BOT_SUBSCRIBER_INDEX_TTL_SECONDS)
@@ -0,0 +1,164 @@
+"""Cache of registered users by Telegram ID for bot handlers."""
+import json
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+
+from app.bot.rendering import invalidate_reporter_pages, page_cache
+from app.bot.subscribers import subscriber_index
+from app.core.config import settings
+from app.core.metrics import Counter
+from app.db.listen import ListenSubscription, listener
+from app.db.session import async_session
+from app.models.user import Role, User
+from app.repositories.area import AREAS_CHANGED_CHANNEL
+from app.repositories.finding import FINDING_EVENTS_CHANNEL
+from app.repositories.user import USER_CHANGED_CHANNEL, UserRepository
+
+BOT_USER_CACHE = Counter(
+    "bot_user_cache_total",
+    "Bot user lookups by cache result",
+    labelnames=("result",),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class UserSnapshot:
+    """The user fields bot handlers need, detached from any session."""
+
+    id: uuid.UUID
+    telegram_id: int
+    full_name: str
+    staff_id: str
+    department: str
+    section: str
+    role: Role
+    is_active: bool
+    created_at: datetime | None
+
+    @classmethod
+    def from_user(cls, user: User) -> "UserSnapshot":
+        """Copy the fields of a loaded user."""
+        return cls(
+            id=user.id,
+            telegram_id=user.telegram_id,
+            full_name=user.full_name,
+            staff_id=user.staff_id,
+            department=user.department,
+            section=user.section,
+            role=user.role,
+            is_active=user.is_active,
+            created_at=user.created_at,
+        )
+
+    @property
+    def is_admin(self) -> bool:
+        """Check if user is admin or super_admin."""
+        return self.role in (Role.ADMIN, Role.SUPER_ADMIN)
+
+
+class UserCache:
+    """TTL cache of user snapshots, including "not registered" results."""
+
+    def __init__(self, ttl: float, negative_ttl: float, max_size: int) -> None:
+        """Initialize cache."""
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_size = max_size
+        # telegram_id -> (expires_at, snapshot or None for unregistered)
+        self._entries: dict[int, tuple[float, UserSnapshot | None]] = {}
+        # Bumped by every invalidation, so a lookup that raced one is not stored
+        self._generation = 0
+
+    async def get(self, telegram_id: int) -> UserSnapshot | None:
+        """Get a user by Telegram ID, querying the database on a miss."""
+        entry = self._entries.get(telegram_id)
+        now = time.monotonic()
+        if entry is not None and entry[0] > now:
+            BOT_USER_CACHE.inc(result="hit")
+            return entry[1]
+
+        BOT_USER_CACHE.inc(result="miss")
+        generation = self._generation
+        async with async_session() as db:
+            user = await UserRepository(db).get_by_telegram_id(telegram_id)
+            snapshot = UserSnapshot.from_user(user) if user else None
+
+        # The row may have changed after it was read; the next lookup reads it again
+        if generation != self._generation:
+            return snapshot
+        if len(self._entries) >= self.max_size:
+            self._evict(now)
+        self._entries[telegram_id] = (
+            now + (self.ttl if snapshot else self.negative_ttl),
+            snapshot,
+        )
+        return snapshot
+
+    def _evict(self, now: float) -> None:
+        """Drop expired entries, or the oldest half if none have expired."""
+        expired = [key for key, (expires_at, _) in self._entries.items() if expires_at <= now]
+        if not expired:
+            # Dicts keep insertion order, so the first keys are the oldest
+            expired = list(self._entries)[: len(self._entries) // 2]
+        for key in expired:
+            del self._entries[key]
+
+    def invalidate(self, telegram_id: int) -> None:
+        """Forget one user."""
+        self._generation += 1
+        self._entries.pop(telegram_id, None)
+
+    def clear(self) -> None:
+        """Forget all users."""
+        self._generation += 1
+        self._entries.clear()
+
+
+user_cache = UserCache(
+    ttl=settings.BOT_USER_CACHE_TTL_SECONDS,
+    negative_ttl=min(settings.BOT_USER_CACHE_TTL_SECONDS, 30),
+    max_size=settings.BOT_USER_CACHE_MAX_SIZE,
+)
+
+
+def _on_user_changed(payload: str) -> None:
+    if payload.isdigit():
+        user_cache.invalidate(int(payload))
+    else:
+        user_cache.clear()
+    # Roles, areas and preferences decide who gets notifications
+    subscriber_index.mark_stale()
+
+
+def _on_finding_event(payload: str) -> None:
+    # Status changes and assignments made in the dashboard change the reporter's pages
+    try:
+        reporter_id = uuid.UUID(json.loads(payload)["finding"]["reporter_id"])
+    except (ValueError, KeyError, TypeError):
+        page_cache.clear()
+        return
+    invalidate_reporter_pages(reporter_id)
+
+
+def _on_reconnect() -> None:
+    # Changes made while disconnected were missed
+    user_cache.clear()
+    page_cache.clear()
+    subscriber_index.mark_stale()
+
+
+def listen_for_changes() -> ListenSubscription:
+    """Invalidate cached users, subscribers and report pages when any process changes them.
+
+    Lasts until the returned subscription is unsubscribed from ``listener``.
+    """
+    return listener.subscribe(
+        {
+            USER_CHANGED_CHANNEL: _on_user_changed,
+            AREAS_CHANGED_CHANNEL: lambda payload: subscriber_index.mark_stale(),
+            FINDING_EVENTS_CHANNEL: _on_finding_event,
+        },
+        on_connect=_on_reconnect,
+    )
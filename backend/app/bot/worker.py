@@ -1,11 +1,10 @@
-"""Telegram bot worker - runs the bot in polling mode."""
+"""Telegram bot worker - runs the bot in polling mode when no webhook is configured."""
 import asyncio
 import logging
 
-from app.bot import get_bot
+from app.bot.lifecycle import ALLOWED_UPDATES, start_bot, stop_bot, webhook_enabled
 from app.core.config import settings
-from telegram import BotCommand
-from telegram.ext import Application
+from app.core.instrumentation import serve_metrics
 
 logging.basicConfig(
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
@@ -15,46 +14,26 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-async def setup_bot_commands(application) -> None:
-    """Set up bot commands for the Telegram command menu."""
-    commands = [
-        BotCommand("start", "Start the bot or view your profile"),
-        BotCommand("menu", "Show bot menu"),
-        BotCommand("register", "Register your account"),
-        BotCommand("report", "Report a new safety finding"),
-        BotCommand("myreports", "View your reported findings"),
-        BotCommand("help", "Show help information"),
-        BotCommand("cancel", "Cancel current operation"),
-    ]
-    await application.bot.set_my_commands(commands)
-    logger.info("Bot commands registered")
-
-
-async def error_handler(update, context) -> None:
-    """Log errors caused by updates."""
-    logger.error(f"Update {update} caused error {context.error}")
-
-
 async def main() -> None:
     """Start the bot."""
-    logger.info("Starting Telegram bot...")
-
-    application = get_bot()
+    if webhook_enabled():
+        # Polling would delete the webhook the API relies on
+        logger.error("TELEGRAM_WEBHOOK_URL is set; the bot runs inside the API. Not starting polling.")
+        return
 
-    # Add error handler
-    application.add_error_handler(error_handler)
-
-    # Start the bot using polling
-    # In production, you should use webhook instead
-    await application.initialize()
-    await application.start()
+    logger.info("Starting Telegram bot...")
 
-    # Set up bot commands menu
-    await setup_bot_commands(application)
+    metrics_server = None
+    if settings.BOT_METRICS_PORT:
+        metrics_server = await serve_metrics("0.0.0.0", settings.BOT_METRICS_PORT)
+        logger.info(f"Serving metrics on port {settings.BOT_METRICS_PORT}")
 
+    # Polling mode; set TELEGRAM_WEBHOOK_URL to serve updates from the API instead
+    application = await start_bot()
     await application.updater.start_polling(
-        drop_pending_updates=True,
-        allowed_updates=["message", "callback_query", "chosen_inline_result"],
+        # Updates sent while the worker was down resume their persisted conversations
+        drop_pending_updates=False,
+        allowed_updates=ALLOWED_UPDATES,
     )
 
     logger.info("Bot is running... Press Ctrl+C to stop.")
@@ -65,9 +44,9 @@ async def main() -> None:
     except KeyboardInterrupt:
         logger.info("Stopping bot...")
     finally:
-        await application.updater.stop()
-        await application.stop()
-        await application.shutdown()
+        await stop_bot(application)
+        if metrics_server is not None:
+            metrics_server.close()
         logger.info("Bot stopped.")
 
 
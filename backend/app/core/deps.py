@@ -1,28 +1,61 @@
 """Dependency injection utilities."""
-from typing import Annotated, Generator
+from typing import Annotated, AsyncGenerator
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from pydantic import UUID4
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.security import decode_access_token
-from app.db.session import async_session
+from app.db import session as db_session
+from app.db.routing import write_pins
 from app.models.user import Role, User
 from app.repositories.user import UserRepository
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"/api/auth/login")
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login", auto_error=False)
+
+
+def _token_subject(request: Request) -> str | None:
+    """Get the user ID from the bearer token without validating the user."""
+    if not hasattr(request.state, "token_subject"):
+        authorization = request.headers.get("authorization", "")
+        scheme, _, token = authorization.partition(" ")
+        payload = decode_access_token(token) if scheme.lower() == "bearer" and token else None
+        request.state.token_subject = payload.get("sub") if payload else None
+    return request.state.token_subject
+
+
+async def get_db(
+    request: Request,
+    db: Annotated[AsyncSession, Depends(db_session.get_db)],
+) -> AsyncGenerator[AsyncSession, None]:
+    """Get primary database session, pinning the caller to it after writes."""
+    yield db
+    if db.info.get("has_writes"):
+        subject = _token_subject(request)
+        if subject:
+            write_pins.pin(subject)
+
+
+async def _get_replica_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Get a read-only session, routed to the replica unless the caller just wrote."""
+    session_factory = db_session.replica_session
+    subject = _token_subject(request)
+    if subject and write_pins.is_pinned(subject):
+        session_factory = db_session.async_session
+
+    async with session_factory() as session:
+        yield session
 
 
-async def get_db() -> Generator[AsyncSession, None, None]:
-    """Get database session."""
-    async with async_session() as session:
-        yield session
+# Without a replica, reads share the request's primary session
+get_read_db = _get_replica_db if db_session.replica_session is not None else get_db
 
 
 async def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
 ) -> User:
     """Get current authenticated user from JWT token."""
     payload = decode_access_token(token)
@@ -56,6 +89,19 @@ async def get_current_user(
     return user
 
 
+async def get_stream_user(
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    token: Annotated[str | None, Depends(optional_oauth2_scheme)] = None,
+    access_token: Annotated[str | None, Query()] = None,
+) -> User:
+    """Get current user for a streaming endpoint.
+
+    Browsers' EventSource cannot set headers, so the token may also be passed
+    as the ``access_token`` query parameter.
+    """
+    return await get_current_user(token or access_token or "", db)
+
+
 async def get_current_active_user(
     current_user: Annotated[User, Depends(get_current_user)],
 ) -> User:
@@ -94,6 +140,8 @@ async def require_super_admin(
 
 # Type aliases for dependencies
 CurrentUser = Annotated[User, Depends(get_current_user)]
+StreamUser = Annotated[User, Depends(get_stream_user)]
 CurrentAdmin = Annotated[User, Depends(require_admin)]
 CurrentSuperAdmin = Annotated[User, Depends(require_super_admin)]
 DbSession = Annotated[AsyncSession, Depends(get_db)]
+ReadDbSession = Annotated[AsyncSession, Depends(get_read_db)]
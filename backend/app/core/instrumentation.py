@@ -0,0 +1,217 @@
+"""Latency instrumentation for HTTP requests, SQL queries and external calls."""
+import asyncio
+import functools
+import re
+import time
+from collections import Counter as TallyCounter
+from contextvars import ContextVar
+from typing import Any, Callable
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+from app.core.metrics import REGISTRY, Counter, Histogram
+
+QUERY_COUNT_BUCKETS = (1, 2, 3, 5, 8, 13, 21, 34, 55, 100)
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "HTTP requests by route template and status",
+    labelnames=("method", "route", "status"),
+)
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_seconds",
+    "HTTP request latency by route template and status",
+    labelnames=("method", "route", "status"),
+)
+HTTP_REQUEST_QUERIES = Histogram(
+    "http_request_db_queries",
+    "SQL statements executed per HTTP request",
+    labelnames=("method", "route"),
+    buckets=QUERY_COUNT_BUCKETS,
+)
+HTTP_REQUEST_DB_SECONDS = Histogram(
+    "http_request_db_seconds",
+    "Time spent in SQL statements per HTTP request",
+    labelnames=("method", "route"),
+)
+DB_QUERY_SECONDS = Histogram(
+    "db_query_seconds",
+    "SQL statement latency by statement type",
+    labelnames=("operation",),
+)
+STORAGE_OPERATION_SECONDS = Histogram(
+    "storage_operation_seconds",
+    "S3 operation latency",
+    labelnames=("operation", "outcome"),
+)
+
+
+# Bound parameter lists such as "IN ($1::UUID, $2::UUID)" collapse to one placeholder
+_PARAMETER_LIST = re.compile(r"\$\d+(?:::[\w\[\]]+)?(?:\s*,\s*\$\d+(?:::[\w\[\]]+)?)*")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """Normalize a SQL statement so repeated queries compare equal."""
+    return _WHITESPACE.sub(" ", _PARAMETER_LIST.sub("?", statement)).strip()
+
+
+class QueryStats:
+    """SQL statements executed within one request or bot update."""
+
+    __slots__ = ("count", "seconds", "shapes", "budget", "checked")
+
+    def __init__(self, track_shapes: bool = False) -> None:
+        self.count = 0
+        self.seconds = 0.0
+        self.shapes: TallyCounter[str] | None = TallyCounter() if track_shapes else None
+        self.budget: int | None = None
+        self.checked = False
+
+    def record(self, statement: str, elapsed: float) -> None:
+        """Record one executed statement."""
+        self.count += 1
+        self.seconds += elapsed
+        if self.shapes is not None:
+            self.shapes[statement_shape(statement)] += 1
+
+
+current_query_stats: ContextVar[QueryStats | None] = ContextVar("current_query_stats", default=None)
+
+
+def _statement_operation(statement: str) -> str:
+    """Get the leading SQL keyword of a statement."""
+    head = statement.lstrip()[:16].split(None, 1)
+    return head[0].upper() if head else "UNKNOWN"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    elapsed = time.perf_counter() - conn.info["query_started_at"].pop()
+    DB_QUERY_SECONDS.observe(elapsed, operation=_statement_operation(statement))
+    stats = current_query_stats.get()
+    if stats is not None:
+        stats.record(statement, elapsed)
+
+
+def _handle_error(exception_context) -> None:
+    # Failed statements never reach after_cursor_execute; drop their start time
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_started_at"):
+        conn.info["query_started_at"].pop()
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Time every SQL statement executed through an engine."""
+    sync_engine = engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording latency and query counts per route template."""
+
+    def __init__(self, app) -> None:
+        """Initialize middleware."""
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        """Handle an ASGI call."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        stats = QueryStats(track_shapes=settings.QUERY_BUDGET_MODE != "off")
+        token = current_query_stats.set(stats)
+        started_at = time.perf_counter()
+
+        async def send_wrapper(message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started_at
+            current_query_stats.reset(token)
+            route = scope.get("route")
+            # Label by template, never by raw path, to keep cardinality bounded
+            route_path = getattr(route, "path", None) or "unmatched"
+            method = scope["method"]
+            status = str(status_code)
+            HTTP_REQUESTS.inc(method=method, route=route_path, status=status)
+            HTTP_REQUEST_SECONDS.observe(elapsed, method=method, route=route_path, status=status)
+            HTTP_REQUEST_QUERIES.observe(stats.count, method=method, route=route_path)
+            HTTP_REQUEST_DB_SECONDS.observe(stats.seconds, method=method, route=route_path)
+            # Routes with a QueryBudget were checked before their response was sent
+            if stats.shapes is not None and not stats.checked:
+                from app.core.query_budget import check_query_stats
+
+                check_query_stats(stats, f"{method} {route_path}", sent=True)
+
+
+def timed(histogram: Histogram, **labels: str) -> Callable:
+    """Decorate a sync or async function to record its latency and outcome."""
+
+    def decorator(func: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                started_at = time.perf_counter()
+                outcome = "error"
+                try:
+                    result = await func(*args, **kwargs)
+                    outcome = "ok"
+                    return result
+                finally:
+                    histogram.observe(time.perf_counter() - started_at, outcome=outcome, **labels)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            started_at = time.perf_counter()
+            outcome = "error"
+            try:
+                result = func(*args, **kwargs)
+                outcome = "ok"
+                return result
+            finally:
+                histogram.observe(time.perf_counter() - started_at, outcome=outcome, **labels)
+
+        return wrapper
+
+    return decorator
+
+
+async def serve_metrics(host: str, port: int) -> asyncio.AbstractServer:
+    """Serve /metrics over plain HTTP for processes without FastAPI."""
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request_line = await reader.readline()
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass
+            if request_line.split(b" ")[1:2] == [b"/metrics"]:
+                body = REGISTRY.render().encode()
+                head = "HTTP/1.1 200 OK\r\nContent-Type: text/plain; version=0.0.4\r\n"
+            else:
+                body = b"Not Found\n"
+                head = "HTTP/1.1 404 Not Found\r\nContent-Type: text/plain\r\n"
+            writer.write(f"{head}Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode())
+            writer.write(body)
+            await writer.drain()
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(handle, host, port)
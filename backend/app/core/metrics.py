@@ -0,0 +1,259 @@
+"""In-process metrics primitives with Prometheus text exposition."""
+import bisect
+import math
+import threading
+from typing import Callable, Iterable
+
+# Latency buckets in seconds, tuned for request/query/hash timings
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labelnames: tuple[str, ...], labelvalues: tuple[str, ...], extra: str = "") -> str:
+    """Format a label set for the text exposition format."""
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(labelnames, labelvalues)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value."""
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together."""
+
+    def __init__(self) -> None:
+        """Initialize registry."""
+        self._metrics: dict[str, "_Metric"] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: "_Metric") -> None:
+        """Register a metric, rejecting duplicate names."""
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} is already registered")
+            self._metrics[metric.name] = metric
+
+    def get(self, name: str) -> "_Metric | None":
+        """Get a registered metric by name."""
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text format."""
+        lines: list[str] = []
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+
+class _Metric:
+    """Base class for labelled metrics."""
+
+    type_name = "untyped"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        registry: MetricsRegistry | None = REGISTRY,
+    ) -> None:
+        """Initialize metric and register it."""
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        if registry is not None:
+            registry.register(self)
+
+    def _key(self, labels: dict[str, str]) -> tuple[str, ...]:
+        """Build the label value tuple for a sample."""
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _header(self) -> list[str]:
+        """Render HELP and TYPE lines."""
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+
+    def render(self) -> list[str]:
+        """Render the metric samples."""
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing counter."""
+
+    type_name = "counter"
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize counter."""
+        super().__init__(*args, **kwargs)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increment the counter."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        """Get the current value for a label set."""
+        return self._values.get(self._key(labels), 0.0)
+
+    def render(self) -> list[str]:
+        """Render the metric samples."""
+        lines = self._header()
+        for key, value in list(self._values.items()):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+class Gauge(_Metric):
+    """Value that can go up and down, optionally computed on scrape."""
+
+    type_name = "gauge"
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize gauge."""
+        super().__init__(*args, **kwargs)
+        self._values: dict[tuple[str, ...], float] = {}
+        self._functions: dict[tuple[str, ...], Callable[[], float]] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        """Set the gauge value."""
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increment the gauge."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        """Decrement the gauge."""
+        self.inc(-amount, **labels)
+
+    def set_function(self, function: Callable[[], float], **labels: str) -> None:
+        """Compute the gauge value from a callable at scrape time."""
+        with self._lock:
+            self._functions[self._key(labels)] = function
+
+    def value(self, **labels: str) -> float:
+        """Get the current value for a label set."""
+        key = self._key(labels)
+        function = self._functions.get(key)
+        if function is not None:
+            return float(function())
+        return self._values.get(key, 0.0)
+
+    def render(self) -> list[str]:
+        """Render the metric samples."""
+        lines = self._header()
+        samples = dict(self._values)
+        for key, function in list(self._functions.items()):
+            samples[key] = float(function())
+        for key, value in samples.items():
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+class _HistogramState:
+    """Bucket counts, sum and count for one label set."""
+
+    __slots__ = ("buckets", "sum", "count", "max")
+
+    def __init__(self, size: int) -> None:
+        self.buckets = [0] * size
+        self.sum = 0.0
+        self.count = 0
+        self.max = 0.0
+
+
+class Histogram(_Metric):
+    """Bucketed distribution of observed values."""
+
+    type_name = "histogram"
+
+    def __init__(self, *args, buckets: Iterable[float] = DEFAULT_BUCKETS, **kwargs) -> None:
+        """Initialize histogram."""
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._states: dict[tuple[str, ...], _HistogramState] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record an observation."""
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._states.get(key)
+            if state is None:
+                state = self._states[key] = _HistogramState(len(self.buckets))
+            state.buckets[index] += 1
+            state.sum += value
+            state.count += 1
+            if value > state.max:
+                state.max = value
+
+    def quantile(self, q: float, **labels: str) -> float | None:
+        """Estimate a quantile by interpolating within buckets."""
+        state = self._states.get(self._key(labels))
+        if state is None or state.count == 0:
+            return None
+        rank = q * state.count
+        cumulative = 0
+        lower = 0.0
+        for upper, count in zip(self.buckets, state.buckets):
+            if count and cumulative + count >= rank:
+                if upper == math.inf:
+                    return state.max
+                return min(lower + (upper - lower) * ((rank - cumulative) / count), state.max)
+            cumulative += count
+            lower = upper if upper != math.inf else lower
+        return state.max
+
+    def snapshot(self, **labels: str) -> dict[str, float | int | None]:
+        """Summarize one label set for JSON health endpoints."""
+        state = self._states.get(self._key(labels))
+        if state is None or state.count == 0:
+            return {"count": 0, "avg": None, "p50": None, "p95": None, "p99": None, "max": None}
+        return {
+            "count": state.count,
+            "avg": round(state.sum / state.count, 6),
+            "p50": round(self.quantile(0.5, **labels), 6),
+            "p95": round(self.quantile(0.95, **labels), 6),
+            "p99": round(self.quantile(0.99, **labels), 6),
+            "max": round(state.max, 6),
+        }
+
+    def render(self) -> list[str]:
+        """Render the metric samples."""
+        lines = self._header()
+        for key, state in list(self._states.items()):
+            cumulative = 0
+            for upper, count in zip(self.buckets, state.buckets):
+                cumulative += count
+                le = f'le="{_format_value(upper)}"'
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}"
+                )
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(state.sum)}")
+            lines.append(f"{self.name}_count{labels} {state.count}")
+        return lines
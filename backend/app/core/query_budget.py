@@ -0,0 +1,86 @@
+"""SQL query budgets and N+1 detection for development and tests.
+
+Enable with ``QUERY_BUDGET_MODE=warn`` (log) or ``QUERY_BUDGET_MODE=raise``
+(fail the request, which fails tests driving it through a test client).
+Routes declare their expected statement count with
+``dependencies=[Depends(QueryBudget(n))]``, which checks it before the response
+is sent; bot handlers use ``@bot_query_budget(n)``. Routes without a budget are
+checked by the metrics middleware once the response is out, too late to fail
+it, so their overruns are logged and kept in ``late_overruns`` for tests to
+assert on.
+"""
+import logging
+from typing import AsyncGenerator, Callable
+
+from fastapi import Request
+
+from app.core.config import settings
+from app.core.instrumentation import QueryStats, current_query_stats
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised in ``raise`` mode when a request breaks its query budget."""
+
+
+# Overruns found after the response was sent, in raise mode
+late_overruns: list[str] = []
+
+
+def check_query_stats(stats: QueryStats, label: str, sent: bool = False) -> None:
+    """Report budget overruns and repeated statement shapes.
+
+    In raise mode this raises, unless the response was already ``sent``.
+    """
+    stats.checked = True
+    problems = []
+    if stats.budget is not None and stats.count > stats.budget:
+        problems.append(f"executed {stats.count} SQL statements, budget is {stats.budget}")
+
+    repeated = [
+        (shape, count)
+        for shape, count in (stats.shapes or {}).items()
+        if count >= settings.N_PLUS_ONE_THRESHOLD
+    ]
+    for shape, count in repeated:
+        problems.append(f"possible N+1: {count}x {shape[:200]}")
+
+    if not problems:
+        return
+
+    message = f"{label}: " + "; ".join(problems)
+    if settings.QUERY_BUDGET_MODE == "raise":
+        if not sent:
+            raise QueryBudgetExceeded(message)
+        late_overruns.append(message)
+    logger.warning(message)
+
+
+class QueryBudget:
+    """Route dependency declaring the maximum SQL statements for a request."""
+
+    def __init__(self, max_queries: int) -> None:
+        """Initialize budget."""
+        self.max_queries = max_queries
+
+    async def __call__(self, request: Request) -> AsyncGenerator[None, None]:
+        """Attach the budget to the request's query stats and check it once the response is built."""
+        stats = current_query_stats.get()
+        if stats is not None:
+            stats.budget = self.max_queries
+        yield
+        # Dependency exits run before the response is sent, so raise mode fails the request
+        if stats is not None and stats.shapes is not None:
+            route = request.scope.get("route")
+            check_query_stats(stats, f"{request.method} {getattr(route, 'path', request.url.path)}")
+
+
+def bot_query_budget(max_queries: int) -> Callable:
+    """Declare the maximum SQL statements for a bot handler callback."""
+
+    def decorator(func: Callable) -> Callable:
+        func.query_budget = max_queries
+        return func
+
+    return decorator
@@ -0,0 +1,157 @@
+"""In-memory sliding window rate limiting."""
+import math
+import time
+from collections import deque
+
+from starlette.requests import Request
+
+from app.core.config import settings
+from app.core.metrics import Counter
+
+LOGIN_THROTTLED = Counter(
+    "login_throttled_total",
+    "Login attempts rejected by throttling",
+    labelnames=("reason",),
+)
+
+
+class SlidingWindowLimiter:
+    """Count events per key within a sliding time window."""
+
+    def __init__(self, limit: int, window_seconds: float, max_keys: int = 100_000) -> None:
+        """Initialize limiter."""
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self.max_keys = max_keys
+        self._events: dict[str, deque[float]] = {}
+
+    def _prune(self, key: str, now: float) -> deque[float] | None:
+        """Drop events that fell out of the window."""
+        events = self._events.get(key)
+        if events is None:
+            return None
+        cutoff = now - self.window_seconds
+        while events and events[0] <= cutoff:
+            events.popleft()
+        if not events:
+            del self._events[key]
+            return None
+        return events
+
+    def _sweep(self, now: float) -> None:
+        """Bound memory by discarding expired keys."""
+        for key in list(self._events):
+            self._prune(key, now)
+
+    def retry_after(self, key: str) -> float:
+        """Seconds until the key may act again, or 0 if it is allowed now."""
+        now = time.monotonic()
+        events = self._prune(key, now)
+        if events is None or len(events) < self.limit:
+            return 0.0
+        return events[0] + self.window_seconds - now
+
+    def hit(self, key: str) -> None:
+        """Record an event for the key."""
+        now = time.monotonic()
+        if len(self._events) >= self.max_keys:
+            self._sweep(now)
+        self._events.setdefault(key, deque()).append(now)
+
+    def reset(self, key: str) -> None:
+        """Forget all events for the key."""
+        self._events.pop(key, None)
+
+
+def client_ip(request: Request) -> str:
+    """Get the client's IP, behind ``TRUSTED_PROXY_HOPS`` reverse proxies.
+
+    Each proxy appends the address it was called from to X-Forwarded-For, so
+    the client is that many entries from the end; earlier entries are whatever
+    the client sent and are ignored.
+    """
+    peer = request.client.host if request.client else "unknown"
+    hops = settings.TRUSTED_PROXY_HOPS
+    if hops <= 0:
+        return peer
+    forwarded = [
+        address.strip()
+        for header in request.headers.getlist("x-forwarded-for")
+        for address in header.split(",")
+        if address.strip()
+    ]
+    if len(forwarded) < hops:
+        return peer
+    return forwarded[-hops]
+
+
+class LoginThrottle:
+    """Throttle logins by failed attempts per staff ID and IP, and total attempts per IP.
+
+    Failures count per staff ID and IP together, so guessing from one address
+    locks only that address out instead of the account's owner. They also count
+    per staff ID alone, against a higher limit, so guessing spread across many
+    addresses is still stopped.
+    """
+
+    def __init__(
+        self,
+        max_failures_per_staff_id: int,
+        max_failures_per_account: int,
+        max_attempts_per_ip: int,
+        window_seconds: float,
+    ) -> None:
+        """Initialize throttle."""
+        self.staff_failures = SlidingWindowLimiter(max_failures_per_staff_id, window_seconds)
+        self.account_failures = SlidingWindowLimiter(max_failures_per_account, window_seconds)
+        self.ip_attempts = SlidingWindowLimiter(max_attempts_per_ip, window_seconds)
+
+    def check(self, staff_id: str, client_ip: str) -> int:
+        """Register an attempt and return seconds to wait, or 0 if allowed."""
+        retry_after = self.staff_failures.retry_after(self._failure_key(staff_id, client_ip))
+        if retry_after:
+            LOGIN_THROTTLED.inc(reason="staff_id")
+            return math.ceil(retry_after)
+
+        retry_after = self.account_failures.retry_after(self._account_key(staff_id))
+        if retry_after:
+            LOGIN_THROTTLED.inc(reason="account")
+            return math.ceil(retry_after)
+
+        retry_after = self.ip_attempts.retry_after(client_ip)
+        if retry_after:
+            LOGIN_THROTTLED.inc(reason="ip")
+            return math.ceil(retry_after)
+
+        self.ip_attempts.hit(client_ip)
+        return 0
+
+    def record_failure(self, staff_id: str, client_ip: str) -> None:
+        """Record a failed login for the staff ID from an IP."""
+        self.staff_failures.hit(self._failure_key(staff_id, client_ip))
+        self.account_failures.hit(self._account_key(staff_id))
+
+    def record_success(self, staff_id: str, client_ip: str) -> None:
+        """Clear failed logins for the staff ID from an IP.
+
+        Failures from other addresses still count towards the account's limit.
+        """
+        self.staff_failures.reset(self._failure_key(staff_id, client_ip))
+
+    @staticmethod
+    def _account_key(staff_id: str) -> str:
+        """Key failed logins by normalized staff ID."""
+        return staff_id.strip().lower()
+
+    @classmethod
+    def _failure_key(cls, staff_id: str, client_ip: str) -> str:
+        """Key failed logins by normalized staff ID and IP."""
+        return f"{cls._account_key(staff_id)}|{client_ip}"
+
+
+login_throttle = LoginThrottle(
+    max_failures_per_staff_id=settings.LOGIN_MAX_FAILURES_PER_STAFF_ID,
+    max_failures_per_account=settings.LOGIN_MAX_FAILURES_PER_ACCOUNT,
+    max_attempts_per_ip=settings.LOGIN_MAX_ATTEMPTS_PER_IP,
+    window_seconds=settings.LOGIN_THROTTLE_WINDOW_SECONDS,
+)
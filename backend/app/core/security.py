@@ -1,14 +1,52 @@
 """Security utilities for authentication and authorization."""
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, Callable, TypeVar
 
 from jose import jwt
 from passlib.context import CryptContext
 
 from app.core.config import settings
+from app.core.metrics import Counter, Gauge, Histogram
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+T = TypeVar("T")
+
+# bcrypt is CPU-bound and releases the GIL, so a small dedicated pool keeps
+# hashing off the event loop without starving the default executor.
+_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_MAX_CONCURRENCY,
+    thread_name_prefix="password-hash",
+)
+_hash_semaphore = asyncio.Semaphore(settings.PASSWORD_HASH_MAX_CONCURRENCY)
+
+PASSWORD_HASH_SECONDS = Histogram(
+    "password_hash_seconds",
+    "Time spent computing bcrypt hashes",
+    labelnames=("operation",),
+)
+PASSWORD_HASH_WAIT_SECONDS = Histogram(
+    "password_hash_wait_seconds",
+    "Time spent waiting for a free password hashing slot",
+    labelnames=("operation",),
+)
+PASSWORD_HASH_IN_FLIGHT = Gauge(
+    "password_hash_in_flight",
+    "Password hashing operations currently running",
+)
+PASSWORD_HASH_REJECTED = Counter(
+    "password_hash_rejected_total",
+    "Password hashing operations rejected because the pool was saturated",
+    labelnames=("operation",),
+)
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when no password hashing slot frees up in time."""
+
 
 def create_access_token(subject: str | Any, expires_delta: timedelta | None = None) -> str:
     """Create a JWT access token."""
@@ -40,3 +78,51 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 def get_password_hash(password: str) -> str:
     """Hash a password."""
     return pwd_context.hash(password)
+
+
+async def _run_hash_operation(operation: str, func: Callable[..., T], *args: Any) -> T:
+    """Run a bcrypt operation in the bounded hashing pool."""
+    queued_at = time.perf_counter()
+    try:
+        await asyncio.wait_for(
+            _hash_semaphore.acquire(), timeout=settings.PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS
+        )
+    except asyncio.TimeoutError:
+        PASSWORD_HASH_REJECTED.inc(operation=operation)
+        raise PasswordHasherBusy(f"Password {operation} queue is saturated")
+
+    started_at = time.perf_counter()
+    PASSWORD_HASH_WAIT_SECONDS.observe(started_at - queued_at, operation=operation)
+    PASSWORD_HASH_IN_FLIGHT.inc()
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_hash_executor, func, *args)
+    finally:
+        PASSWORD_HASH_IN_FLIGHT.dec()
+        PASSWORD_HASH_SECONDS.observe(time.perf_counter() - started_at, operation=operation)
+        _hash_semaphore.release()
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against a hash without blocking the event loop."""
+    return await _run_hash_operation("verify", verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password without blocking the event loop."""
+    return await _run_hash_operation("hash", get_password_hash, password)
+
+
+def password_hash_stats() -> dict[str, Any]:
+    """Summarize password hashing latency for health checks."""
+    return {
+        "max_concurrency": settings.PASSWORD_HASH_MAX_CONCURRENCY,
+        "in_flight": int(PASSWORD_HASH_IN_FLIGHT.value()),
+        "verify": PASSWORD_HASH_SECONDS.snapshot(operation="verify"),
+        "hash": PASSWORD_HASH_SECONDS.snapshot(operation="hash"),
+        "wait": PASSWORD_HASH_WAIT_SECONDS.snapshot(operation="verify"),
+        "rejected": int(
+            PASSWORD_HASH_REJECTED.value(operation="verify")
+            + PASSWORD_HASH_REJECTED.value(operation="hash")
+        ),
+    }
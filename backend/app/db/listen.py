@@ -0,0 +1,145 @@
+"""One dedicated Postgres connection per process for LISTEN/NOTIFY.
+
+Every feed in a process, such as live findings, bot cache invalidation and job
+wake-ups, subscribes to the shared ``listener``, which ``LISTEN``s on the
+channels its subscribers need over a single connection and hands each
+notification to the handlers of its channel. The connection is opened with the
+first subscriber and closed with the last. ``LISTEN`` needs a session of its
+own, so behind PgBouncer in transaction mode point ``DATABASE_LISTEN_URL`` at
+Postgres directly or at a session-mode pool.
+"""
+import asyncio
+import logging
+from typing import Callable
+
+import asyncpg
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ListenSubscription:
+    """One feed's channel handlers, called for as long as it stays subscribed."""
+
+    def __init__(self, channels: dict[str, Callable[[str], None]], on_connect: Callable[[], None]) -> None:
+        """Initialize subscription."""
+        self.channels = channels
+        self.on_connect = on_connect
+
+
+class Listener:
+    """Shares one LISTEN connection between every subscription in the process.
+
+    Reconnects whenever the connection drops. Notifications sent while
+    disconnected are lost, so each subscription's ``on_connect`` runs once its
+    channels are listened on, after every (re)connect, to let it resynchronize.
+    """
+
+    def __init__(self, name: str) -> None:
+        """Initialize listener."""
+        self.name = name
+        self._subscriptions: list[ListenSubscription] = []
+        self._changed: asyncio.Event | None = None
+        self._stop: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+
+    def subscribe(
+        self, channels: dict[str, Callable[[str], None]], on_connect: Callable[[], None]
+    ) -> ListenSubscription:
+        """Call each channel's handler with notification payloads until unsubscribed."""
+        subscription = ListenSubscription(channels, on_connect)
+        self._subscriptions.append(subscription)
+        if self._task is None:
+            # Made per run, since events are bound to the loop that first waits on them
+            self._changed, self._stop = asyncio.Event(), asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+        else:
+            self._changed.set()
+        return subscription
+
+    async def unsubscribe(self, subscription: ListenSubscription) -> None:
+        """Stop calling a subscription's handlers, closing the connection after the last one."""
+        if subscription not in self._subscriptions:
+            return
+        self._subscriptions.remove(subscription)
+        if self._subscriptions:
+            self._changed.set()
+        elif self._task is not None:
+            task, self._task = self._task, None
+            self._stop.set()
+            self._changed.set()
+            await task
+
+    def _dispatch(self, conn, pid: int, channel: str, payload: str) -> None:
+        """Hand a notification to every handler of its channel."""
+        for subscription in list(self._subscriptions):
+            handler = subscription.channels.get(channel)
+            if handler is None:
+                continue
+            try:
+                handler(payload)
+            except Exception:
+                logger.exception(f"Handler for {channel} notifications failed")
+
+    async def _sync(
+        self, conn: asyncpg.Connection, listening: set[str], connected: set[ListenSubscription]
+    ) -> None:
+        """LISTEN on the channels subscribers need, then resynchronize the new subscribers."""
+        self._changed.clear()
+        wanted = {channel for subscription in self._subscriptions for channel in subscription.channels}
+        for channel in wanted - listening:
+            await conn.add_listener(channel, self._dispatch)
+            listening.add(channel)
+        for channel in listening - wanted:
+            await conn.remove_listener(channel, self._dispatch)
+            listening.discard(channel)
+        for subscription in list(self._subscriptions):
+            if subscription not in connected:
+                connected.add(subscription)
+                subscription.on_connect()
+
+    async def _run(self) -> None:
+        """Keep the connection open and listening until the last subscription leaves."""
+        stop = self._stop
+        while not stop.is_set():
+            try:
+                conn = await asyncpg.connect(
+                    settings.DATABASE_LISTEN_URL or settings.DATABASE_URL,
+                    server_settings={"application_name": f"{settings.DB_APPLICATION_NAME}-{self.name}"},
+                )
+            except (OSError, asyncpg.PostgresError) as e:
+                logger.warning(f"{self.name} connection could not connect: {e}")
+                await wait(stop, 5)
+                continue
+
+            try:
+                # Channels listened on, and subscriptions resynchronized, on this connection
+                listening: set[str] = set()
+                connected: set[ListenSubscription] = set()
+                await self._sync(conn, listening, connected)
+                while not stop.is_set() and not conn.is_closed():
+                    await wait(self._changed, 30)
+                    if stop.is_set():
+                        break
+                    if self._changed.is_set():
+                        await self._sync(conn, listening, connected)
+                    else:
+                        await conn.execute("SELECT 1")
+            except (OSError, asyncpg.PostgresError) as e:
+                logger.warning(f"{self.name} connection lost: {e}")
+            finally:
+                if not conn.is_closed():
+                    await conn.close()
+
+
+async def wait(stop: asyncio.Event, seconds: float) -> None:
+    """Sleep until stopped or for some seconds, whichever comes first."""
+    try:
+        await asyncio.wait_for(stop.wait(), timeout=seconds)
+    except asyncio.TimeoutError:
+        pass
+
+
+# The process's LISTEN connection
+listener = Listener(name="listen")
@@ -0,0 +1,76 @@
+"""Yearly range partitions of findings and their status history.
+
+``findings`` is partitioned by ``reported_at`` and ``status_history`` by its
+finding's ``finding_reported_at``, one partition per UTC year, so a finding and
+its history always share a year. Queries bounded on those columns only touch
+the years they need, and the current year's indexes stay small however much
+history is kept. Rows can only be written once their year's partition exists,
+so the API on startup and the daily ``findings.ensure_partitions`` job create
+them ``FINDING_PARTITION_YEARS_AHEAD`` years in advance.
+"""
+from datetime import datetime, timezone
+
+from sqlalchemy import Connection, Table, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from app.core.config import settings
+
+PARTITIONED_TABLES = ("findings", "status_history")
+
+
+def partition_name(table: str, year: int) -> str:
+    """Get the name of a table's partition for a year."""
+    return f"{table}_y{year}"
+
+
+def year_bounds(year: int) -> tuple[datetime, datetime]:
+    """Get the range a year's partition holds: [start, end) in UTC."""
+    return datetime(year, 1, 1, tzinfo=timezone.utc), datetime(year + 1, 1, 1, tzinfo=timezone.utc)
+
+
+def create_partition_sql(table: str, year: int) -> str:
+    """Get the statement creating a table's partition for a year, if missing."""
+    start, end = year_bounds(year)
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition_name(table, year)} PARTITION OF {table} "
+        f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+    )
+
+
+async def ensure_partitions(
+    conn: AsyncConnection | AsyncSession, first_year: int, last_year: int
+) -> list[str]:
+    """Create the missing partitions of every partitioned table for a span of years.
+
+    Returns the names of the partitions created.
+    """
+    wanted = [
+        (table, year, partition_name(table, year))
+        for year in range(first_year, last_year + 1)
+        for table in PARTITIONED_TABLES
+    ]
+    # Checked first so the usual no-op run takes no lock on the parent tables
+    result = await conn.execute(
+        text("SELECT relname FROM pg_class WHERE relname = ANY(:names)"),
+        {"names": [name for _, _, name in wanted]},
+    )
+    existing = set(result.scalars().all())
+    created = []
+    for table, year, name in wanted:
+        if name not in existing:
+            await conn.execute(text(create_partition_sql(table, year)))
+            created.append(name)
+    return created
+
+
+async def ensure_upcoming_partitions(conn: AsyncConnection | AsyncSession) -> list[str]:
+    """Create the missing partitions from this year through ``FINDING_PARTITION_YEARS_AHEAD``."""
+    year = datetime.now(timezone.utc).year
+    return await ensure_partitions(conn, year, year + settings.FINDING_PARTITION_YEARS_AHEAD)
+
+
+def create_current_partitions(target: Table, connection: Connection, **kw) -> None:
+    """Give a partitioned table made by ``create_all`` partitions from this year on."""
+    year = datetime.now(timezone.utc).year
+    for y in range(year, year + settings.FINDING_PARTITION_YEARS_AHEAD + 1):
+        connection.execute(text(create_partition_sql(target.name, y)))
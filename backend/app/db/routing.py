@@ -0,0 +1,50 @@
+"""Read-your-writes tracking for replica routing."""
+import time
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+
+
+class WritePinTracker:
+    """Remember callers who recently wrote so their reads go to the primary."""
+
+    def __init__(self, window_seconds: float, max_entries: int = 50_000) -> None:
+        """Initialize tracker."""
+        self.window_seconds = window_seconds
+        self.max_entries = max_entries
+        self._pins: dict[str, float] = {}
+
+    def pin(self, key: str) -> None:
+        """Pin a caller to the primary for the read-your-writes window."""
+        now = time.monotonic()
+        if len(self._pins) >= self.max_entries:
+            self._pins = {k: v for k, v in self._pins.items() if v > now}
+        self._pins[key] = now + self.window_seconds
+
+    def is_pinned(self, key: str) -> bool:
+        """Check whether a caller must read from the primary."""
+        expires_at = self._pins.get(key)
+        if expires_at is None:
+            return False
+        if expires_at <= time.monotonic():
+            self._pins.pop(key, None)
+            return False
+        return True
+
+
+write_pins = WritePinTracker(settings.READ_YOUR_WRITES_SECONDS)
+
+
+@event.listens_for(Session, "before_flush")
+def _reject_replica_writes(session: Session, flush_context, instances) -> None:
+    """Fail fast when code tries to write through a replica session."""
+    if session.info.get("read_only") and (session.new or session.dirty or session.deleted):
+        raise RuntimeError("Attempted to write through a read-only replica session")
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_session_written(session: Session, flush_context) -> None:
+    """Flag sessions that flushed changes so callers can be pinned."""
+    session.info["has_writes"] = True
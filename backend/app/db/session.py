@@ -1,15 +1,102 @@
 """Database session management."""
-from typing import AsyncGenerator
+import logging
+import time
+from typing import Any, AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.core.config import settings
+from app.core.instrumentation import instrument_engine
+from app.core.metrics import Counter, Gauge, Histogram
+from app.db.partitions import ensure_upcoming_partitions
 
-engine = create_async_engine(
-    settings.DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://"),
-    echo=settings.DATABASE_ECHO,
-    pool_pre_ping=True,
+logger = logging.getLogger(__name__)
+
+DB_POOL_WAIT_SECONDS = Histogram(
+    "db_pool_wait_seconds",
+    "Time spent acquiring a connection from the pool",
+    labelnames=("pool",),
+)
+DB_POOL_TIMEOUTS = Counter(
+    "db_pool_timeouts_total",
+    "Connection checkouts that timed out waiting for the pool",
+    labelnames=("pool",),
+)
+DB_POOL_SIZE = Gauge("db_pool_size", "Configured pool size", labelnames=("pool",))
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out", "Connections currently checked out", labelnames=("pool",)
+)
+DB_POOL_CHECKED_IN = Gauge(
+    "db_pool_checked_in", "Idle connections held by the pool", labelnames=("pool",)
 )
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow", "Connections opened beyond the pool size", labelnames=("pool",)
+)
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long checkouts wait for a connection."""
+
+    def connect(self):
+        """Check out a connection, recording the wait time."""
+        pool_name = self.logging_name or "default"
+        started_at = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            DB_POOL_TIMEOUTS.inc(pool=pool_name)
+            raise
+        finally:
+            DB_POOL_WAIT_SECONDS.observe(time.perf_counter() - started_at, pool=pool_name)
+
+
+def get_async_database_url(url: str) -> str:
+    """Convert a PostgreSQL URL to use the asyncpg driver."""
+    for prefix in ("postgresql://", "postgres://"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg://" + url[len(prefix):]
+    return url
+
+
+def create_engine(url: str, name: str = "primary", **overrides: Any) -> AsyncEngine:
+    """Create an async engine with settings-driven pooling."""
+    options: dict[str, Any] = {
+        "echo": settings.DATABASE_ECHO,
+        "pool_pre_ping": True,
+        "poolclass": InstrumentedPool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_logging_name": name,
+        "connect_args": {
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "server_settings": {"application_name": settings.DB_APPLICATION_NAME},
+        },
+    }
+    options.update(overrides)
+    new_engine = create_async_engine(get_async_database_url(url), **options)
+    instrument_engine(new_engine)
+    _register_pool_gauges(new_engine, name)
+    return new_engine
+
+
+def _register_pool_gauges(pool_engine: AsyncEngine, name: str) -> None:
+    """Expose live pool counters for an engine."""
+
+    def pool():
+        # Resolve on every scrape: dispose() replaces the pool object
+        return pool_engine.sync_engine.pool
+
+    DB_POOL_SIZE.set_function(lambda: pool().size(), pool=name)
+    DB_POOL_CHECKED_OUT.set_function(lambda: pool().checkedout(), pool=name)
+    DB_POOL_CHECKED_IN.set_function(lambda: pool().checkedin(), pool=name)
+    DB_POOL_OVERFLOW.set_function(lambda: max(pool().overflow(), 0), pool=name)
+
+
+engine = create_engine(settings.DATABASE_URL)
 
 async_session = async_sessionmaker(
     engine,
@@ -18,6 +105,25 @@ async_session = async_sessionmaker(
 )
 
 
+# Reads fall back to the primary when no replica is configured
+replica_engine = (
+    create_engine(settings.DATABASE_REPLICA_URL, name="replica")
+    if settings.DATABASE_REPLICA_URL
+    else None
+)
+
+replica_session = (
+    async_sessionmaker(
+        replica_engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        info={"read_only": True},
+    )
+    if replica_engine is not None
+    else None
+)
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Get database session."""
     async with async_session() as session:
@@ -39,7 +145,45 @@ async def init_db() -> None:
 
         await conn.run_sync(lambda c: None)  # Connection test
 
+    # Also done daily by the job worker; here so a deployment without it, or one
+    # started after a long outage, can still write this year's findings
+    try:
+        async with engine.begin() as conn:
+            # Creating a partition locks its parent; don't queue behind long queries
+            await conn.execute(text("SET LOCAL lock_timeout = '5s'"))
+            created = await ensure_upcoming_partitions(conn)
+    except exc.DBAPIError as e:
+        logger.warning(f"Could not create upcoming finding partitions: {e}")
+    else:
+        if created:
+            logger.info(f"Created partitions {', '.join(created)}")
+
 
 async def close_db() -> None:
     """Close database connections."""
     await engine.dispose()
+    if replica_engine is not None:
+        await replica_engine.dispose()
+
+
+def pool_stats(pool_engine: AsyncEngine = engine, name: str = "primary") -> dict[str, Any]:
+    """Summarize pool usage for health checks."""
+    pool = pool_engine.sync_engine.pool
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "timeout": settings.DB_POOL_TIMEOUT,
+        "timeouts": int(DB_POOL_TIMEOUTS.value(pool=name)),
+        "wait": DB_POOL_WAIT_SECONDS.snapshot(pool=name),
+    }
+
+
+async def ping(pool_engine: AsyncEngine = engine) -> float:
+    """Run a trivial query and return its round-trip time in seconds."""
+    started_at = time.perf_counter()
+    async with pool_engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+    return time.perf_counter() - started_at
@@ -0,0 +1,7 @@
+"""Background jobs run by the job worker, queued in Postgres."""
+from app.jobs.registry import JOBS, SCHEDULES, enqueue, job, schedule
+
+# Registers the built-in jobs
+from app.jobs import tasks  # noqa: E402,F401
+
+__all__ = ["JOBS", "SCHEDULES", "enqueue", "job", "schedule"]
@@ -0,0 +1,91 @@
+"""Job definitions, cron schedules and enqueueing."""
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.repositories.job import JobRepository
+
+JobFunc = Callable[[dict[str, Any]], Awaitable[None]]
+
+
+@dataclass(frozen=True, slots=True)
+class JobDefinition:
+    """A registered job and the defaults of its runs."""
+
+    name: str
+    func: JobFunc
+    priority: int
+    max_attempts: int
+    timeout_seconds: int
+
+
+@dataclass(frozen=True, slots=True)
+class Schedule:
+    """A job enqueued on a cron schedule, in ``JOBS_TIMEZONE``."""
+
+    job_name: str
+    cron: str
+    payload: dict[str, Any] = field(default_factory=dict)
+
+
+JOBS: dict[str, JobDefinition] = {}
+SCHEDULES: list[Schedule] = []
+
+
+def job(
+    name: str,
+    *,
+    priority: int = 0,
+    max_attempts: int | None = None,
+    timeout_seconds: int | None = None,
+) -> Callable[[JobFunc], JobFunc]:
+    """Register an async function taking the job payload as a job.
+
+    Jobs may run more than once, e.g. after a worker crash, so they should be
+    idempotent.
+    """
+    def decorator(func: JobFunc) -> JobFunc:
+        JOBS[name] = JobDefinition(
+            name=name,
+            func=func,
+            priority=priority,
+            max_attempts=max_attempts or settings.JOBS_DEFAULT_MAX_ATTEMPTS,
+            timeout_seconds=timeout_seconds or settings.JOBS_DEFAULT_TIMEOUT_SECONDS,
+        )
+        return func
+    return decorator
+
+
+def schedule(job_name: str, cron: str, payload: dict[str, Any] | None = None) -> None:
+    """Enqueue a job on a crontab expression, e.g. ``"0 3 * * *"``."""
+    SCHEDULES.append(Schedule(job_name, cron, payload or {}))
+
+
+async def enqueue(
+    db: AsyncSession,
+    name: str,
+    payload: dict[str, Any] | None = None,
+    *,
+    priority: int | None = None,
+    run_at: datetime | None = None,
+    key: str | None = None,
+) -> int | None:
+    """Enqueue a registered job in the session's transaction.
+
+    Returns the job ID, or None if a job with the same key is already queued.
+    """
+    definition = JOBS.get(name)
+    if definition is None:
+        raise ValueError(f"Unknown job: {name}")
+    return await JobRepository(db).enqueue(
+        name,
+        payload or {},
+        priority=definition.priority if priority is None else priority,
+        max_attempts=definition.max_attempts,
+        timeout_seconds=definition.timeout_seconds,
+        run_at=run_at,
+        key=key,
+    )
@@ -0,0 +1,101 @@
+"""Built-in maintenance jobs."""
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from dateutil.relativedelta import relativedelta
+
+from app.core.config import settings
+from app.db.partitions import ensure_upcoming_partitions
+from app.db.session import async_session
+from app.jobs.registry import job, schedule
+from app.repositories.finding import FindingRepository
+from app.repositories.job import JobRepository
+from app.services.archive import finding_archive
+from app.services.storage_gc import collect_orphans
+
+logger = logging.getLogger(__name__)
+
+
+@job("jobs.purge_failed", priority=-10)
+async def purge_failed_jobs(payload: dict[str, Any]) -> None:
+    """Delete failed jobs older than ``JOBS_FAILED_RETENTION_DAYS``."""
+    before = datetime.now(timezone.utc) - timedelta(days=settings.JOBS_FAILED_RETENTION_DAYS)
+    async with async_session() as db:
+        deleted = await JobRepository(db).purge_failed(before)
+        await db.commit()
+    if deleted:
+        logger.info(f"Purged {deleted} failed jobs")
+
+
+schedule("jobs.purge_failed", "30 3 * * *")
+
+
+@job("findings.reconcile_counters", priority=-5)
+async def reconcile_finding_counters(payload: dict[str, Any]) -> None:
+    """Recount the dashboard counters from findings, correcting any drift."""
+    async with async_session() as db:
+        # One snapshot for the recount and the counters, which writers are not kept from
+        await db.connection(
+            execution_options={"isolation_level": "REPEATABLE READ", "postgresql_readonly": True}
+        )
+        deltas, day_deltas = await FindingRepository(db).count_counter_drift()
+    if not deltas and not day_deltas:
+        return
+
+    async with async_session() as db:
+        await FindingRepository(db).correct_counters(deltas, day_deltas)
+        await db.commit()
+    # Counters are kept in step with every write, so drift points to a bug or manual SQL
+    logger.warning(f"Corrected {len(deltas) + len(day_deltas)} drifted finding counters")
+
+
+schedule("findings.reconcile_counters", "15 3 * * *")
+
+
+@job("findings.ensure_partitions", priority=5)
+async def ensure_finding_partitions(payload: dict[str, Any]) -> None:
+    """Create the yearly partitions of findings through ``FINDING_PARTITION_YEARS_AHEAD``."""
+    async with async_session() as db:
+        created = await ensure_upcoming_partitions(db)
+        await db.commit()
+    if created:
+        logger.info(f"Created partitions {', '.join(created)}")
+
+
+schedule("findings.ensure_partitions", "0 2 * * *")
+
+
+@job("findings.archive", priority=-10, timeout_seconds=3600)
+async def archive_findings(payload: dict[str, Any]) -> None:
+    """Move findings closed more than ``ARCHIVE_AFTER_MONTHS`` ago to the cold archive."""
+    if not settings.ARCHIVE_AFTER_MONTHS:
+        return
+    closed_before = datetime.now(timezone.utc) - relativedelta(months=settings.ARCHIVE_AFTER_MONTHS)
+    total = 0
+    while True:
+        # One transaction per batch keeps locks short and progress durable
+        async with async_session() as db:
+            archived = await finding_archive.archive_batch(db, closed_before)
+            await db.commit()
+        total += archived
+        if archived < settings.ARCHIVE_BATCH_SIZE:
+            break
+    if total:
+        logger.info(f"Archived {total} findings closed before {closed_before:%Y-%m-%d}")
+
+
+schedule("findings.archive", "45 3 * * *")
+
+
+@job("storage.collect_orphans", priority=-10, timeout_seconds=3600)
+async def collect_storage_orphans(payload: dict[str, Any]) -> None:
+    """Delete stored photos and derivatives that no photo references."""
+    for prefix, result in (await collect_orphans()).items():
+        logger.info(
+            f"Collected {prefix}: {result.scanned} objects scanned, {result.deleted} deleted, "
+            f"{result.live_bytes} bytes live, {result.orphaned_bytes} bytes orphaned"
+        )
+
+
+schedule("storage.collect_orphans", "15 4 * * *")
@@ -0,0 +1,273 @@
+"""Background job worker - runs queued jobs and enqueues scheduled ones.
+
+Run with ``python -m app.jobs.worker``. Any number of workers can run at once:
+jobs are claimed with ``SKIP LOCKED``, and each schedule fires once per time
+whichever worker gets there first.
+"""
+import asyncio
+import logging
+import os
+import signal
+import socket
+import time
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+from apscheduler.triggers.cron import CronTrigger
+
+from app.bot.lifecycle import start_outbound, stop_outbound
+from app.core.config import settings
+from app.core.instrumentation import serve_metrics
+from app.core.metrics import Counter, Gauge, Histogram
+from app.db.listen import listener, wait
+from app.db.session import async_session, close_db
+from app.jobs import JOBS, SCHEDULES
+from app.models.job import Job
+from app.repositories.job import JOBS_CHANNEL, JobRepository
+from app.services.outbox import outbox_dispatcher
+
+logger = logging.getLogger(__name__)
+
+JOBS_PROCESSED = Counter(
+    "jobs_processed_total",
+    "Background jobs run by name and result",
+    labelnames=("name", "result"),
+)
+JOB_DURATION_SECONDS = Histogram(
+    "job_duration_seconds",
+    "Duration of background job runs",
+    labelnames=("name",),
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0, 60.0, 300.0, 900.0),
+)
+JOBS_ACTIVE = Gauge("jobs_active", "Background jobs running in this worker")
+
+
+class JobWorker:
+    """Claims and runs jobs, up to ``concurrency`` at a time."""
+
+    def __init__(self, concurrency: int, poll_interval: float) -> None:
+        """Initialize worker."""
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.worker_id = f"{socket.gethostname()}-{os.getpid()}"
+        self._running: dict[asyncio.Task, Job] = {}
+        # Finished job IDs, deleted together on the next loop
+        self._completed: list[int] = []
+        self._wake = asyncio.Event()
+        self._stop = asyncio.Event()
+        JOBS_ACTIVE.set_function(lambda: len(self._running))
+
+    def stop(self) -> None:
+        """Ask the worker to finish its running jobs and return."""
+        self._stop.set()
+        self._wake.set()
+
+    async def run(self) -> None:
+        """Run jobs until stopped."""
+        enqueued = listener.subscribe(
+            {JOBS_CHANNEL: lambda payload: self._wake.set()}, on_connect=self._wake.set
+        )
+        background = [
+            asyncio.create_task(self._run_schedules()),
+            asyncio.create_task(self._requeue_expired()),
+        ]
+        try:
+            while not self._stop.is_set():
+                self._wake.clear()
+                await self._flush_completed()
+                free = self.concurrency - len(self._running)
+                if free > 0:
+                    await self._claim(free)
+                # Woken by an enqueue or a job finishing; polling covers missed notifications
+                await wait(self._wake, self.poll_interval)
+        finally:
+            await listener.unsubscribe(enqueued)
+            await self._drain()
+            await asyncio.gather(*background, return_exceptions=True)
+
+    async def _claim(self, limit: int) -> None:
+        """Claim up to ``limit`` jobs and start them."""
+        try:
+            async with async_session() as db:
+                jobs = await JobRepository(db).claim(limit, self.worker_id)
+                await db.commit()
+        except Exception:
+            logger.exception("Failed to claim jobs")
+            return
+        for job in jobs:
+            task = asyncio.create_task(self._execute(job))
+            self._running[task] = job
+            task.add_done_callback(self._on_done)
+
+    def _on_done(self, task: asyncio.Task) -> None:
+        """Free a finished job's slot."""
+        self._running.pop(task, None)
+        self._wake.set()
+
+    async def _execute(self, job: Job) -> None:
+        """Run one job and record its outcome."""
+        definition = JOBS.get(job.name)
+        started = time.perf_counter()
+        try:
+            if definition is None:
+                raise LookupError(f"No job registered as {job.name}")
+            await asyncio.wait_for(definition.func(job.payload), timeout=job.timeout_seconds)
+        except Exception as e:
+            await self._fail(job, f"{type(e).__name__}: {e}")
+        else:
+            JOBS_PROCESSED.inc(name=job.name, result="succeeded")
+            self._completed.append(job.id)
+        finally:
+            JOB_DURATION_SECONDS.observe(time.perf_counter() - started, name=job.name)
+
+    async def _fail(self, job: Job, error: str) -> None:
+        """Schedule a retry with exponential backoff, or give up on the job."""
+        retry_at = None
+        if job.attempts < job.max_attempts:
+            delay = min(
+                settings.JOBS_RETRY_BASE_SECONDS * 2 ** (job.attempts - 1),
+                settings.JOBS_RETRY_MAX_SECONDS,
+            )
+            retry_at = datetime.now(timezone.utc) + timedelta(seconds=delay)
+            logger.warning(f"Job {job.id} ({job.name}) failed, retrying in {delay:.0f}s: {error}")
+        else:
+            logger.error(f"Job {job.id} ({job.name}) failed after {job.attempts} attempts: {error}")
+        JOBS_PROCESSED.inc(name=job.name, result="retried" if retry_at else "failed")
+        try:
+            async with async_session() as db:
+                await JobRepository(db).fail(job.id, self.worker_id, error, retry_at)
+                await db.commit()
+        except Exception:
+            # The job is handed out again once its timeout passes
+            logger.exception(f"Failed to record the failure of job {job.id}")
+
+    async def _flush_completed(self) -> None:
+        """Delete the jobs finished since the last flush, in one statement."""
+        if not self._completed:
+            return
+        job_ids, self._completed = self._completed, []
+        try:
+            async with async_session() as db:
+                await JobRepository(db).complete(job_ids, self.worker_id)
+                await db.commit()
+        except Exception:
+            logger.exception("Failed to record finished jobs")
+            self._completed.extend(job_ids)
+
+    async def _drain(self) -> None:
+        """Let running jobs finish, then release the ones that did not in time."""
+        if self._running:
+            logger.info(f"Waiting for {len(self._running)} running jobs")
+            await asyncio.wait(set(self._running), timeout=settings.JOBS_SHUTDOWN_TIMEOUT_SECONDS)
+        unfinished = [job.id for job in self._running.values()]
+        for task in list(self._running):
+            task.cancel()
+        await asyncio.gather(*self._running, return_exceptions=True)
+        await self._flush_completed()
+        if unfinished:
+            async with async_session() as db:
+                await JobRepository(db).release(unfinished, self.worker_id)
+                await db.commit()
+
+    async def _run_schedules(self) -> None:
+        """Enqueue scheduled jobs when they are due, until stopped.
+
+        Runs missed while no worker was up are skipped.
+        """
+        tz = ZoneInfo(settings.JOBS_TIMEZONE)
+        triggers = []
+        for entry in SCHEDULES:
+            if entry.job_name not in JOBS:
+                logger.error(f"Ignoring schedule of unregistered job {entry.job_name}")
+                continue
+            triggers.append((entry, CronTrigger.from_crontab(entry.cron, timezone=tz)))
+        now = datetime.now(tz)
+        next_fire = [trigger.get_next_fire_time(None, now) for _, trigger in triggers]
+
+        while triggers and not self._stop.is_set():
+            now = datetime.now(tz)
+            retry = False
+            for i, (entry, trigger) in enumerate(triggers):
+                fire_at = next_fire[i]
+                if fire_at > now:
+                    continue
+                try:
+                    await self._fire(entry.job_name, entry.payload, fire_at)
+                except Exception:
+                    logger.exception(f"Failed to enqueue scheduled job {entry.job_name}")
+                    retry = True
+                    continue
+                after = max(now, fire_at + timedelta(microseconds=1))
+                next_fire[i] = trigger.get_next_fire_time(None, after)
+            seconds = (min(next_fire) - datetime.now(tz)).total_seconds()
+            # Waits at least a few seconds before retrying a failed enqueue
+            await wait(self._stop, min(max(seconds, 5.0 if retry else 0.0), 60.0))
+
+    async def _fire(self, job_name: str, payload: dict, fire_at: datetime) -> None:
+        """Enqueue one scheduled run, unless another worker already did."""
+        definition = JOBS[job_name]
+        async with async_session() as db:
+            repo = JobRepository(db)
+            if await repo.fire_schedule(job_name, fire_at):
+                await repo.enqueue(
+                    job_name,
+                    payload,
+                    priority=definition.priority,
+                    max_attempts=definition.max_attempts,
+                    timeout_seconds=definition.timeout_seconds,
+                )
+            await db.commit()
+
+    async def _requeue_expired(self) -> None:
+        """Periodically hand out again the jobs of workers that stopped mid-job."""
+        while not self._stop.is_set():
+            try:
+                async with async_session() as db:
+                    requeued = await JobRepository(db).requeue_expired()
+                    await db.commit()
+                if requeued:
+                    logger.warning(f"Requeued {requeued} jobs past their timeout")
+            except Exception:
+                logger.exception("Failed to requeue expired jobs")
+            await wait(self._stop, settings.JOBS_REAP_INTERVAL_SECONDS)
+
+
+async def main() -> None:
+    """Start the job worker."""
+    logger.info(f"Starting job worker with {len(JOBS)} jobs and {len(SCHEDULES)} schedules...")
+
+    metrics_server = None
+    if settings.JOBS_METRICS_PORT:
+        metrics_server = await serve_metrics("0.0.0.0", settings.JOBS_METRICS_PORT)
+        logger.info(f"Serving metrics on port {settings.JOBS_METRICS_PORT}")
+
+    # The outbox is drained here too, so its events are handled (or, with
+    # notifications disabled, discarded) even when no other process sends
+    outbound_bot = await start_outbound() if settings.TELEGRAM_BOT_TOKEN else None
+    if outbound_bot is None:
+        outbox_dispatcher.start()
+
+    worker = JobWorker(settings.JOBS_CONCURRENCY, settings.JOBS_POLL_INTERVAL_SECONDS)
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, worker.stop)
+
+    try:
+        await worker.run()
+    finally:
+        if outbound_bot is not None:
+            await stop_outbound(outbound_bot)
+        else:
+            await outbox_dispatcher.stop()
+        if metrics_server is not None:
+            metrics_server.close()
+        await close_db()
+        logger.info("Job worker stopped.")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        level=logging.INFO,
+    )
+    asyncio.run(main())
@@ -3,9 +3,16 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
 
+from app.bot.lifecycle import start_outbound, stop_outbound, webhook_enabled, webhook_runner
 from app.core.config import settings
-from app.db.session import init_db, close_db
+from app.core.instrumentation import MetricsMiddleware
+from app.core.metrics import REGISTRY
+from app.core.security import password_hash_stats
+from app.db import session as db_session
+from app.db.session import close_db, init_db, ping, pool_stats
+from app.services.finding_events import finding_events
 
 
 @asynccontextmanager
@@ -13,8 +20,20 @@ async def lifespan(app: FastAPI):
     """Application lifespan manager."""
     # Startup
     await init_db()
+    outbound_bot = None
+    if settings.TELEGRAM_BOT_TOKEN:
+        # Every replica sends notifications, whichever process handles updates
+        outbound_bot = await start_outbound()
+    if webhook_enabled():
+        # Runs the bot once this replica holds the webhook lock
+        webhook_runner.start()
     yield
     # Shutdown
+    if webhook_enabled():
+        await webhook_runner.stop()
+    if outbound_bot is not None:
+        await stop_outbound(outbound_bot)
+    await finding_events.stop()
     await close_db()
 
 
@@ -34,6 +53,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Outermost, so latency covers CORS handling and every response
+app.add_middleware(MetricsMiddleware)
+
 
 @app.get("/health")
 async def health_check():
@@ -41,6 +63,42 @@ async def health_check():
     return {"status": "ok", "app": settings.APP_NAME, "version": settings.APP_VERSION}
 
 
+@app.get("/health/auth")
+async def auth_health_check():
+    """Password hashing pool and latency statistics."""
+    return {"status": "ok", "password_hashing": password_hash_stats()}
+
+
+@app.get("/health/db")
+async def db_health_check():
+    """Database connectivity and connection pool statistics."""
+    try:
+        latency = await ping()
+    except Exception as e:
+        return JSONResponse(
+            status_code=503,
+            content={"status": "error", "detail": str(e)[:200], "pool": pool_stats()},
+        )
+    result = {"status": "ok", "ping_seconds": round(latency, 6), "pool": pool_stats()}
+
+    if db_session.replica_engine is not None:
+        replica = {"pool": pool_stats(db_session.replica_engine, "replica")}
+        try:
+            replica["ping_seconds"] = round(await ping(db_session.replica_engine), 6)
+        except Exception as e:
+            replica["error"] = str(e)[:200]
+            result["status"] = "degraded"
+        result["replica"] = replica
+
+    return result
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus metrics endpoint."""
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4")
+
+
 @app.get("/")
 async def root():
     """Root endpoint."""
@@ -52,10 +110,12 @@ async def root():
 
 
 # Include API routers
-from app.api.v1 import auth, findings, areas, users, notifications  # noqa: E402
+from app.api.v1 import auth, findings, areas, users, notifications, telegram, jobs  # noqa: E402
 
 app.include_router(auth.router, prefix=f"{settings.API_PREFIX}/v1/auth", tags=["Authentication"])
 app.include_router(findings.router, prefix=f"{settings.API_PREFIX}/v1/findings", tags=["Findings"])
 app.include_router(areas.router, prefix=f"{settings.API_PREFIX}/v1/areas", tags=["Areas"])
 app.include_router(users.router, prefix=f"{settings.API_PREFIX}/v1/admin/users", tags=["Admin"])
+app.include_router(jobs.router, prefix=f"{settings.API_PREFIX}/v1/admin/jobs", tags=["Admin"])
 app.include_router(notifications.router, prefix=f"{settings.API_PREFIX}/v1/notifications", tags=["Notifications"])
+app.include_router(telegram.router, prefix=f"{settings.API_PREFIX}/v1/telegram", tags=["Telegram"])
@@ -1,8 +1,19 @@
 """Database models."""
+from app.models.archived_photo import ArchivedPhoto
 from app.models.area import Area
+from app.models.bot_persistence import BotPersistence
+from app.models.digest_delivery import DigestDelivery
 from app.models.finding import Finding
+from app.models.finding_counter import FindingCounter, FindingDailyCount
+from app.models.finding_key import FindingKey, ReportIdCounter
+from app.models.finding_lifecycle import FindingLifecycle
+from app.models.job import Job, JobSchedule, JobStatus
+from app.models.notification_preference import NotificationPreference
+from app.models.outbox import OutboxEvent
 from app.models.photo import Photo
 from app.models.status_history import StatusHistory
+from app.models.telegram_update import TelegramUpdate
 from app.models.user import Role, User
+from app.models.user_area import UserArea
 
-__all__ = ["Area", "Finding", "Photo", "StatusHistory", "Role", "User"]
+__all__ = ["ArchivedPhoto", "Area", "BotPersistence", "DigestDelivery", "Finding", "FindingCounter", "FindingDailyCount", "FindingKey", "FindingLifecycle", "Job", "JobSchedule", "JobStatus", "NotificationPreference", "OutboxEvent", "Photo", "ReportIdCounter", "StatusHistory", "TelegramUpdate", "Role", "User", "UserArea"]
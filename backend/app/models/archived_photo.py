@@ -0,0 +1,34 @@
+"""Archived photo model."""
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKeyConstraint, String
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class ArchivedPhoto(Base):
+    """Storage key of a photo whose metadata moved to the cold archive.
+
+    Keeps the object from being collected as an orphan for as long as its
+    finding's tombstone exists.
+    """
+
+    __tablename__ = "archived_photos"
+
+    s3_key: Mapped[str] = mapped_column(String(500), primary_key=True)
+    finding_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False, index=True)
+    finding_reported_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["finding_id", "finding_reported_at"],
+            ["findings.id", "findings.reported_at"],
+            ondelete="CASCADE",
+        ),
+    )
+
+    def __repr__(self) -> str:
+        return f"<ArchivedPhoto {self.s3_key}>"
@@ -0,0 +1,26 @@
+"""Bot persistence model."""
+from datetime import datetime, timezone
+
+from sqlalchemy import DateTime, LargeBinary, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class BotPersistence(Base):
+    """Pickled bot state, one row per user, chat or conversation."""
+
+    __tablename__ = "bot_persistence"
+
+    # "user_data", "chat_data", "bot_data" or "conversation:<handler name>"
+    kind: Mapped[str] = mapped_column(String(64), primary_key=True)
+    key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    data: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
+
+    def __repr__(self) -> str:
+        return f"<BotPersistence {self.kind}/{self.key}>"
@@ -0,0 +1,28 @@
+"""Digest delivery model."""
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import DateTime, ForeignKey, String
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class DigestDelivery(Base):
+    """A scheduled digest delivered to one user, so reruns skip them."""
+
+    __tablename__ = "digest_deliveries"
+
+    # "daily_summary" or "weekly_summary"
+    kind: Mapped[str] = mapped_column(String(20), primary_key=True)
+    period_end: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    sent_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+    )
+
+    def __repr__(self) -> str:
+        return f"<DigestDelivery {self.kind} {self.period_end:%Y-%m-%d} -> {self.user_id}>"
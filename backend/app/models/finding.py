@@ -4,11 +4,12 @@ from datetime import datetime, timezone
 from enum import Enum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, String, Text, ForeignKey
+from sqlalchemy import DateTime, String, Text, ForeignKey, Index, event, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
+from app.db.partitions import create_current_partitions
 
 if TYPE_CHECKING:
     from app.models.user import User
@@ -43,7 +44,8 @@ class Finding(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
     )
-    report_id: Mapped[str] = mapped_column(String(50), unique=True, nullable=False, index=True)
+    # Unique through finding_keys: unique indexes of a partitioned table must include reported_at
+    report_id: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
     reporter_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id", ondelete="RESTRICT"), nullable=False
     )
@@ -58,13 +60,18 @@ class Finding(Base):
         String(20), default=Status.OPEN, nullable=False, index=True
     )
     location: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    # Partition key, so part of the primary key
     reported_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), index=True
+        DateTime(timezone=True), primary_key=True, default=lambda: datetime.now(timezone.utc), index=True
     )
     closed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     assigned_to: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True
     )
+    # Set once the finding's text, history and photos moved to the cold archive;
+    # the row stays as a tombstone and reads restore it from ``archive_key``
+    archived_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    archive_key: Mapped[str | None] = mapped_column(String(500), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
     )
@@ -89,5 +96,33 @@ class Finding(Base):
         back_populates="finding", cascade="all, delete-orphan"
     )
 
+    __table_args__ = (
+        # Keyset paging of a reporter's findings, newest first
+        Index("ix_findings_reporter_reported_at", "reporter_id", "reported_at", "id"),
+        # Oldest open critical finding on the dashboard
+        Index(
+            "ix_findings_open_critical_reported_at",
+            "reported_at",
+            postgresql_where=text("severity = 'critical' AND status IN ('open', 'in_progress')"),
+        ),
+        # Trend series, aggregated by index-only scans over a date range
+        Index(
+            "ix_findings_reported_at_dimensions",
+            "reported_at",
+            postgresql_include=["area_id", "severity", "status"],
+        ),
+        # Closed findings not archived yet, oldest first
+        Index(
+            "ix_findings_archive_candidates",
+            "closed_at",
+            postgresql_where=text("archived_at IS NULL AND status = 'closed'"),
+        ),
+        # One partition per year; see app.db.partitions
+        {"postgresql_partition_by": "RANGE (reported_at)"},
+    )
+
     def __repr__(self) -> str:
         return f"<Finding {self.report_id} - {self.severity}>"
+
+
+event.listen(Finding.__table__, "after_create", create_current_partitions)
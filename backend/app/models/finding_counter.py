@@ -0,0 +1,41 @@
+"""Finding counter models."""
+import uuid
+from datetime import date
+
+from sqlalchemy import BigInteger, Date, ForeignKey, String
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class FindingCounter(Base):
+    """Number of findings per area, status and severity.
+
+    Kept up to date by ``FindingRepository`` in the same transaction as each
+    write, so dashboard totals are read without scanning findings.
+    """
+
+    __tablename__ = "finding_counters"
+
+    area_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("areas.id", ondelete="CASCADE"), primary_key=True
+    )
+    status: Mapped[str] = mapped_column(String(20), primary_key=True)
+    severity: Mapped[str] = mapped_column(String(20), primary_key=True)
+    count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"<FindingCounter {self.area_id} {self.status}/{self.severity}={self.count}>"
+
+
+class FindingDailyCount(Base):
+    """Number of findings reported per UTC day."""
+
+    __tablename__ = "finding_daily_counts"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"<FindingDailyCount {self.day}={self.count}>"
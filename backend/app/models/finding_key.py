@@ -0,0 +1,47 @@
+"""Finding key directory models."""
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKeyConstraint, Integer, String
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class FindingKey(Base):
+    """Partition key and report ID of a finding, in one unpartitioned table.
+
+    Postgres only enforces uniqueness within a partition, so report IDs are
+    made unique here. Lookups by finding or report ID read the finding's
+    reported_at from here first, so they only touch its partition.
+    """
+
+    __tablename__ = "finding_keys"
+
+    finding_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    reported_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    report_id: Mapped[str] = mapped_column(String(50), nullable=False, unique=True)
+
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["finding_id", "reported_at"],
+            ["findings.id", "findings.reported_at"],
+            ondelete="CASCADE",
+        ),
+    )
+
+    def __repr__(self) -> str:
+        return f"<FindingKey {self.report_id}>"
+
+
+class ReportIdCounter(Base):
+    """Last report ID number allocated in a year."""
+
+    __tablename__ = "report_id_counters"
+
+    year: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    last_number: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<ReportIdCounter {self.year}={self.last_number}>"
@@ -0,0 +1,42 @@
+"""Finding lifecycle model."""
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, Float, ForeignKeyConstraint, Integer
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class FindingLifecycle(Base):
+    """Time a finding has spent in each status, and when it was resolved.
+
+    Advanced by ``FindingRepository`` with every status change, so resolution
+    analytics read one row per finding instead of replaying its status history.
+    Time in the current status is ``now() - status_since`` and is not included
+    in the ``seconds_*`` totals until the status changes.
+    """
+
+    __tablename__ = "finding_lifecycles"
+
+    finding_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    finding_reported_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    status_since: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    seconds_open: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    seconds_in_progress: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    seconds_resolved: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    # Last move to resolved or closed; cleared when the finding is reopened
+    resolved_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    reopen_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["finding_id", "finding_reported_at"],
+            ["findings.id", "findings.reported_at"],
+            ondelete="CASCADE",
+        ),
+    )
+
+    def __repr__(self) -> str:
+        return f"<FindingLifecycle {self.finding_id} resolved_at={self.resolved_at}>"
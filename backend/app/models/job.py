@@ -0,0 +1,81 @@
+"""Background job model."""
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any
+
+from sqlalchemy import BigInteger, DateTime, Identity, Index, Integer, SmallInteger, String, Text, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class JobStatus(str, Enum):
+    """Job status values; finished jobs are deleted."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    FAILED = "failed"
+
+
+class Job(Base):
+    """A unit of background work for the job worker."""
+
+    __tablename__ = "jobs"
+
+    id: Mapped[int] = mapped_column(BigInteger, Identity(), primary_key=True)
+    name: Mapped[str] = mapped_column(String(100), nullable=False)
+    payload: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False, default=dict)
+    # Higher runs first
+    priority: Mapped[int] = mapped_column(SmallInteger, nullable=False, default=0)
+    status: Mapped[JobStatus] = mapped_column(String(20), nullable=False, default=JobStatus.QUEUED)
+    # Optional deduplication key; a second job with the same key is not enqueued
+    key: Mapped[str | None] = mapped_column(String(200), nullable=True, unique=True)
+    run_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc)
+    )
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    max_attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=5)
+    # Visibility timeout: a running job not finished by then is handed out again
+    timeout_seconds: Mapped[int] = mapped_column(Integer, nullable=False, default=300)
+    locked_until: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    locked_by: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
+
+    __table_args__ = (
+        # Dequeue order, over queued jobs only
+        Index(
+            "ix_jobs_dequeue",
+            priority.desc(),
+            "run_at",
+            postgresql_where=text("status = 'queued'"),
+        ),
+        Index(
+            "ix_jobs_running_locked_until",
+            "locked_until",
+            postgresql_where=text("status = 'running'"),
+        ),
+    )
+
+    def __repr__(self) -> str:
+        return f"<Job {self.id} {self.name} {self.status}>"
+
+
+class JobSchedule(Base):
+    """Last time a cron schedule enqueued its job, shared by all workers."""
+
+    __tablename__ = "job_schedules"
+
+    name: Mapped[str] = mapped_column(String(100), primary_key=True)
+    last_fire_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<JobSchedule {self.name} {self.last_fire_at}>"
@@ -0,0 +1,32 @@
+"""Notification preference model."""
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import Boolean, DateTime, ForeignKey, String
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class NotificationPreference(Base):
+    """A user's notification settings; users without a row get the defaults."""
+
+    __tablename__ = "notification_preferences"
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    new_finding: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    status_change: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    daily_summary: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    weekly_summary: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    daily_summary_time: Mapped[str] = mapped_column(String(5), default="09:00", nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
+
+    def __repr__(self) -> str:
+        return f"<NotificationPreference {self.user_id}>"
@@ -0,0 +1,50 @@
+"""Outbox event model."""
+import uuid
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import BigInteger, DateTime, Identity, Index, Integer, String, Text, text
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class OutboxEvent(Base):
+    """A side effect of a write, recorded in the write's transaction.
+
+    The outbox dispatcher runs its handlers and deletes it once they all
+    succeed, or marks it dead after too many failures.
+    """
+
+    __tablename__ = "outbox"
+
+    id: Mapped[int] = mapped_column(BigInteger, Identity(), primary_key=True)
+    # e.g. "finding.created"
+    event_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    aggregate_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    payload: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+    )
+    available_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+    )
+    attempts: Mapped[int] = mapped_column(Integer, default=0)
+    # Handlers that already succeeded, skipped when the event is retried
+    completed: Mapped[list[str]] = mapped_column(ARRAY(String(100)), default=list)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    dead_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        # Only live events are indexed, so claiming stays cheap however many are dead
+        Index(
+            "ix_outbox_pending",
+            "available_at",
+            "id",
+            postgresql_where=text("dead_at IS NULL"),
+        ),
+    )
+
+    def __repr__(self) -> str:
+        return f"<OutboxEvent {self.id} {self.event_type}>"
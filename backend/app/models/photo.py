@@ -3,7 +3,7 @@ import uuid
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, String, Integer, ForeignKey
+from sqlalchemy import DateTime, String, Integer, ForeignKeyConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -21,10 +21,9 @@ class Photo(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
     )
-    finding_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("findings.id", ondelete="CASCADE"), nullable=False, index=True
-    )
-    s3_key: Mapped[str] = mapped_column(String(500), nullable=False)
+    finding_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False, index=True)
+    finding_reported_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    s3_key: Mapped[str] = mapped_column(String(500), nullable=False, index=True)
     original_filename: Mapped[str] = mapped_column(String(255), nullable=False)
     mime_type: Mapped[str] = mapped_column(String(100), nullable=False)
     size: Mapped[int] = mapped_column(Integer, nullable=False)  # Size in bytes
@@ -35,6 +34,14 @@ class Photo(Base):
     # Relationship
     finding: Mapped["Finding"] = relationship("Finding", back_populates="photos")
 
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["finding_id", "finding_reported_at"],
+            ["findings.id", "findings.reported_at"],
+            ondelete="CASCADE",
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<Photo {self.original_filename}>"
 
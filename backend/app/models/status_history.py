@@ -3,11 +3,12 @@ import uuid
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, String, Text, ForeignKey
+from sqlalchemy import DateTime, String, Text, ForeignKey, ForeignKeyConstraint, event
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
+from app.db.partitions import create_current_partitions
 
 if TYPE_CHECKING:
     from app.models.finding import Finding
@@ -22,9 +23,9 @@ class StatusHistory(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
     )
-    finding_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("findings.id", ondelete="CASCADE"), nullable=False, index=True
-    )
+    finding_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False, index=True)
+    # The finding's partition key; history is partitioned by it too, next to its finding
+    finding_reported_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
     old_status: Mapped[str | None] = mapped_column(String(50), nullable=True)
     new_status: Mapped[str] = mapped_column(String(50), nullable=False)
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -39,5 +40,17 @@ class StatusHistory(Base):
     finding: Mapped["Finding"] = relationship("Finding", back_populates="status_history")
     updated_by_user: Mapped["User"] = relationship("User", foreign_keys=[updated_by])
 
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["finding_id", "finding_reported_at"],
+            ["findings.id", "findings.reported_at"],
+            ondelete="CASCADE",
+        ),
+        {"postgresql_partition_by": "RANGE (finding_reported_at)"},
+    )
+
     def __repr__(self) -> str:
         return f"<StatusHistory {self.old_status} -> {self.new_status}>"
+
+
+event.listen(StatusHistory.__table__, "after_create", create_current_partitions)
@@ -2,5 +2,8 @@
 from app.repositories.user import UserRepository
 from app.repositories.finding import FindingRepository
 from app.repositories.area import AreaRepository
+from app.repositories.digest import DigestRepository
+from app.repositories.notification import NotificationPreferenceRepository
+from app.repositories.photo import PhotoRepository
 
-__all__ = ["UserRepository", "FindingRepository", "AreaRepository"]
+__all__ = ["UserRepository", "FindingRepository", "AreaRepository", "DigestRepository", "NotificationPreferenceRepository", "PhotoRepository"]
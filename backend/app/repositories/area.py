@@ -2,12 +2,15 @@
 import uuid
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import Row, func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.models.area import Area
 
+# Postgres NOTIFY channel signalling that the area tree changed
+AREAS_CHANGED_CHANNEL = "areas_changed"
+
 
 class AreaRepository:
     """Repository for Area model operations."""
@@ -18,13 +21,41 @@ class AreaRepository:
 
     async def get_by_id(self, area_id: str | uuid.UUID) -> Area | None:
         """Get area by ID."""
+        if isinstance(area_id, str):
+            area_id = uuid.UUID(area_id)
         result = await self.db.execute(
             select(Area)
             .options(selectinload(Area.children))
-            .where(Area.id == uuid.UUID(area_id))
+            .where(Area.id == area_id)
         )
         return result.scalar_one_or_none()
 
+    async def get_name(self, area_id: uuid.UUID) -> str | None:
+        """Get an area's name without loading the area."""
+        result = await self.db.execute(select(Area.name).where(Area.id == area_id))
+        return result.scalar_one_or_none()
+
+    async def list_nodes(self) -> list[Row]:
+        """List every area as a lightweight (id, name, parent_id) row."""
+        result = await self.db.execute(select(Area.id, Area.name, Area.parent_id))
+        return list(result.all())
+
+    async def count_existing(self, area_ids: list[uuid.UUID]) -> int:
+        """Count how many of the given area IDs exist."""
+        if not area_ids:
+            return 0
+        result = await self.db.execute(
+            select(func.count()).select_from(Area).where(Area.id.in_(area_ids))
+        )
+        return result.scalar_one()
+
+    async def get_names(self, area_ids: list[uuid.UUID]) -> dict[uuid.UUID, str]:
+        """Get the names of the given areas that exist."""
+        if not area_ids:
+            return {}
+        result = await self.db.execute(select(Area.id, Area.name).where(Area.id.in_(area_ids)))
+        return {row.id: row.name for row in result.all()}
+
     async def get_by_name(self, name: str) -> Area | None:
         """Get area by name."""
         result = await self.db.execute(
@@ -69,6 +100,7 @@ class AreaRepository:
         area = Area(**area_data)
         self.db.add(area)
         await self.db.flush()
+        await self._notify_changed()
         return area
 
     async def update(self, area: Area, update_data: dict[str, Any]) -> Area:
@@ -77,12 +109,18 @@ class AreaRepository:
             if hasattr(area, field) and value is not None:
                 setattr(area, field, value)
         await self.db.flush()
+        await self._notify_changed()
         return area
 
     async def delete(self, area: Area) -> None:
         """Delete an area."""
         await self.db.delete(area)
         await self.db.flush()
+        await self._notify_changed()
+
+    async def _notify_changed(self) -> None:
+        """Tell bot processes to reload the area tree once this transaction commits."""
+        await self.db.execute(text("SELECT pg_notify(:channel, '')"), {"channel": AREAS_CHANGED_CHANNEL})
 
     async def get_descendant_ids(self, area_id: uuid.UUID) -> list[uuid.UUID]:
         """Get all descendant area IDs for a given area."""
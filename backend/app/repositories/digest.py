@@ -0,0 +1,42 @@
+"""Digest delivery repository."""
+import uuid
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.digest_delivery import DigestDelivery
+
+
+class DigestRepository:
+    """Repository for DigestDelivery model operations."""
+
+    def __init__(self, db: AsyncSession) -> None:
+        """Initialize repository."""
+        self.db = db
+
+    async def get_delivered_user_ids(self, kind: str, period_end: datetime) -> set[uuid.UUID]:
+        """Get the users who already received a digest."""
+        result = await self.db.execute(
+            select(DigestDelivery.user_id).where(
+                DigestDelivery.kind == kind, DigestDelivery.period_end == period_end
+            )
+        )
+        return set(result.scalars().all())
+
+    async def record_deliveries(
+        self, kind: str, period_end: datetime, user_ids: list[uuid.UUID]
+    ) -> None:
+        """Record that users received a digest."""
+        if not user_ids:
+            return
+        await self.db.execute(
+            insert(DigestDelivery)
+            .values([
+                {"kind": kind, "period_end": period_end, "user_id": user_id}
+                for user_id in user_ids
+            ])
+            .on_conflict_do_nothing()
+        )
+        await self.db.flush()
@@ -1,14 +1,56 @@
 """Finding repository."""
 import uuid
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from typing import Any
 
-from sqlalchemy import select, and_, or_, desc
+from sqlalchemy import (
+    ColumnElement, Date, DateTime, Row, String, case, cast, delete, select, and_, or_, desc, func, literal_column, text,
+    tuple_, update,
+)
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 
+from app.models.archived_photo import ArchivedPhoto
+from app.models.area import Area
 from app.models.finding import Finding, Severity, Status
+from app.models.finding_counter import FindingCounter, FindingDailyCount
+from app.models.finding_key import FindingKey, ReportIdCounter
+from app.models.finding_lifecycle import FindingLifecycle
+from app.models.photo import Photo
 from app.models.status_history import StatusHistory
+from app.models.user import User
+from app.repositories.outbox import OutboxRepository
+from app.schemas.finding import FindingDelta, ResolutionGroupBy, TrendGranularity, TrendGroupBy
+
+# Postgres NOTIFY channel carrying finding changes to live feeds
+FINDING_EVENTS_CHANNEL = "finding_events"
+# NOTIFY payloads must stay under 8000 bytes; longer findings are sent without text
+MAX_EVENT_FINDING_BYTES = 7000
+
+OPEN_STATUSES = (Status.OPEN, Status.IN_PROGRESS)
+RESOLVED_STATUSES = (Status.RESOLVED, Status.CLOSED)
+
+# Lifecycle column accumulating the time spent in each status; closed is final
+LIFECYCLE_SECONDS = {
+    Status.OPEN: "seconds_open",
+    Status.IN_PROGRESS: "seconds_in_progress",
+    Status.RESOLVED: "seconds_resolved",
+}
+
+# (area_id, status, severity) of a finding counter
+CounterKey = tuple[uuid.UUID, str, str]
+
+
+def _by_id(finding_id: uuid.UUID) -> ColumnElement[bool]:
+    """Match a finding by ID, only reading the partition finding_keys places it in."""
+    reported_at = select(FindingKey.reported_at).where(FindingKey.finding_id == finding_id)
+    return and_(Finding.id == finding_id, Finding.reported_at == reported_at.scalar_subquery())
+
+
+def _counter_key(finding: Finding) -> CounterKey:
+    """Get the counter a finding is counted in."""
+    return finding.area_id, Status(finding.status).value, Severity(finding.severity).value
 
 
 class FindingRepository:
@@ -25,29 +67,35 @@ class FindingRepository:
         result = await self.db.execute(
             select(Finding)
             .options(
-                selectinload(Finding.reporter),
-                selectinload(Finding.assignee),
-                selectinload(Finding.area),
+                joinedload(Finding.reporter),
+                joinedload(Finding.assignee),
+                # Areas nest up to three levels, and responses show their full path
+                joinedload(Finding.area).joinedload(Area.parent).joinedload(Area.parent),
                 selectinload(Finding.photos),
-                selectinload(Finding.status_history),
+                selectinload(Finding.status_history).selectinload(StatusHistory.updated_by_user),
             )
-            .where(Finding.id == finding_id)
+            .where(_by_id(finding_id))
         )
         return result.scalar_one_or_none()
 
     async def get_by_report_id(self, report_id: str) -> Finding | None:
         """Get finding by report ID."""
-        result = await self.db.execute(
+        query = (
             select(Finding)
             .options(
-                selectinload(Finding.reporter),
-                selectinload(Finding.assignee),
-                selectinload(Finding.area),
+                joinedload(Finding.reporter),
+                joinedload(Finding.assignee),
+                joinedload(Finding.area).joinedload(Area.parent).joinedload(Area.parent),
                 selectinload(Finding.photos),
-                selectinload(Finding.status_history),
+                selectinload(Finding.status_history).selectinload(StatusHistory.updated_by_user),
+            )
+            .join(
+                FindingKey,
+                and_(FindingKey.finding_id == Finding.id, FindingKey.reported_at == Finding.reported_at),
             )
-            .where(Finding.report_id == report_id)
+            .where(FindingKey.report_id == report_id)
         )
+        result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
     async def list_findings(
@@ -64,9 +112,9 @@ class FindingRepository:
     ) -> tuple[list[Finding], int]:
         """List findings with optional filtering."""
         query = select(Finding).options(
-            selectinload(Finding.reporter),
-            selectinload(Finding.assignee),
-            selectinload(Finding.area),
+            joinedload(Finding.reporter),
+            joinedload(Finding.assignee),
+            joinedload(Finding.area).joinedload(Area.parent).joinedload(Area.parent),
             selectinload(Finding.photos),
             selectinload(Finding.status_history).selectinload(StatusHistory.updated_by_user),
         )
@@ -106,6 +154,164 @@ class FindingRepository:
 
         return findings, total
 
+    async def get_version(
+        self, finding_id: uuid.UUID, reporter_id: uuid.UUID | None = None
+    ) -> datetime | None:
+        """Get a finding's updated_at without loading it, optionally scoped to a reporter."""
+        query = select(Finding.updated_at).where(_by_id(finding_id))
+        if reporter_id is not None:
+            query = query.where(Finding.reporter_id == reporter_id)
+        result = await self.db.execute(query)
+        return result.scalar_one_or_none()
+
+    async def count_by_reporter(self, reporter_id: uuid.UUID) -> int:
+        """Count findings reported by a user."""
+        result = await self.db.execute(
+            select(func.count()).select_from(Finding).where(Finding.reporter_id == reporter_id)
+        )
+        return result.scalar_one()
+
+    async def list_reporter_summaries(
+        self,
+        reporter_id: uuid.UUID,
+        limit: int,
+        before: tuple[datetime, uuid.UUID] | None = None,
+        description_length: int = 40,
+    ) -> list[Row]:
+        """List a reporter's findings newest first, as lightweight rows.
+
+        Pages by keyset: pass the (reported_at, id) of the last row seen as
+        ``before``. Rows carry id, report_id, severity, status, area_name,
+        reported_at, updated_at and a description prefix one character longer than
+        ``description_length``, so callers can tell when to add an ellipsis.
+        """
+        query = (
+            select(
+                Finding.id,
+                Finding.report_id,
+                Finding.severity,
+                Finding.status,
+                Area.name.label("area_name"),
+                Finding.reported_at,
+                Finding.updated_at,
+                func.substr(Finding.description, 1, description_length + 1).label("description"),
+            )
+            .join(Area, Area.id == Finding.area_id)
+            .where(Finding.reporter_id == reporter_id)
+        )
+        if before is not None:
+            query = query.where(tuple_(Finding.reported_at, Finding.id) < tuple_(*before))
+        query = query.order_by(desc(Finding.reported_at), desc(Finding.id)).limit(limit)
+        result = await self.db.execute(query)
+        return list(result.all())
+
+    async def area_digest_stats(self, start: datetime, end: datetime) -> list[Row]:
+        """Aggregate findings for every area, rolled up over its sub-areas, in one query.
+
+        Rows carry area_id, name, parent_id and counts of findings reported in
+        [start, end) (new_total, new_critical, new_high), closed in that period
+        (closed) and still open at ``end`` (open_now). Areas with no activity and
+        no open findings are left out.
+        """
+        # Pairs every area with itself and each of its descendants
+        closure = select(
+            Area.id.label("ancestor_id"), Area.id.label("area_id")
+        ).cte("closure", recursive=True)
+        closure = closure.union_all(
+            select(closure.c.ancestor_id, Area.id).join(closure, Area.parent_id == closure.c.area_id)
+        )
+
+        reported = and_(Finding.reported_at >= start, Finding.reported_at < end)
+        closed = and_(Finding.closed_at >= start, Finding.closed_at < end)
+        still_open = and_(
+            Finding.status.in_(OPEN_STATUSES), Finding.reported_at < end
+        )
+        stats = (
+            select(
+                closure.c.ancestor_id,
+                func.count().filter(reported).label("new_total"),
+                func.count().filter(reported, Finding.severity == Severity.CRITICAL).label("new_critical"),
+                func.count().filter(reported, Finding.severity == Severity.HIGH).label("new_high"),
+                func.count().filter(closed).label("closed"),
+                func.count().filter(still_open).label("open_now"),
+            )
+            .join(Finding, Finding.area_id == closure.c.area_id)
+            .where(or_(reported, closed, still_open))
+            .group_by(closure.c.ancestor_id)
+            .subquery()
+        )
+        result = await self.db.execute(
+            select(
+                Area.id.label("area_id"),
+                Area.name,
+                Area.parent_id,
+                stats.c.new_total,
+                stats.c.new_critical,
+                stats.c.new_high,
+                stats.c.closed,
+                stats.c.open_now,
+            )
+            .join(stats, stats.c.ancestor_id == Area.id)
+            .order_by(Area.name)
+        )
+        return list(result.all())
+
+    async def trend_counts(
+        self,
+        granularity: TrendGranularity,
+        group_by: TrendGroupBy,
+        tz: str,
+        start: datetime,
+        end: datetime,
+        area_ids: list[uuid.UUID] | None = None,
+        severities: list[Severity] | None = None,
+    ) -> list[Row]:
+        """Count findings reported in [start, end) per local period and group key.
+
+        ``start`` and ``end`` must fall on period boundaries in ``tz``. Every
+        period gets at least one row, with a NULL key and count for periods
+        without findings, in period order.
+        """
+        unit = granularity.value
+        step = literal_column(f"interval '1 {unit}'")
+        key_column = {
+            TrendGroupBy.SEVERITY: Finding.severity,
+            TrendGroupBy.STATUS: Finding.status,
+            TrendGroupBy.AREA: cast(Finding.area_id, String),
+        }[group_by]
+
+        local_bucket = func.date_trunc(unit, func.timezone(tz, Finding.reported_at))
+        filters = [Finding.reported_at >= start, Finding.reported_at < end]
+        if area_ids:
+            filters.append(Finding.area_id.in_(area_ids))
+        if severities:
+            filters.append(Finding.severity.in_(severities))
+        counts = (
+            select(
+                local_bucket.label("bucket"),
+                key_column.label("key"),
+                func.count().label("count"),
+            )
+            .where(*filters)
+            # By output name: the bound parameters make the expressions unequal
+            .group_by(literal_column("bucket"), literal_column("key"))
+            .subquery()
+        )
+
+        # Local period starts from the first to the last, so empty periods still get a row
+        buckets = func.generate_series(
+            func.timezone(tz, cast(start, DateTime(timezone=True))),
+            func.timezone(tz, cast(end, DateTime(timezone=True))) - step,
+            step,
+        ).table_valued("bucket").render_derived()
+        result = await self.db.execute(
+            select(cast(buckets.c.bucket, Date).label("bucket"), counts.c.key, counts.c.count)
+            .select_from(buckets)
+            .outerjoin(counts, counts.c.bucket == buckets.c.bucket)
+            .order_by(buckets.c.bucket)
+        )
+        return list(result.all())
+
     async def create(self, finding_data: dict[str, Any]) -> Finding:
         """Create a new finding."""
         finding = Finding(**finding_data)
@@ -118,13 +324,26 @@ class FindingRepository:
         # Add initial status history
         history = StatusHistory(
             finding_id=finding.id,
+            finding_reported_at=finding.reported_at,
             old_status=None,
             new_status=finding.status.value if hasattr(finding.status, 'value') else str(finding.status),
             notes="Finding created",
             updated_by=finding.reporter_id,
         )
         self.db.add(history)
+        # Fails on a duplicate report ID, which findings cannot enforce
+        self.db.add(FindingKey(
+            finding_id=finding.id, reported_at=finding.reported_at, report_id=finding.report_id
+        ))
+        self.db.add(FindingLifecycle(
+            finding_id=finding.id,
+            finding_reported_at=finding.reported_at,
+            status_since=finding.reported_at,
+        ))
         await self.db.flush()
+        await self._adjust_counters({_counter_key(finding): 1})
+        await self._adjust_daily_counts({finding.reported_at.astimezone(timezone.utc).date(): 1})
+        await self._publish("created", finding)
 
         return finding
 
@@ -137,6 +356,7 @@ class FindingRepository:
     ) -> Finding:
         """Update finding status."""
         old_status = finding.status
+        old_key = _counter_key(finding)
         finding.status = new_status
 
         if new_status == Status.CLOSED:
@@ -145,6 +365,7 @@ class FindingRepository:
         # Add status history
         history = StatusHistory(
             finding_id=finding.id,
+            finding_reported_at=finding.reported_at,
             old_status=old_status,
             new_status=new_status,
             notes=notes,
@@ -152,6 +373,11 @@ class FindingRepository:
         )
         self.db.add(history)
         await self.db.flush()
+        new_key = _counter_key(finding)
+        if new_key != old_key:
+            await self._adjust_counters({old_key: -1, new_key: 1})
+        await self._advance_lifecycle(finding.id, Status(old_status), new_status)
+        await self._publish("status_changed", finding)
 
         return finding
 
@@ -159,8 +385,332 @@ class FindingRepository:
         """Assign finding to a user."""
         finding.assigned_to = assigned_to
         await self.db.flush()
+        await self._publish("assigned", finding)
         return finding
 
+    async def claim_archivable(self, closed_before: datetime, limit: int) -> list[Finding]:
+        """Lock the findings closed longest before a time that are not archived yet.
+
+        Loaded with their history and photos. ``SKIP LOCKED`` lets concurrent
+        archivers take separate batches.
+        """
+        result = await self.db.execute(
+            select(Finding)
+            .options(selectinload(Finding.photos), selectinload(Finding.status_history))
+            .where(
+                Finding.status == Status.CLOSED,
+                Finding.closed_at < closed_before,
+                Finding.archived_at.is_(None),
+            )
+            .order_by(Finding.closed_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True, of=Finding)
+        )
+        return list(result.scalars().all())
+
+    async def tombstone(self, archive_keys: dict[tuple[uuid.UUID, datetime], str]) -> None:
+        """Replace archived findings by tombstones, keyed by (id, reported_at).
+
+        Their history and photo rows are deleted, their text cleared, and their
+        photos' storage keys kept so the objects are not collected as orphans.
+        """
+        keys = list(archive_keys)
+        await self.db.execute(
+            insert(ArchivedPhoto)
+            .from_select(
+                ["s3_key", "finding_id", "finding_reported_at"],
+                select(Photo.s3_key, Photo.finding_id, Photo.finding_reported_at).where(
+                    tuple_(Photo.finding_id, Photo.finding_reported_at).in_(keys)
+                ),
+            )
+            .on_conflict_do_nothing()
+        )
+        await self.db.execute(
+            delete(Photo).where(tuple_(Photo.finding_id, Photo.finding_reported_at).in_(keys))
+        )
+        await self.db.execute(
+            delete(StatusHistory).where(
+                tuple_(StatusHistory.finding_id, StatusHistory.finding_reported_at).in_(keys)
+            )
+        )
+        now = datetime.now(timezone.utc)
+        # Bulk update by primary key, sent as one executemany
+        await self.db.execute(
+            update(Finding),
+            [
+                {
+                    "id": finding_id,
+                    "reported_at": reported_at,
+                    "description": "",
+                    "location": None,
+                    "archived_at": now,
+                    "archive_key": archive_key,
+                    "updated_at": now,
+                }
+                for (finding_id, reported_at), archive_key in archive_keys.items()
+            ],
+        )
+
+    async def _advance_lifecycle(
+        self, finding_id: uuid.UUID, old_status: Status, new_status: Status
+    ) -> None:
+        """Close the finding's time in its old status and start the new one.
+
+        finding_lifecycles is not partitioned, so the ID alone is a primary key lookup.
+        """
+        now = func.now()
+        values: dict[str, Any] = {"status_since": now}
+        column = LIFECYCLE_SECONDS.get(old_status)
+        if column is not None:
+            elapsed = func.extract("epoch", now - FindingLifecycle.status_since)
+            values[column] = getattr(FindingLifecycle, column) + elapsed
+        if new_status in RESOLVED_STATUSES and old_status not in RESOLVED_STATUSES:
+            values["resolved_at"] = now
+        elif new_status not in RESOLVED_STATUSES and old_status in RESOLVED_STATUSES:
+            values["resolved_at"] = None
+            values["reopen_count"] = FindingLifecycle.reopen_count + 1
+        await self.db.execute(
+            update(FindingLifecycle).where(FindingLifecycle.finding_id == finding_id).values(**values)
+        )
+
+    async def resolution_stats(
+        self,
+        group_by: ResolutionGroupBy,
+        sla_hours: dict[Severity, float],
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        area_ids: list[uuid.UUID] | None = None,
+    ) -> list[Row]:
+        """Aggregate resolution times and SLA breaches of findings reported in a range.
+
+        Rows carry key, label, findings, resolved, reopened, the mean, median
+        and 90th percentile seconds to resolve (mttr, p50, p90; over resolved
+        findings), sla_breached (resolved late, or still unresolved past due),
+        and the mean seconds spent open and in progress, counting the current
+        status up to now.
+        """
+        lifecycle = FindingLifecycle
+        to_resolve = func.extract("epoch", lifecycle.resolved_at - Finding.reported_at)
+        due_at = Finding.reported_at + func.make_interval(
+            0, 0, 0, 0, 0, 0, case(
+                *((Finding.severity == severity, hours * 3600) for severity, hours in sla_hours.items())
+            )
+        )
+        breached = or_(
+            lifecycle.resolved_at > due_at,
+            and_(lifecycle.resolved_at.is_(None), func.now() > due_at),
+        )
+
+        def time_in(status: Status) -> Any:
+            column = getattr(lifecycle, LIFECYCLE_SECONDS[status])
+            current = func.extract("epoch", func.now() - lifecycle.status_since)
+            return column + case((Finding.status == status, current), else_=0)
+
+        if group_by == ResolutionGroupBy.AREA:
+            key, label = cast(Finding.area_id, String), Area.name
+        elif group_by == ResolutionGroupBy.ASSIGNEE:
+            key, label = cast(Finding.assigned_to, String), User.full_name
+        else:
+            key, label = Finding.severity, Finding.severity
+
+        query = select(
+            key.label("key"),
+            label.label("label"),
+            func.count().label("findings"),
+            func.count(lifecycle.resolved_at).label("resolved"),
+            func.count().filter(lifecycle.reopen_count > 0).label("reopened"),
+            func.avg(to_resolve).label("mttr"),
+            func.percentile_cont(0.5).within_group(to_resolve).label("p50"),
+            func.percentile_cont(0.9).within_group(to_resolve).label("p90"),
+            func.count().filter(breached).label("sla_breached"),
+            func.avg(time_in(Status.OPEN)).label("open_seconds"),
+            func.avg(time_in(Status.IN_PROGRESS)).label("in_progress_seconds"),
+        ).join(
+            lifecycle,
+            and_(lifecycle.finding_id == Finding.id, lifecycle.finding_reported_at == Finding.reported_at),
+        )
+        if group_by == ResolutionGroupBy.AREA:
+            query = query.join(Area, Area.id == Finding.area_id)
+        elif group_by == ResolutionGroupBy.ASSIGNEE:
+            query = query.outerjoin(User, User.id == Finding.assigned_to)
+
+        if date_from:
+            query = query.where(Finding.reported_at >= date_from)
+        if date_to:
+            query = query.where(Finding.reported_at <= date_to)
+        if area_ids:
+            query = query.where(Finding.area_id.in_(area_ids))
+        result = await self.db.execute(query.group_by(key, label).order_by(label))
+        return list(result.all())
+
+    async def _adjust_counters(self, deltas: dict[CounterKey, int]) -> None:
+        """Add to the finding counters in this transaction."""
+        # Rows are locked in key order, so concurrent writers cannot deadlock
+        rows = [
+            {"area_id": area_id, "status": status, "severity": severity, "count": delta}
+            for (area_id, status, severity), delta in sorted(
+                deltas.items(), key=lambda item: (str(item[0][0]), item[0][1], item[0][2])
+            )
+            if delta
+        ]
+        if not rows:
+            return
+        stmt = insert(FindingCounter).values(rows)
+        await self.db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[FindingCounter.area_id, FindingCounter.status, FindingCounter.severity],
+                set_={"count": FindingCounter.count + stmt.excluded.count},
+            )
+        )
+
+    async def _adjust_daily_counts(self, deltas: dict[date, int]) -> None:
+        """Add to the findings reported per day in this transaction."""
+        rows = [{"day": day, "count": delta} for day, delta in sorted(deltas.items()) if delta]
+        if not rows:
+            return
+        stmt = insert(FindingDailyCount).values(rows)
+        await self.db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[FindingDailyCount.day],
+                set_={"count": FindingDailyCount.count + stmt.excluded.count},
+            )
+        )
+
+    async def get_counters(self) -> list[Row]:
+        """Get the non-zero finding counters with their area names."""
+        result = await self.db.execute(
+            select(
+                FindingCounter.area_id,
+                Area.name.label("area_name"),
+                FindingCounter.status,
+                FindingCounter.severity,
+                FindingCounter.count,
+            )
+            .join(Area, Area.id == FindingCounter.area_id)
+            .where(FindingCounter.count != 0)
+        )
+        return list(result.all())
+
+    async def get_daily_counts(self, since: date) -> dict[date, int]:
+        """Get the number of findings reported per UTC day since a day."""
+        result = await self.db.execute(
+            select(FindingDailyCount.day, FindingDailyCount.count).where(FindingDailyCount.day >= since)
+        )
+        return {row.day: row.count for row in result.all()}
+
+    async def get_oldest_open_critical(self) -> Row | None:
+        """Get the open critical finding reported first, with its area name."""
+        result = await self.db.execute(
+            select(
+                Finding.id,
+                Finding.report_id,
+                Finding.area_id,
+                Area.name.label("area_name"),
+                Finding.reported_at,
+            )
+            .join(Area, Area.id == Finding.area_id)
+            .where(Finding.severity == Severity.CRITICAL, Finding.status.in_(OPEN_STATUSES))
+            .order_by(Finding.reported_at)
+            .limit(1)
+        )
+        return result.first()
+
+    async def count_counter_drift(self) -> tuple[dict[CounterKey, int], dict[date, int]]:
+        """Compare the counters with a recount of findings, in one scan.
+
+        Run in a REPEATABLE READ transaction: each write changes findings and
+        counters together, so within one snapshot any difference is drift, and
+        nothing needs locking. Returns the corrections to add, by counter key
+        and by day.
+        """
+        reported_day = func.date(func.timezone("UTC", Finding.reported_at))
+        actual = await self.db.execute(
+            select(
+                func.grouping(reported_day).label("by_key"),
+                Finding.area_id,
+                Finding.status,
+                Finding.severity,
+                reported_day.label("day"),
+                func.count().label("count"),
+            )
+            .group_by(func.grouping_sets(
+                tuple_(Finding.area_id, Finding.status, Finding.severity),
+                tuple_(reported_day),
+            ))
+        )
+        deltas: dict[CounterKey, int] = {}
+        day_deltas: dict[date, int] = {}
+        for row in actual.all():
+            if row.by_key:
+                deltas[(row.area_id, row.status, row.severity)] = row.count
+            else:
+                day_deltas[row.day] = row.count
+
+        stored = await self.db.execute(
+            select(
+                FindingCounter.area_id,
+                FindingCounter.status,
+                FindingCounter.severity,
+                FindingCounter.count,
+            )
+        )
+        for area_id, status, severity, count in stored.all():
+            key = (area_id, status, severity)
+            deltas[key] = deltas.get(key, 0) - count
+        stored_days = await self.db.execute(select(FindingDailyCount.day, FindingDailyCount.count))
+        for day, count in stored_days.all():
+            day_deltas[day] = day_deltas.get(day, 0) - count
+
+        return (
+            {key: delta for key, delta in deltas.items() if delta},
+            {day: delta for day, delta in day_deltas.items() if delta},
+        )
+
+    async def correct_counters(
+        self, deltas: dict[CounterKey, int], day_deltas: dict[date, int]
+    ) -> None:
+        """Add drift corrections to the counters.
+
+        Corrections are added like any write's own changes, so they can be
+        applied after the snapshot they were counted in, alongside new writes.
+        """
+        await self._adjust_counters(deltas)
+        await self._adjust_daily_counts(day_deltas)
+        await self.db.execute(delete(FindingCounter).where(FindingCounter.count == 0))
+        await self.db.execute(delete(FindingDailyCount).where(FindingDailyCount.count == 0))
+
+    async def _publish(self, event_type: str, finding: Finding) -> None:
+        """Record a finding change for the outbox and live feeds.
+
+        Both take effect only if this transaction commits.
+        """
+        delta = FindingDelta.model_validate(finding)
+        OutboxRepository(self.db).add(
+            f"finding.{event_type}", finding.id, delta.model_dump(mode="json")
+        )
+
+        payload = delta.model_dump_json()
+        partial = len(payload.encode()) > MAX_EVENT_FINDING_BYTES
+        if partial:
+            payload = delta.model_dump_json(exclude={"description", "location"})
+        # Event IDs come from a sequence so they are unique across processes
+        await self.db.execute(
+            text("""
+                SELECT pg_notify(:channel, jsonb_build_object(
+                    'id', nextval('finding_event_seq'),
+                    'type', CAST(:type AS text),
+                    'partial', CAST(:partial AS boolean),
+                    'finding', CAST(:finding AS jsonb)
+                )::text)
+            """),
+            {
+                "channel": FINDING_EVENTS_CHANNEL,
+                "type": event_type,
+                "partial": partial,
+                "finding": payload,
+            },
+        )
+
     def generate_report_id(self, year: int) -> str:
         """Generate a unique report ID."""
         # This should query for the highest sequential number in the year
@@ -168,35 +718,19 @@ class FindingRepository:
         return f"SF-{year:04d}-0001"
 
     async def get_next_report_id(self) -> str:
-        """Get the next sequential report ID with concurrency safety."""
-        from sqlalchemy import text
+        """Allocate the next sequential report ID of the current year.
 
+        The year's counter row stays locked until this transaction ends, so
+        concurrent reports get consecutive numbers.
+        """
         year = datetime.now().year
-        prefix = f"SF-{year:04d}-"
-
-        # Use a more robust approach with row-level locking
-        # This prevents race conditions when multiple requests come in simultaneously
-        result = await self.db.execute(
-            text("""
-                SELECT report_id
-                FROM findings
-                WHERE report_id LIKE :prefix
-                ORDER BY report_id DESC
-                LIMIT 1
-                FOR UPDATE SKIP LOCKED
-            """),
-            {"prefix": f"{prefix}%"}
+        number = await self.db.scalar(
+            insert(ReportIdCounter)
+            .values(year=year, last_number=1)
+            .on_conflict_do_update(
+                index_elements=[ReportIdCounter.year],
+                set_={"last_number": ReportIdCounter.last_number + 1},
+            )
+            .returning(ReportIdCounter.last_number)
         )
-        last_id = result.scalar_one_or_none()
-
-        if last_id:
-            # Extract and increment the sequential number
-            try:
-                last_seq = int(last_id.split("-")[-1])
-                next_seq = last_seq + 1
-            except (ValueError, IndexError):
-                next_seq = 1
-        else:
-            next_seq = 1
-
-        return f"{prefix}{next_seq:04d}"
+        return f"SF-{year:04d}-{number:04d}"
@@ -0,0 +1,219 @@
+"""Background job repository."""
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Row, and_, case, delete, func, select, text, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.job import Job, JobSchedule, JobStatus
+
+# Postgres NOTIFY channel waking idle job workers when a job is enqueued
+JOBS_CHANNEL = "jobs_enqueued"
+
+
+class JobRepository:
+    """Repository for Job model operations."""
+
+    def __init__(self, db: AsyncSession) -> None:
+        """Initialize repository."""
+        self.db = db
+
+    async def enqueue(
+        self,
+        name: str,
+        payload: dict[str, Any],
+        *,
+        priority: int,
+        max_attempts: int,
+        timeout_seconds: int,
+        run_at: datetime | None = None,
+        key: str | None = None,
+    ) -> int | None:
+        """Add a job; it becomes visible to workers when the transaction commits.
+
+        Returns the job ID, or None if a job with the same key already exists.
+        """
+        values = {
+            "name": name,
+            "payload": payload,
+            "priority": priority,
+            "max_attempts": max_attempts,
+            "timeout_seconds": timeout_seconds,
+            "key": key,
+        }
+        if run_at is not None:
+            values["run_at"] = run_at
+        job_id = await self.db.scalar(
+            insert(Job).values(**values).on_conflict_do_nothing(index_elements=[Job.key]).returning(Job.id)
+        )
+        if job_id is not None:
+            # Delivered on commit, and only once per transaction however many jobs it adds
+            await self.db.execute(text("SELECT pg_notify(:channel, '')"), {"channel": JOBS_CHANNEL})
+        return job_id
+
+    async def claim(self, limit: int, worker_id: str) -> list[Job]:
+        """Mark the next due jobs as running by this worker and return them.
+
+        ``SKIP LOCKED`` lets workers claim concurrently without waiting on each
+        other. Each job stays claimed for its own timeout.
+        """
+        due = (
+            select(Job.id)
+            .where(Job.status == JobStatus.QUEUED, Job.run_at <= func.now())
+            .order_by(Job.priority.desc(), Job.run_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        result = await self.db.execute(
+            update(Job)
+            .where(Job.id.in_(due))
+            .values(
+                status=JobStatus.RUNNING,
+                attempts=Job.attempts + 1,
+                locked_by=worker_id,
+                locked_until=func.now() + func.make_interval(0, 0, 0, 0, 0, 0, Job.timeout_seconds),
+                updated_at=func.now(),
+            )
+            .returning(Job)
+            .execution_options(synchronize_session=False)
+        )
+        return list(result.scalars().all())
+
+    async def complete(self, job_ids: list[int], worker_id: str) -> None:
+        """Delete finished jobs still claimed by this worker."""
+        await self.db.execute(
+            delete(Job).where(
+                Job.id.in_(job_ids),
+                Job.status == JobStatus.RUNNING,
+                Job.locked_by == worker_id,
+            )
+        )
+
+    async def fail(
+        self, job_id: int, worker_id: str, error: str, retry_at: datetime | None
+    ) -> None:
+        """Requeue a failed job for ``retry_at``, or mark it failed for good if None."""
+        await self.db.execute(
+            update(Job)
+            .where(Job.id == job_id, Job.status == JobStatus.RUNNING, Job.locked_by == worker_id)
+            .values(
+                status=JobStatus.QUEUED if retry_at is not None else JobStatus.FAILED,
+                run_at=retry_at if retry_at is not None else Job.run_at,
+                last_error=error,
+                locked_by=None,
+                locked_until=None,
+                updated_at=func.now(),
+            )
+        )
+
+    async def release(self, job_ids: list[int], worker_id: str) -> None:
+        """Requeue jobs a stopping worker did not finish, without counting the attempt."""
+        await self.db.execute(
+            update(Job)
+            .where(
+                Job.id.in_(job_ids),
+                Job.status == JobStatus.RUNNING,
+                Job.locked_by == worker_id,
+            )
+            .values(
+                status=JobStatus.QUEUED,
+                attempts=Job.attempts - 1,
+                locked_by=None,
+                locked_until=None,
+                updated_at=func.now(),
+            )
+        )
+
+    async def requeue_expired(self) -> int:
+        """Hand out again the running jobs past their timeout, e.g. of a crashed worker.
+
+        Jobs out of attempts are marked failed instead. Returns the number of jobs.
+        """
+        result = await self.db.execute(
+            update(Job)
+            .where(Job.status == JobStatus.RUNNING, Job.locked_until < func.now())
+            .values(
+                status=case(
+                    (Job.attempts >= Job.max_attempts, JobStatus.FAILED.value),
+                    else_=JobStatus.QUEUED.value,
+                ),
+                last_error="Timed out; the worker may have stopped",
+                locked_by=None,
+                locked_until=None,
+                updated_at=func.now(),
+            )
+            .returning(Job.id)
+        )
+        return len(result.all())
+
+    async def fire_schedule(self, name: str, fire_at: datetime) -> bool:
+        """Record that a schedule fired, unless a worker already did.
+
+        Returns True for exactly one caller per schedule and fire time.
+        """
+        fired = await self.db.scalar(
+            insert(JobSchedule)
+            .values(name=name, last_fire_at=fire_at)
+            .on_conflict_do_update(
+                index_elements=[JobSchedule.name],
+                set_={"last_fire_at": fire_at},
+                where=JobSchedule.last_fire_at < fire_at,
+            )
+            .returning(JobSchedule.name)
+        )
+        return fired is not None
+
+    async def stats(self) -> list[Row]:
+        """Count jobs by name and status, with the oldest due job of each group."""
+        result = await self.db.execute(
+            select(
+                Job.name,
+                Job.status,
+                func.count().label("count"),
+                func.min(Job.run_at).filter(Job.run_at <= func.now()).label("oldest_due_at"),
+            )
+            .group_by(Job.name, Job.status)
+            .order_by(Job.name, Job.status)
+        )
+        return list(result.all())
+
+    async def list_failed(
+        self, name: str | None = None, offset: int = 0, limit: int = 50
+    ) -> tuple[list[Job], int]:
+        """List failed jobs, most recent first."""
+        query = select(Job).where(Job.status == JobStatus.FAILED)
+        if name:
+            query = query.where(Job.name == name)
+
+        count_query = select(func.count()).select_from(query.subquery())
+        total = (await self.db.execute(count_query)).scalar() or 0
+
+        query = query.order_by(Job.updated_at.desc()).offset(offset).limit(limit)
+        result = await self.db.execute(query)
+        return list(result.scalars().all()), total
+
+    async def retry(self, job_id: int) -> Job | None:
+        """Requeue a failed job with fresh attempts, or None if it is not failed."""
+        job = await self.db.scalar(
+            select(Job).where(and_(Job.id == job_id, Job.status == JobStatus.FAILED))
+        )
+        if job is None:
+            return None
+        job.status = JobStatus.QUEUED
+        job.attempts = 0
+        job.run_at = func.now()
+        await self.db.flush()
+        await self.db.refresh(job)
+        await self.db.execute(text("SELECT pg_notify(:channel, '')"), {"channel": JOBS_CHANNEL})
+        return job
+
+    async def purge_failed(self, before: datetime) -> int:
+        """Delete jobs that failed before a time. Returns the number deleted."""
+        result = await self.db.execute(
+            delete(Job)
+            .where(Job.status == JobStatus.FAILED, Job.updated_at < before)
+            .returning(Job.id)
+        )
+        return len(result.all())
@@ -0,0 +1,49 @@
+"""Notification preference repository."""
+import uuid
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+
+from app.models.notification_preference import NotificationPreference
+
+
+class NotificationPreferenceRepository:
+    """Repository for NotificationPreference model operations."""
+
+    def __init__(self, db: AsyncSession) -> None:
+        """Initialize repository."""
+        self.db = db
+
+    async def get(self, user_id: uuid.UUID) -> NotificationPreference | None:
+        """Get a user's preferences, or None if they never changed the defaults."""
+        result = await self.db.execute(
+            select(NotificationPreference).where(NotificationPreference.user_id == user_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def upsert(self, user_id: uuid.UUID, data: dict[str, Any]) -> NotificationPreference:
+        """Create or update a user's preferences with the given fields."""
+        # A new row starts from the deployment's digest time, like users without one
+        statement = insert(NotificationPreference).values(
+            user_id=user_id, **{"daily_summary_time": settings.DAILY_SUMMARY_TIME, **data}
+        )
+        if data:
+            statement = statement.on_conflict_do_update(
+                index_elements=[NotificationPreference.user_id],
+                set_={**data, "updated_at": statement.excluded.updated_at},
+            )
+        else:
+            statement = statement.on_conflict_do_nothing()
+        await self.db.execute(statement)
+        await self.db.flush()
+        # The upsert bypasses the identity map, so reload what is stored
+        result = await self.db.execute(
+            select(NotificationPreference)
+            .where(NotificationPreference.user_id == user_id)
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one()
@@ -0,0 +1,94 @@
+"""Outbox repository."""
+import uuid
+from typing import Any
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.outbox import OutboxEvent
+
+
+class OutboxRepository:
+    """Repository for OutboxEvent model operations."""
+
+    def __init__(self, db: AsyncSession) -> None:
+        """Initialize repository."""
+        self.db = db
+
+    def add(self, event_type: str, aggregate_id: uuid.UUID, payload: dict[str, Any]) -> None:
+        """Record an event; it is written when the session's transaction commits."""
+        self.db.add(OutboxEvent(event_type=event_type, aggregate_id=aggregate_id, payload=payload))
+
+    async def claim(self, limit: int, lease_seconds: float) -> list[OutboxEvent]:
+        """Lease a batch of due events that no other dispatcher holds.
+
+        Each event is pushed back by ``lease_seconds``, so other dispatchers skip
+        it once the transaction commits, and take it over if it is not settled
+        by then. The returned ``available_at`` identifies the lease when settling.
+        """
+        due = (
+            select(OutboxEvent.id)
+            .where(
+                OutboxEvent.dead_at.is_(None),
+                OutboxEvent.available_at <= func.now(),
+            )
+            .order_by(OutboxEvent.available_at, OutboxEvent.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        result = await self.db.execute(
+            update(OutboxEvent)
+            .where(OutboxEvent.id.in_(due))
+            .values(available_at=func.now() + func.make_interval(0, 0, 0, 0, 0, 0, lease_seconds))
+            .returning(OutboxEvent)
+            .execution_options(synchronize_session=False)
+        )
+        return list(result.scalars().all())
+
+    async def complete(self, event: OutboxEvent) -> bool:
+        """Remove an event whose handlers all succeeded.
+
+        Returns False if its lease ran out and another dispatcher took it over.
+        """
+        result = await self.db.execute(delete(OutboxEvent).where(*_leased(event)))
+        return result.rowcount > 0
+
+    async def retry(self, event: OutboxEvent, completed: list[str], error: str, delay: float) -> bool:
+        """Schedule a failed event to be tried again, skipping its ``completed`` handlers.
+
+        Returns False if its lease ran out and another dispatcher took it over.
+        """
+        result = await self.db.execute(
+            update(OutboxEvent)
+            .where(*_leased(event))
+            .values(
+                attempts=OutboxEvent.attempts + 1,
+                completed=completed,
+                last_error=error,
+                available_at=func.now() + func.make_interval(0, 0, 0, 0, 0, 0, delay),
+            )
+        )
+        return result.rowcount > 0
+
+    async def bury(self, event: OutboxEvent, completed: list[str], error: str) -> bool:
+        """Give up on an event, keeping it for inspection.
+
+        Returns False if its lease ran out and another dispatcher took it over.
+        """
+        result = await self.db.execute(
+            update(OutboxEvent)
+            .where(*_leased(event))
+            .values(
+                attempts=OutboxEvent.attempts + 1,
+                completed=completed,
+                last_error=error,
+                dead_at=func.now(),
+            )
+        )
+        return result.rowcount > 0
+
+
+def _leased(event: OutboxEvent) -> tuple:
+    """Match an event only while it still holds the lease it was claimed with."""
+    return OutboxEvent.id == event.id, OutboxEvent.available_at == event.available_at
@@ -0,0 +1,29 @@
+"""Photo repository."""
+from sqlalchemy import select, union
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.archived_photo import ArchivedPhoto
+from app.models.photo import Photo
+
+
+class PhotoRepository:
+    """Repository for Photo model operations."""
+
+    def __init__(self, db: AsyncSession) -> None:
+        """Initialize repository."""
+        self.db = db
+
+    async def get_referenced_keys(self, s3_keys: list[str]) -> set[str]:
+        """Get the storage keys, among ``s3_keys``, that a photo or archived photo references.
+
+        One statement, so a key moving to the archive is seen in one place or the other.
+        """
+        if not s3_keys:
+            return set()
+        result = await self.db.execute(
+            union(
+                select(Photo.s3_key).where(Photo.s3_key.in_(s3_keys)),
+                select(ArchivedPhoto.s3_key).where(ArchivedPhoto.s3_key.in_(s3_keys)),
+            )
+        )
+        return set(result.scalars().all())
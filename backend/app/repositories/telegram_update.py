@@ -0,0 +1,47 @@
+"""Webhook update queue repository."""
+from typing import Any
+
+from sqlalchemy import delete, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.telegram_update import TelegramUpdate
+
+# Postgres NOTIFY channel waking the replica running the bot when an update arrives
+TELEGRAM_UPDATES_CHANNEL = "telegram_updates"
+
+
+class TelegramUpdateRepository:
+    """Repository for TelegramUpdate model operations."""
+
+    def __init__(self, db: AsyncSession) -> None:
+        """Initialize repository."""
+        self.db = db
+
+    async def add(self, update_id: int, payload: dict[str, Any]) -> None:
+        """Queue an update; the bot sees it when the transaction commits.
+
+        An update Telegram delivers again is stored only once.
+        """
+        await self.db.execute(
+            insert(TelegramUpdate)
+            .values(update_id=update_id, payload=payload)
+            .on_conflict_do_nothing(index_elements=[TelegramUpdate.update_id])
+        )
+        await self.db.execute(text("SELECT pg_notify(:channel, '')"), {"channel": TELEGRAM_UPDATES_CHANNEL})
+
+    async def take(self, limit: int) -> list[dict[str, Any]]:
+        """Remove the oldest queued updates and return their payloads in the order Telegram sent them."""
+        oldest = (
+            select(TelegramUpdate.update_id)
+            .order_by(TelegramUpdate.update_id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        result = await self.db.execute(
+            delete(TelegramUpdate)
+            .where(TelegramUpdate.update_id.in_(oldest))
+            .returning(TelegramUpdate.update_id, TelegramUpdate.payload)
+        )
+        return [payload for _, payload in sorted(result.all())]
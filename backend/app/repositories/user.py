@@ -2,10 +2,16 @@
 import uuid
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import Row, delete, func, insert, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.area import Area
+from app.models.notification_preference import NotificationPreference
 from app.models.user import Role, User
+from app.models.user_area import UserArea
+
+# Postgres NOTIFY channel carrying the Telegram ID of a changed user
+USER_CHANGED_CHANNEL = "user_changed"
 
 
 class UserRepository:
@@ -17,11 +23,20 @@ class UserRepository:
 
     async def get_by_id(self, user_id: str | uuid.UUID) -> User | None:
         """Get user by ID."""
+        if isinstance(user_id, str):
+            user_id = uuid.UUID(user_id)
         result = await self.db.execute(
-            select(User).where(User.id == uuid.UUID(user_id))
+            select(User).where(User.id == user_id)
         )
         return result.scalar_one_or_none()
 
+    async def get_by_ids(self, user_ids: list[uuid.UUID]) -> dict[uuid.UUID, User]:
+        """Get users by ID, keyed by ID."""
+        if not user_ids:
+            return {}
+        result = await self.db.execute(select(User).where(User.id.in_(user_ids)))
+        return {user.id: user for user in result.scalars().all()}
+
     async def get_by_staff_id(self, staff_id: str) -> User | None:
         """Get user by staff ID."""
         result = await self.db.execute(
@@ -73,26 +88,123 @@ class UserRepository:
         user = User(**user_data)
         self.db.add(user)
         await self.db.flush()
+        await self.notify_changed(user)
         return user
 
     async def update(self, user: User, update_data: dict[str, Any]) -> User:
         """Update a user."""
+        previous_telegram_id = user.telegram_id
         for field, value in update_data.items():
             if hasattr(user, field) and value is not None:
                 setattr(user, field, value)
         await self.db.flush()
+        await self.notify_changed(user, previous_telegram_id)
         return user
 
     async def delete(self, user: User) -> None:
         """Delete (soft delete) a user."""
         user.is_active = False
         await self.db.flush()
+        await self.notify_changed(user)
+
+    async def notify_changed(self, user: User, previous_telegram_id: int | None = None) -> None:
+        """Tell bot processes to reload the user once this transaction commits.
+
+        Pass the user's Telegram ID from before the change, so a moved or
+        unlinked Telegram account is reloaded as well.
+        """
+        for telegram_id in sorted({user.telegram_id, previous_telegram_id} - {None}):
+            await self.db.execute(
+                text("SELECT pg_notify(:channel, :payload)"),
+                {"channel": USER_CHANGED_CHANNEL, "payload": str(telegram_id)},
+            )
 
     async def get_admins_for_area(self, area_id: uuid.UUID) -> list[User]:
-        """Get all admins assigned to a specific area."""
-        # This will need to join with user_areas table when implemented
-        # For now, return all admins
+        """Get active admins reachable on Telegram who cover an area.
+
+        An admin assigned to an area also covers its sub-areas. Findings in areas
+        nobody is assigned to go to the super-admins instead.
+        """
+        ancestors = (
+            select(Area.id, Area.parent_id)
+            .where(Area.id == area_id)
+            .cte("ancestors", recursive=True)
+        )
+        ancestors = ancestors.union_all(
+            select(Area.id, Area.parent_id).join(ancestors, Area.id == ancestors.c.parent_id)
+        )
+        reachable = (User.is_active.is_(True), User.telegram_id.is_not(None))
+
+        result = await self.db.execute(
+            select(User)
+            .join(UserArea, UserArea.user_id == User.id)
+            .where(
+                UserArea.area_id.in_(select(ancestors.c.id)),
+                User.role.in_([Role.ADMIN, Role.SUPER_ADMIN]),
+                *reachable,
+            )
+            .distinct()
+        )
+        admins = list(result.scalars().all())
+        if admins:
+            return admins
+
         result = await self.db.execute(
-            select(User).where(User.role.in_([Role.ADMIN, Role.SUPER_ADMIN]))
+            select(User).where(User.role == Role.SUPER_ADMIN, *reachable)
         )
         return list(result.scalars().all())
+
+    async def list_subscriptions(self) -> list[Row]:
+        """List active admins reachable on Telegram, with their areas and preferences.
+
+        Rows carry id, telegram_id, role, area_ids (empty when unassigned) and the
+        new_finding, status_change, daily_summary and weekly_summary flags, which
+        default to on for admins who never changed them, and daily_summary_time,
+        None for those admins.
+        """
+        flags = [
+            func.coalesce(column, True).label(column.key)
+            for column in (
+                NotificationPreference.new_finding,
+                NotificationPreference.status_change,
+                NotificationPreference.daily_summary,
+                NotificationPreference.weekly_summary,
+            )
+        ]
+        result = await self.db.execute(
+            select(
+                User.id,
+                User.telegram_id,
+                User.role,
+                func.array_remove(func.array_agg(UserArea.area_id), None).label("area_ids"),
+                *flags,
+                NotificationPreference.daily_summary_time,
+            )
+            .outerjoin(UserArea, UserArea.user_id == User.id)
+            .outerjoin(NotificationPreference, NotificationPreference.user_id == User.id)
+            .where(
+                User.role.in_([Role.ADMIN, Role.SUPER_ADMIN]),
+                User.is_active.is_(True),
+                User.telegram_id.is_not(None),
+            )
+            .group_by(User.id, NotificationPreference.user_id)
+        )
+        return list(result.all())
+
+    async def get_area_ids(self, user_id: uuid.UUID) -> list[uuid.UUID]:
+        """Get the IDs of the areas a user is assigned to."""
+        result = await self.db.execute(
+            select(UserArea.area_id).where(UserArea.user_id == user_id)
+        )
+        return list(result.scalars().all())
+
+    async def set_areas(self, user: User, area_ids: list[uuid.UUID]) -> None:
+        """Replace the areas a user is assigned to."""
+        await self.db.execute(delete(UserArea).where(UserArea.user_id == user.id))
+        if area_ids:
+            await self.db.execute(
+                insert(UserArea),
+                [{"user_id": user.id, "area_id": area_id} for area_id in dict.fromkeys(area_ids)],
+            )
+        await self.db.flush()
+        await self.notify_changed(user)
@@ -7,10 +7,12 @@ from app.schemas.finding import (
     Severity,
     Status,
 )
+from app.schemas.notification import NotificationSettings, NotificationType
 from app.schemas.user import (
     LoginRequest,
     LoginResponse,
     Role,
+    UserAreas,
     UserCreate,
     UserResponse,
     UserUpdate,
@@ -20,6 +22,7 @@ __all__ = [
     "UserCreate",
     "UserResponse",
     "UserUpdate",
+    "UserAreas",
     "Role",
     "LoginRequest",
     "LoginResponse",
@@ -29,4 +32,6 @@ __all__ = [
     "FindingStatusUpdate",
     "Severity",
     "Status",
+    "NotificationSettings",
+    "NotificationType",
 ]
@@ -1,6 +1,6 @@
 """Finding schemas."""
 import uuid
-from datetime import datetime
+from datetime import date, datetime
 from enum import Enum
 
 from pydantic import BaseModel, Field
@@ -139,6 +139,7 @@ class FindingResponse(FindingBase):
     assigned_to: uuid.UUID | None
     created_at: datetime
     updated_at: datetime
+    archived_at: datetime | None = None
 
     # Nested relations
     reporter: UserRef | None = None
@@ -150,6 +151,137 @@ class FindingResponse(FindingBase):
     model_config = {"from_attributes": True}
 
 
+class FindingDelta(BaseModel):
+    """Finding fields sent to live feeds, without relations."""
+
+    id: uuid.UUID
+    report_id: str
+    reporter_id: uuid.UUID
+    area_id: uuid.UUID
+    description: str
+    severity: Severity
+    status: Status
+    location: str | None
+    reported_at: datetime
+    closed_at: datetime | None
+    assigned_to: uuid.UUID | None
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class AreaCount(BaseModel):
+    """Number of findings in one area."""
+
+    area_id: uuid.UUID
+    area_name: str
+    count: int
+
+
+class FindingAge(BaseModel):
+    """A finding singled out on the dashboard."""
+
+    id: uuid.UUID
+    report_id: str
+    area_id: uuid.UUID
+    area_name: str
+    reported_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class FindingStats(BaseModel):
+    """Dashboard totals, read from the finding counters."""
+
+    total: int
+    by_status: dict[Status, int]
+    by_severity: dict[Severity, int]
+    # Open and in-progress findings per area, most first
+    open_by_area: list[AreaCount]
+    # Reported since midnight UTC, and since Monday midnight UTC
+    reported_today: int
+    reported_this_week: int
+    oldest_open_critical: FindingAge | None
+
+
+class TrendGranularity(str, Enum):
+    """Length of one trend bucket."""
+
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+
+
+class TrendGroupBy(str, Enum):
+    """Dimension trend series are split by."""
+
+    SEVERITY = "severity"
+    STATUS = "status"
+    AREA = "area"
+
+
+class TrendSeries(BaseModel):
+    """Findings reported per bucket for one severity, status or area."""
+
+    key: str
+    label: str
+    counts: list[int]
+    total: int
+
+
+class FindingTrends(BaseModel):
+    """Gap-filled series of findings reported per period."""
+
+    granularity: TrendGranularity
+    group_by: TrendGroupBy
+    timezone: str
+    # Widened to whole periods, both included
+    date_from: date
+    date_to: date
+    # Local start date of each bucket; every series has one count per bucket
+    buckets: list[date]
+    series: list[TrendSeries]
+
+
+class ResolutionGroupBy(str, Enum):
+    """Dimension resolution statistics are split by."""
+
+    AREA = "area"
+    SEVERITY = "severity"
+    ASSIGNEE = "assignee"
+
+
+class ResolutionGroup(BaseModel):
+    """Resolution times and SLA breaches of one area, severity or assignee."""
+
+    # None for unassigned findings
+    key: str | None
+    label: str
+    findings: int
+    resolved: int
+    reopened: int
+    # Hours from report to resolution, over resolved findings
+    mttr_hours: float | None
+    p50_hours: float | None
+    p90_hours: float | None
+    sla_breached: int
+    sla_breach_rate: float
+    # Mean hours spent in each status, including the current one so far
+    open_hours: float
+    in_progress_hours: float
+
+
+class ResolutionStats(BaseModel):
+    """Resolution analytics of findings reported in a range."""
+
+    group_by: ResolutionGroupBy
+    date_from: datetime | None
+    date_to: datetime | None
+    sla_hours: dict[Severity, float]
+    groups: list[ResolutionGroup]
+
+
 class FindingListResponse(BaseModel):
     """Finding list response schema."""
 
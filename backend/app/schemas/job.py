@@ -0,0 +1,45 @@
+"""Background job schemas."""
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel
+
+from app.models.job import JobStatus
+
+
+class JobResponse(BaseModel):
+    """Job response model."""
+
+    id: int
+    name: str
+    payload: dict[str, Any]
+    priority: int
+    status: JobStatus
+    run_at: datetime
+    attempts: int
+    max_attempts: int
+    last_error: str | None
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class JobCount(BaseModel):
+    """Jobs of one name in one status."""
+
+    name: str
+    status: JobStatus
+    count: int
+    oldest_due_at: datetime | None
+
+
+class JobStats(BaseModel):
+    """Queue depth and failures."""
+
+    queued: int
+    running: int
+    failed: int
+    # Seconds the oldest due queued job has waited; grows when workers fall behind
+    max_wait_seconds: float
+    by_name: list[JobCount]
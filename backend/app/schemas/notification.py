@@ -0,0 +1,27 @@
+"""Notification schemas."""
+from enum import Enum
+
+from pydantic import BaseModel, Field
+
+from app.core.config import settings
+
+
+class NotificationType(str, Enum):
+    """Notification types."""
+
+    NEW_FINDING = "new_finding"
+    STATUS_CHANGE = "status_change"
+    DAILY_SUMMARY = "daily_summary"
+    WEEKLY_SUMMARY = "weekly_summary"
+
+
+class NotificationSettings(BaseModel):
+    """Notification settings model."""
+
+    new_finding: bool = True
+    status_change: bool = True
+    daily_summary: bool = True
+    weekly_summary: bool = True
+    daily_summary_time: str = Field(settings.DAILY_SUMMARY_TIME, pattern=r"^([01]\d|2[0-3]):[0-5]\d$")
+
+    model_config = {"from_attributes": True}
@@ -65,6 +65,12 @@ class UserResponse(UserBase):
     model_config = {"from_attributes": True}
 
 
+class UserAreas(BaseModel):
+    """Areas an admin is responsible for, including their sub-areas."""
+
+    area_ids: list[uuid.UUID] = Field(default_factory=list, max_length=500)
+
+
 class LoginRequest(BaseModel):
     """Login request schema."""
 
@@ -0,0 +1,222 @@
+"""Cold archive of findings closed long ago.
+
+Findings closed more than ``ARCHIVE_AFTER_MONTHS`` ago are written, with their
+status history and photo metadata, to zstd-compressed JSON Lines files under
+``ARCHIVE_PREFIX/year=YYYY/area=<area_id>/``, one file per batch, report year
+and area, in S3 or a local directory. The finding row stays behind as a
+tombstone holding what counters, trends and analytics need plus its file's key,
+and reads restore the rest from the file. Files are written before the
+tombstones commit, so a crash leaves at worst an unreferenced file, never a
+tombstone without its data.
+"""
+import asyncio
+import json
+import logging
+import os
+import uuid
+from collections import OrderedDict, defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import zstandard
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.core.config import settings
+from app.core.metrics import Counter
+from app.models.finding import Finding
+from app.models.photo import Photo
+from app.models.status_history import StatusHistory
+from app.repositories.finding import FindingRepository
+from app.repositories.user import UserRepository
+from app.schemas.finding import FindingDelta, Photo as PhotoSchema, StatusHistoryEntry
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_FINDINGS = Counter(
+    "finding_archive_findings_total",
+    "Findings written to or restored from the cold archive",
+    labelnames=("operation",),
+)
+
+CONTENT_TYPE = "application/zstd"
+
+
+class S3ArchiveStore:
+    """Archive files in the photo bucket."""
+
+    def put(self, key: str, data: bytes) -> None:
+        """Write a file."""
+        # Imported here so only processes that touch the archive connect to S3
+        from app.services.storage import storage_service
+
+        storage_service.put_bytes(key, data, CONTENT_TYPE)
+
+    def get(self, key: str) -> bytes:
+        """Read a file."""
+        from app.services.storage import storage_service
+
+        return storage_service.get_bytes(key)
+
+
+class LocalArchiveStore:
+    """Archive files in a local directory."""
+
+    def __init__(self, root: str) -> None:
+        """Initialize store."""
+        self.root = Path(root)
+
+    def put(self, key: str, data: bytes) -> None:
+        """Write a file, atomically."""
+        path = self.root / key
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial = path.with_name(f".{path.name}.partial")
+        partial.write_bytes(data)
+        os.replace(partial, path)
+
+    def get(self, key: str) -> bytes:
+        """Read a file."""
+        return (self.root / key).read_bytes()
+
+
+def encode_finding(finding: Finding) -> dict[str, Any]:
+    """Get the archive record of a finding loaded with its history and photos."""
+    record = FindingDelta.model_validate(finding).model_dump(mode="json")
+    record["status_history"] = [
+        StatusHistoryEntry.model_validate(entry).model_dump(mode="json")
+        for entry in finding.status_history
+    ]
+    record["photos"] = [
+        PhotoSchema.model_validate(photo).model_dump(mode="json") for photo in finding.photos
+    ]
+    return record
+
+
+class FindingArchive:
+    """Writes findings to the archive and restores them on read."""
+
+    def __init__(self, store: S3ArchiveStore | LocalArchiveStore, cache_size: int) -> None:
+        """Initialize archive."""
+        self.store = store
+        self.cache_size = cache_size
+        # Files never change once written, so decoded ones are cached as is
+        self._files: OrderedDict[str, dict[str, dict[str, Any]]] = OrderedDict()
+
+    async def archive_batch(self, db: AsyncSession, closed_before: datetime) -> int:
+        """Archive one batch of findings closed before a time, in ``db``'s transaction.
+
+        The caller commits. Returns the number of findings archived.
+        """
+        repo = FindingRepository(db)
+        findings = await repo.claim_archivable(closed_before, settings.ARCHIVE_BATCH_SIZE)
+        if not findings:
+            return 0
+
+        groups: dict[tuple[int, uuid.UUID], list[Finding]] = defaultdict(list)
+        for finding in findings:
+            groups[(finding.reported_at.astimezone(timezone.utc).year, finding.area_id)].append(finding)
+
+        batch = f"{datetime.now(timezone.utc):%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:8]}"
+        archive_keys = {}
+        for (year, area_id), group in groups.items():
+            key = f"{settings.ARCHIVE_PREFIX}/year={year}/area={area_id}/{batch}.jsonl.zst"
+            lines = "".join(json.dumps(encode_finding(finding)) + "\n" for finding in group)
+            data = zstandard.ZstdCompressor(level=settings.ARCHIVE_ZSTD_LEVEL).compress(lines.encode())
+            await asyncio.to_thread(self.store.put, key, data)
+            for finding in group:
+                archive_keys[(finding.id, finding.reported_at)] = key
+
+        await repo.tombstone(archive_keys)
+        ARCHIVE_FINDINGS.inc(len(findings), operation="archived")
+        return len(findings)
+
+    async def restore(self, db: AsyncSession, findings: list[Finding]) -> None:
+        """Fill archived findings back in from their files, in place.
+
+        Restored values are set as loaded state, so they are never written
+        back. Findings that are not archived are left alone, and findings whose
+        file or record cannot be read are left as their tombstones.
+        """
+        archived = [finding for finding in findings if finding.archive_key is not None]
+        if not archived:
+            return
+
+        records: dict[str, dict[str, Any]] = {}
+        unreadable: set[str] = set()
+        for key in {finding.archive_key for finding in archived}:
+            try:
+                records.update(await self._read(key))
+            except Exception:
+                logger.exception(f"Could not read archive {key}; its findings stay archived")
+                unreadable.add(key)
+
+        parsed: dict[uuid.UUID, tuple[dict[str, Any], list[StatusHistoryEntry], list[PhotoSchema]]] = {}
+        for finding in archived:
+            if finding.archive_key in unreadable:
+                continue
+            record = records.get(str(finding.id))
+            if record is None:
+                logger.error(f"Finding {finding.id} is missing from archive {finding.archive_key}")
+                continue
+            try:
+                parsed[finding.id] = (
+                    {"description": record["description"], "location": record["location"]},
+                    [StatusHistoryEntry.model_validate(data) for data in record["status_history"]],
+                    [PhotoSchema.model_validate(data) for data in record["photos"]],
+                )
+            except (KeyError, TypeError, ValueError):
+                logger.exception(f"Finding {finding.id} has an invalid record in archive {finding.archive_key}")
+
+        user_ids = {entry.updated_by for _, history, _ in parsed.values() for entry in history}
+        users = await UserRepository(db).get_by_ids(list(user_ids))
+
+        for finding in archived:
+            if finding.id not in parsed:
+                continue
+            fields, entries, photo_entries = parsed[finding.id]
+            history = []
+            for data in entries:
+                entry = StatusHistory(
+                    **data.model_dump(),
+                    finding_id=finding.id,
+                    finding_reported_at=finding.reported_at,
+                )
+                set_committed_value(entry, "updated_by_user", users.get(entry.updated_by))
+                history.append(entry)
+            photos = [
+                Photo(**data.model_dump(), finding_reported_at=finding.reported_at)
+                for data in photo_entries
+            ]
+            set_committed_value(finding, "description", fields["description"])
+            set_committed_value(finding, "location", fields["location"])
+            set_committed_value(finding, "status_history", history)
+            set_committed_value(finding, "photos", photos)
+        ARCHIVE_FINDINGS.inc(len(parsed), operation="restored")
+        if len(parsed) < len(archived):
+            ARCHIVE_FINDINGS.inc(len(archived) - len(parsed), operation="restore_failed")
+
+    async def _read(self, key: str) -> dict[str, dict[str, Any]]:
+        """Get the records of an archive file by finding ID."""
+        records = self._files.get(key)
+        if records is not None:
+            self._files.move_to_end(key)
+            return records
+
+        def load() -> dict[str, dict[str, Any]]:
+            text = zstandard.ZstdDecompressor().decompress(self.store.get(key)).decode()
+            return {record["id"]: record for record in map(json.loads, text.splitlines())}
+
+        records = await asyncio.to_thread(load)
+        self._files[key] = records
+        while len(self._files) > self.cache_size:
+            self._files.popitem(last=False)
+        return records
+
+
+finding_archive = FindingArchive(
+    LocalArchiveStore(settings.ARCHIVE_LOCAL_PATH)
+    if settings.ARCHIVE_STORAGE == "local"
+    else S3ArchiveStore(),
+    cache_size=settings.ARCHIVE_CACHE_FILES,
+)
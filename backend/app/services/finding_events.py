@@ -0,0 +1,197 @@
+"""Live feed of finding changes for Server-Sent Events streams.
+
+Each process listens on the findings channel over its shared LISTEN connection
+and fans events out to in-memory queues, one per open stream. Recent events are kept
+in a ring buffer so a reconnecting client can resume from its ``Last-Event-ID``.
+Postgres delivers notifications to every listener in commit order, so all
+processes see the same sequence and resume works across replicas.
+"""
+import asyncio
+import json
+import logging
+from collections import deque
+from dataclasses import dataclass
+from typing import AsyncIterator
+
+from app.core.config import settings
+from app.core.metrics import Counter, Gauge
+from app.db.listen import ListenSubscription, listener
+from app.repositories.finding import FINDING_EVENTS_CHANNEL
+
+logger = logging.getLogger(__name__)
+
+FINDING_STREAMS = Gauge("finding_streams_open", "Open live findings streams")
+FINDING_STREAM_EVENTS = Counter(
+    "finding_stream_events_total",
+    "Live findings events by outcome",
+    labelnames=("outcome",),
+)
+
+# Tells a client its view may have missed events, so it should refetch
+RESET_FRAME = "event: reset\ndata: {}\n\n"
+HEARTBEAT_FRAME = ": ping\n\n"
+
+
+@dataclass(frozen=True, slots=True)
+class FindingEvent:
+    """One finding change, rendered once as an SSE frame."""
+
+    id: str
+    area_id: str
+    severity: str
+    frame: str
+
+    @classmethod
+    def parse(cls, payload: str) -> "FindingEvent":
+        """Build an event from a NOTIFY payload."""
+        data = json.loads(payload)
+        event_id = str(data["id"])
+        finding = data["finding"]
+        return cls(
+            id=event_id,
+            area_id=finding["area_id"],
+            severity=finding["severity"],
+            frame=f"id: {event_id}\nevent: finding.{data['type']}\ndata: {payload}\n\n",
+        )
+
+
+class Subscription:
+    """One open stream's filters and pending events."""
+
+    def __init__(self, area_ids: set[str] | None, severities: set[str] | None) -> None:
+        """Initialize subscription."""
+        self.area_ids = area_ids
+        self.severities = severities
+        self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize=settings.FINDING_STREAM_QUEUE_SIZE)
+        # Set when the client fell behind or the feed lost events; the stream resets
+        self.lagged = asyncio.Event()
+
+    def matches(self, event: FindingEvent) -> bool:
+        """Check whether an event passes this stream's filters."""
+        return (self.area_ids is None or event.area_id in self.area_ids) and (
+            self.severities is None or event.severity in self.severities
+        )
+
+    def offer(self, frame: str) -> None:
+        """Queue a frame without waiting; a full queue marks the stream lagged."""
+        try:
+            self.queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            FINDING_STREAM_EVENTS.inc(outcome="overflow")
+            self.lagged.set()
+
+    def reset(self) -> None:
+        """Mark the stream lagged and wake it up."""
+        self.lagged.set()
+        self.offer("")
+
+
+class FindingEventBroker:
+    """Fans finding events from the process's LISTEN connection out to every open stream."""
+
+    def __init__(self, buffer_size: int) -> None:
+        """Initialize broker."""
+        self._buffer: deque[FindingEvent] = deque(maxlen=buffer_size)
+        self._subscriptions: set[Subscription] = set()
+        self._listening: ListenSubscription | None = None
+        # Bumped on every committed finding change this process hears about, and
+        # on every (re)connect, so caches keyed by it go stale with the data
+        self.version = 0
+        FINDING_STREAMS.set_function(lambda: len(self._subscriptions))
+
+    def start(self) -> None:
+        """Start listening, if not already."""
+        if self._listening is None:
+            self._listening = listener.subscribe(
+                {FINDING_EVENTS_CHANNEL: self._on_event}, on_connect=self._on_reconnect
+            )
+
+    async def stop(self) -> None:
+        """Stop listening."""
+        if self._listening is not None:
+            listening, self._listening = self._listening, None
+            await listener.unsubscribe(listening)
+
+    def subscribe(
+        self,
+        area_ids: set[str] | None = None,
+        severities: set[str] | None = None,
+        last_event_id: str | None = None,
+    ) -> Subscription:
+        """Open a subscription, queueing the events missed since ``last_event_id``."""
+        self.start()
+        subscription = Subscription(area_ids, severities)
+        if last_event_id is not None:
+            ids = [event.id for event in self._buffer]
+            if last_event_id in ids:
+                for event in list(self._buffer)[ids.index(last_event_id) + 1:]:
+                    if subscription.matches(event):
+                        subscription.offer(event.frame)
+            else:
+                # Too old to replay; the client refetches instead
+                subscription.lagged.set()
+        self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Close a subscription."""
+        self._subscriptions.discard(subscription)
+
+    def _on_event(self, payload: str) -> None:
+        """Buffer an event and hand it to matching subscriptions."""
+        try:
+            event = FindingEvent.parse(payload)
+        except (ValueError, KeyError, TypeError):
+            logger.warning(f"Ignoring malformed finding event: {payload[:200]}")
+            return
+        self.version += 1
+        self._buffer.append(event)
+        FINDING_STREAM_EVENTS.inc(outcome="received")
+        for subscription in self._subscriptions:
+            if subscription.matches(event):
+                subscription.offer(event.frame)
+
+    def _on_reconnect(self) -> None:
+        """Forget buffered events and reset streams, since some may have been missed."""
+        if self._buffer or self._subscriptions:
+            logger.info("Finding events listener (re)connected; resetting live streams")
+        self.version += 1
+        self._buffer.clear()
+        for subscription in self._subscriptions:
+            subscription.reset()
+
+
+finding_events = FindingEventBroker(buffer_size=settings.FINDING_STREAM_BUFFER_SIZE)
+
+
+async def stream_frames(
+    area_ids: set[str] | None = None,
+    severities: set[str] | None = None,
+    last_event_id: str | None = None,
+) -> AsyncIterator[str]:
+    """Yield the SSE frames of one stream, with heartbeats, until cancelled."""
+    # Subscribed here rather than by the caller, so the finally always unsubscribes
+    subscription = finding_events.subscribe(area_ids, severities, last_event_id)
+    try:
+        yield f"retry: {settings.FINDING_STREAM_RETRY_MS}\n\n"
+        while True:
+            if subscription.lagged.is_set():
+                subscription.lagged.clear()
+                # Queued events predate the refetch the reset triggers
+                while not subscription.queue.empty():
+                    subscription.queue.get_nowait()
+                yield RESET_FRAME
+                continue
+            try:
+                frame = await asyncio.wait_for(
+                    subscription.queue.get(), timeout=settings.FINDING_STREAM_HEARTBEAT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                # Keeps proxies from closing an idle connection
+                yield HEARTBEAT_FRAME
+                continue
+            if frame:
+                FINDING_STREAM_EVENTS.inc(outcome="sent")
+                yield frame
+    finally:
+        finding_events.unsubscribe(subscription)
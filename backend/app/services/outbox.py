@@ -0,0 +1,204 @@
+"""Background dispatch of outbox events to their handlers.
+
+Writes record their side effects as ``outbox`` rows in the same transaction, so
+an event exists if and only if its write committed, and the write itself costs
+one insert however many handlers consume the event. Every process that can carry
+out side effects runs a dispatcher. Each leases due events with ``FOR UPDATE
+SKIP LOCKED`` and commits, so dispatchers share the work without running an
+event twice at the same time, and no transaction stays open while handlers
+wait. An event whose dispatcher stopped is taken over once its lease of
+``OUTBOX_LEASE_SECONDS`` runs out. Failed handlers are retried with exponential
+backoff, skipping the handlers and handler steps that already succeeded, and an
+event still failing after ``OUTBOX_MAX_ATTEMPTS`` is kept as a dead letter. An
+event is deleted only once its handlers return, so handlers wait for their side
+effect to be done.
+"""
+import asyncio
+import logging
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable
+
+from app.core.config import settings
+from app.core.metrics import Counter, Histogram
+from app.db.listen import wait
+from app.db.session import async_session
+from app.models.outbox import OutboxEvent
+from app.repositories.outbox import OutboxRepository
+
+logger = logging.getLogger(__name__)
+
+OUTBOX_EVENTS = Counter(
+    "outbox_events_total",
+    "Outbox events handled by type and result",
+    labelnames=("event_type", "result"),
+)
+OUTBOX_LAG_SECONDS = Histogram(
+    "outbox_dispatch_lag_seconds",
+    "Time from an outbox event's write to its successful dispatch",
+    buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0, 3600.0),
+)
+
+# Called with the payload and the steps the handler completed in earlier attempts
+Handler = Callable[[dict[str, Any], set[str]], Awaitable[None]]
+
+
+class OutboxDispatcher:
+    """Leases due outbox events and runs their handlers, up to ``batch_size`` at a time."""
+
+    def __init__(self, batch_size: int, poll_interval: float) -> None:
+        """Initialize dispatcher."""
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        # event type -> handler name -> handler
+        self._handlers: dict[str, dict[str, Handler]] = defaultdict(dict)
+        self._running: set[asyncio.Task] = set()
+        self._wake: asyncio.Event | None = None
+        self._stop: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+
+    def register(self, event_type: str, name: str, handler: Handler) -> None:
+        """Run a handler for every event of a type.
+
+        The name is recorded once the handler succeeds, so it must stay stable.
+        Handlers may run more than once for an event and should be idempotent.
+        A handler with several side effects, e.g. one message per chat, adds a
+        key for each one done to the steps it is given; if it then fails, the
+        retry gets them back and can skip them.
+        """
+        self._handlers[event_type][name] = handler
+
+    @property
+    def running(self) -> bool:
+        """Check whether the dispatch loop is running."""
+        return self._task is not None
+
+    def start(self) -> None:
+        """Start dispatching, if not already."""
+        if self._task is None:
+            # Made per run, since events are bound to the loop that first waits on them
+            self._wake, self._stop = asyncio.Event(), asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Finish the events in progress and stop."""
+        if self._task is not None:
+            self._stop.set()
+            self._wake.set()
+            await self._task
+            self._task = None
+
+    async def _run(self) -> None:
+        """Dispatch events until stopped, polling while the outbox is empty."""
+        try:
+            while not self._stop.is_set():
+                self._wake.clear()
+                free = self.batch_size - len(self._running)
+                claimed = await self.dispatch_batch(free) if free > 0 else 0
+                # A full claim means more may be waiting, unless no slot is free
+                if free == 0 or claimed < free:
+                    # Woken early by an event settling, which frees its slot
+                    await wait(self._wake, self.poll_interval)
+        finally:
+            await asyncio.gather(*self._running, return_exceptions=True)
+
+    async def dispatch_batch(self, limit: int) -> int:
+        """Lease up to ``limit`` due events and start running their handlers.
+
+        Each event settles on its own once its handlers return, so a slow one
+        holds neither a transaction nor the rest of the batch. Returns the
+        number of events claimed.
+        """
+        try:
+            async with async_session() as db:
+                events = await OutboxRepository(db).claim(limit, settings.OUTBOX_LEASE_SECONDS)
+                await db.commit()
+        except Exception:
+            logger.exception("Outbox dispatch failed")
+            return 0
+        for event in events:
+            task = asyncio.create_task(self._dispatch(event))
+            self._running.add(task)
+            task.add_done_callback(self._on_done)
+        return len(events)
+
+    def _on_done(self, task: asyncio.Task) -> None:
+        """Free a settled event's slot."""
+        self._running.discard(task)
+        self._wake.set()
+
+    async def _dispatch(self, event: OutboxEvent) -> None:
+        """Run an event's handlers outside any transaction, then settle it."""
+        completed, errors = await self._run_handlers(event)
+        try:
+            async with async_session() as db:
+                settled = await self._settle(OutboxRepository(db), event, completed, errors)
+                await db.commit()
+        except Exception:
+            # The event is handed out again once its lease runs out
+            logger.exception(f"Failed to settle outbox event {event.id}")
+            return
+        if not settled:
+            logger.warning(f"Outbox event {event.id} outlived its lease and was taken over")
+
+    async def _run_handlers(self, event: OutboxEvent) -> tuple[list[str], list[str]]:
+        """Run an event's pending handlers.
+
+        Returns the handlers, and steps of failed handlers, done so far as
+        ``name`` and ``name:step``, and the errors of the handlers that failed.
+        """
+        completed = list(event.completed)
+        errors = []
+        for name, handler in self._handlers.get(event.event_type, {}).items():
+            if name in completed:
+                continue
+            prefix = f"{name}:"
+            done = {entry.removeprefix(prefix) for entry in completed if entry.startswith(prefix)}
+            steps = set(done)
+            try:
+                await asyncio.wait_for(
+                    handler(event.payload, steps), timeout=settings.OUTBOX_HANDLER_TIMEOUT_SECONDS
+                )
+            except Exception as e:
+                logger.warning(f"Outbox handler {name} failed for event {event.id}: {e!r}")
+                errors.append(f"{name}: {e!r}")
+                completed.extend(prefix + step for step in sorted(steps - done))
+            else:
+                completed.append(name)
+        return completed, errors
+
+    async def _settle(
+        self, repo: OutboxRepository, event: OutboxEvent, completed: list[str], errors: list[str]
+    ) -> bool:
+        """Complete, retry or bury an event after its handlers ran.
+
+        Returns False if the event's lease ran out before it was settled.
+        """
+        if not errors:
+            if not await repo.complete(event):
+                return False
+            lag = datetime.now(timezone.utc) - event.created_at
+            OUTBOX_LAG_SECONDS.observe(lag.total_seconds())
+            OUTBOX_EVENTS.inc(event_type=event.event_type, result="dispatched")
+        elif event.attempts + 1 >= settings.OUTBOX_MAX_ATTEMPTS:
+            if not await repo.bury(event, completed, "; ".join(errors)):
+                return False
+            logger.error(
+                f"Outbox event {event.id} ({event.event_type}) dead after {event.attempts + 1} attempts"
+            )
+            OUTBOX_EVENTS.inc(event_type=event.event_type, result="dead")
+        else:
+            delay = min(
+                settings.OUTBOX_RETRY_BASE_SECONDS * 2 ** event.attempts,
+                settings.OUTBOX_RETRY_MAX_SECONDS,
+            )
+            if not await repo.retry(event, completed, "; ".join(errors), delay):
+                return False
+            OUTBOX_EVENTS.inc(event_type=event.event_type, result="retried")
+        return True
+
+
+outbox_dispatcher = OutboxDispatcher(
+    batch_size=settings.OUTBOX_BATCH_SIZE,
+    poll_interval=settings.OUTBOX_POLL_INTERVAL_SECONDS,
+)
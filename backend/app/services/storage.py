@@ -8,6 +8,10 @@ from botocore.client import Config
 from botocore.exceptions import ClientError
 
 from app.core.config import settings
+from app.core.instrumentation import STORAGE_OPERATION_SECONDS, timed
+
+# Most keys S3 accepts in one DeleteObjects request
+DELETE_BATCH_SIZE = 1000
 
 
 class StorageService:
@@ -63,6 +67,7 @@ class StorageService:
         unique_filename = f"{uuid4()}{ext}"
         return f"{prefix}/{unique_filename}"
 
+    @timed(STORAGE_OPERATION_SECONDS, operation="put_object")
     def upload_file(
         self,
         file_data: bytes,
@@ -88,6 +93,7 @@ class StorageService:
 
         return s3_key, file_size
 
+    @timed(STORAGE_OPERATION_SECONDS, operation="upload_fileobj")
     def upload_fileobj(
         self,
         fileobj,
@@ -117,6 +123,53 @@ class StorageService:
 
         return s3_key, file_size
 
+    @timed(STORAGE_OPERATION_SECONDS, operation="put_object")
+    def put_bytes(self, s3_key: str, data: bytes, content_type: str) -> None:
+        """Store bytes under an exact key."""
+        self.s3_client.put_object(Bucket=self.bucket, Key=s3_key, Body=data, ContentType=content_type)
+
+    @timed(STORAGE_OPERATION_SECONDS, operation="get_object")
+    def get_bytes(self, s3_key: str) -> bytes:
+        """Read an object's bytes."""
+        response = self.s3_client.get_object(Bucket=self.bucket, Key=s3_key)
+        return response["Body"].read()
+
+    @timed(STORAGE_OPERATION_SECONDS, operation="list_objects")
+    def list_objects(
+        self, prefix: str, continuation_token: str | None = None, max_keys: int = 1000
+    ) -> tuple[list[dict], str | None]:
+        """List one page of objects under a prefix.
+
+        Returns:
+            Tuple of (objects with Key, Size and LastModified, token of the next page or None)
+        """
+        params = {"Bucket": self.bucket, "Prefix": prefix, "MaxKeys": max_keys}
+        if continuation_token:
+            params["ContinuationToken"] = continuation_token
+        response = self.s3_client.list_objects_v2(**params)
+        next_token = response.get("NextContinuationToken") if response.get("IsTruncated") else None
+        return response.get("Contents", []), next_token
+
+    @timed(STORAGE_OPERATION_SECONDS, operation="delete_objects")
+    def delete_files(self, s3_keys: list[str]) -> list[str]:
+        """Delete files from S3, up to 1000 per request.
+
+        Returns:
+            Keys that could not be deleted
+        """
+        failed = []
+        for start in range(0, len(s3_keys), DELETE_BATCH_SIZE):
+            response = self.s3_client.delete_objects(
+                Bucket=self.bucket,
+                Delete={
+                    "Objects": [{"Key": key} for key in s3_keys[start:start + DELETE_BATCH_SIZE]],
+                    "Quiet": True,
+                },
+            )
+            failed.extend(error["Key"] for error in response.get("Errors", []))
+        return failed
+
+    @timed(STORAGE_OPERATION_SECONDS, operation="presign")
     def get_presigned_url(
         self, s3_key: str, expires_in: int = 3600
     ) -> str:
@@ -127,6 +180,7 @@ class StorageService:
             ExpiresIn=expires_in,
         )
 
+    @timed(STORAGE_OPERATION_SECONDS, operation="delete_object")
     def delete_file(self, s3_key: str) -> bool:
         """Delete a file from S3."""
         try:
@@ -0,0 +1,131 @@
+"""Garbage collection of storage objects no photo references.
+
+Photos are uploaded before their finding commits, so a failed or abandoned
+report leaves its object behind, as does a deleted finding. The collector pages
+through the bucket under ``STORAGE_GC_PREFIX`` and checks each page's keys
+against ``photos`` and ``archived_photos`` in one query. Objects younger than
+``STORAGE_GC_GRACE_HOURS`` are always kept, since their row may not be committed
+yet. Derivatives (``<prefix><photo key>``, e.g. thumbnails) go with their photo,
+or once older than ``STORAGE_GC_DERIVATIVE_RETENTION_DAYS`` if set.
+"""
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from app.core.config import settings
+from app.core.metrics import Counter, Gauge
+from app.db.session import async_session
+from app.repositories.photo import PhotoRepository
+
+logger = logging.getLogger(__name__)
+
+STORAGE_GC_OBJECTS = Counter(
+    "storage_gc_objects_total",
+    "Storage objects seen by the garbage collector by prefix and outcome",
+    labelnames=("prefix", "outcome"),
+)
+STORAGE_LIVE_BYTES = Gauge(
+    "storage_live_bytes",
+    "Bytes of referenced storage objects at the last garbage collection, by prefix",
+    labelnames=("prefix",),
+)
+
+# Objects per listing page, and keys per delete request
+PAGE_SIZE = 1000
+
+
+@dataclass(slots=True)
+class CollectionResult:
+    """Outcome of collecting one prefix."""
+
+    scanned: int = 0
+    deleted: int = 0
+    live_bytes: int = 0
+    orphaned_bytes: int = 0
+
+
+async def collect_prefix(
+    prefix: str,
+    now: datetime,
+    source_prefix: str = "",
+    retention: timedelta | None = None,
+) -> CollectionResult:
+    """Delete the objects under a prefix whose photo no longer exists.
+
+    An object's photo key is its key with ``prefix`` replaced by ``source_prefix``.
+    Objects older than ``retention`` are deleted regardless.
+    """
+    # Imported here so only the processes that collect connect to S3
+    from app.services.storage import storage_service
+
+    grace_cutoff = now - timedelta(hours=settings.STORAGE_GC_GRACE_HOURS)
+    result = CollectionResult()
+    orphans: list[str] = []
+    token = None
+    while True:
+        objects, token = await asyncio.to_thread(
+            storage_service.list_objects, prefix, token, PAGE_SIZE
+        )
+        result.scanned += len(objects)
+        candidates = {
+            obj["Key"]: source_prefix + obj["Key"][len(prefix):]
+            for obj in objects
+            if obj["LastModified"] < grace_cutoff
+        }
+        async with async_session() as db:
+            referenced = await PhotoRepository(db).get_referenced_keys(list(set(candidates.values())))
+
+        for obj in objects:
+            key = obj["Key"]
+            expired = retention is not None and obj["LastModified"] < now - retention
+            if key in candidates and (candidates[key] not in referenced or expired):
+                orphans.append(key)
+                result.orphaned_bytes += obj["Size"]
+            else:
+                result.live_bytes += obj["Size"]
+
+        while len(orphans) >= PAGE_SIZE or (orphans and token is None):
+            batch, orphans = orphans[:PAGE_SIZE], orphans[PAGE_SIZE:]
+            result.deleted += await _delete(prefix, batch)
+        if token is None:
+            break
+
+    STORAGE_GC_OBJECTS.inc(result.scanned, prefix=prefix, outcome="scanned")
+    STORAGE_LIVE_BYTES.set(result.live_bytes, prefix=prefix)
+    return result
+
+
+async def _delete(prefix: str, s3_keys: list[str]) -> int:
+    """Delete one batch of orphans, unless in dry-run mode. Returns the number deleted."""
+    from app.services.storage import storage_service
+
+    STORAGE_GC_OBJECTS.inc(len(s3_keys), prefix=prefix, outcome="orphaned")
+    if settings.STORAGE_GC_DRY_RUN:
+        logger.info(f"Would delete {len(s3_keys)} orphaned objects under {prefix}, e.g. {s3_keys[0]}")
+        return 0
+    failed = await asyncio.to_thread(storage_service.delete_files, s3_keys)
+    if failed:
+        STORAGE_GC_OBJECTS.inc(len(failed), prefix=prefix, outcome="failed")
+        logger.warning(f"Failed to delete {len(failed)} orphaned objects under {prefix}, e.g. {failed[0]}")
+    STORAGE_GC_OBJECTS.inc(len(s3_keys) - len(failed), prefix=prefix, outcome="deleted")
+    return len(s3_keys) - len(failed)
+
+
+async def collect_orphans() -> dict[str, CollectionResult]:
+    """Collect the photo prefix and each derivative prefix. Returns results by prefix."""
+    now = datetime.now(timezone.utc)
+    retention = (
+        timedelta(days=settings.STORAGE_GC_DERIVATIVE_RETENTION_DAYS)
+        if settings.STORAGE_GC_DERIVATIVE_RETENTION_DAYS
+        else None
+    )
+    results = {
+        settings.STORAGE_GC_PREFIX: await collect_prefix(
+            settings.STORAGE_GC_PREFIX, now, settings.STORAGE_GC_PREFIX
+        )
+    }
+    for prefix in settings.STORAGE_GC_DERIVATIVE_PREFIXES:
+        # Derivative keys embed their photo's full key after the prefix
+        results[prefix] = await collect_prefix(prefix, now, retention=retention)
+    return results
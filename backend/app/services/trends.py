@@ -0,0 +1,170 @@
+"""Gap-filled series of findings reported per day, week or month.
+
+Results are cached per process, keyed by the request and by the live findings
+feed's version, which moves on every committed finding change any process
+makes. A write therefore invalidates every cached result at once, and a
+repeated dashboard load costs no query until then. Misses must read from the
+primary: the version is taken before the query, so the result is at least as
+new as the version it is cached under, which a lagging replica cannot promise.
+"""
+import uuid
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from time import monotonic
+from typing import Hashable
+from zoneinfo import ZoneInfo
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.metrics import Counter
+from app.models.finding import Severity, Status
+from app.repositories.area import AreaRepository
+from app.repositories.finding import FindingRepository
+from app.schemas.finding import FindingTrends, TrendGranularity, TrendGroupBy, TrendSeries
+from app.services.finding_events import finding_events
+
+TRENDS_CACHE = Counter(
+    "finding_trends_cache_total",
+    "Finding trend lookups by cache result",
+    labelnames=("result",),
+)
+
+
+def bucket_start(day: date, granularity: TrendGranularity) -> date:
+    """Get the first day of the period containing a day; weeks start on Monday."""
+    if granularity == TrendGranularity.WEEK:
+        return day - timedelta(days=day.weekday())
+    if granularity == TrendGranularity.MONTH:
+        return day.replace(day=1)
+    return day
+
+
+def next_bucket(day: date, granularity: TrendGranularity) -> date:
+    """Get the first day of the period after the one starting on ``day``."""
+    if granularity == TrendGranularity.WEEK:
+        return day + timedelta(weeks=1)
+    if granularity == TrendGranularity.MONTH:
+        return date(day.year + day.month // 12, day.month % 12 + 1, 1)
+    return day + timedelta(days=1)
+
+
+def bucket_count(date_from: date, date_to: date, granularity: TrendGranularity) -> int:
+    """Count the periods spanning two days, both included."""
+    first = bucket_start(date_from, granularity)
+    last = bucket_start(date_to, granularity)
+    if granularity == TrendGranularity.MONTH:
+        return (last.year - first.year) * 12 + last.month - first.month + 1
+    days = 7 if granularity == TrendGranularity.WEEK else 1
+    return (last - first).days // days + 1
+
+
+class TrendCache:
+    """Least recently used results, each kept for at most ``ttl`` seconds."""
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        """Initialize cache."""
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, FindingTrends]] = OrderedDict()
+
+    def get(self, key: Hashable) -> FindingTrends | None:
+        """Get a fresh cached result."""
+        entry = self._entries.get(key)
+        if entry is None or monotonic() - entry[0] > self.ttl:
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def put(self, key: Hashable, trends: FindingTrends) -> None:
+        """Cache a result, evicting the least recently used beyond ``max_size``."""
+        self._entries[key] = (monotonic(), trends)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+
+trend_cache = TrendCache(settings.FINDING_TRENDS_CACHE_SIZE, settings.FINDING_TRENDS_CACHE_TTL_SECONDS)
+
+
+async def get_trends(
+    db: AsyncSession,
+    granularity: TrendGranularity,
+    group_by: TrendGroupBy,
+    tz: str,
+    date_from: date,
+    date_to: date,
+    area_ids: list[uuid.UUID] | None = None,
+    severities: list[Severity] | None = None,
+) -> FindingTrends:
+    """Get the series of findings reported between two local days, both included.
+
+    The range is widened to whole periods, so the first and last buckets are
+    complete.
+    """
+    # Listening is what keeps the version moving; a no-op once started
+    finding_events.start()
+    first = bucket_start(date_from, granularity)
+    end = next_bucket(bucket_start(date_to, granularity), granularity)
+    key = (
+        finding_events.version,
+        granularity,
+        group_by,
+        tz,
+        first,
+        end,
+        frozenset(area_ids or ()),
+        frozenset(severities or ()),
+    )
+    cached = trend_cache.get(key)
+    if cached is not None:
+        TRENDS_CACHE.inc(result="hit")
+        return cached
+    TRENDS_CACHE.inc(result="miss")
+
+    zone = ZoneInfo(tz)
+    rows = await FindingRepository(db).trend_counts(
+        granularity,
+        group_by,
+        tz,
+        start=datetime.combine(first, datetime.min.time(), zone),
+        end=datetime.combine(end, datetime.min.time(), zone),
+        area_ids=area_ids,
+        severities=severities,
+    )
+
+    buckets: list[date] = []
+    counts: dict[str, dict[date, int]] = {}
+    for row in rows:
+        if not buckets or buckets[-1] != row.bucket:
+            buckets.append(row.bucket)
+        if row.key is not None:
+            counts.setdefault(row.key, {})[row.bucket] = row.count
+
+    if group_by == TrendGroupBy.AREA:
+        names = await AreaRepository(db).get_names([uuid.UUID(k) for k in counts])
+        labels = {str(area_id): name for area_id, name in names.items()}
+        keys = sorted(counts, key=lambda k: labels.get(k, k))
+    else:
+        # Every severity or status gets a series, so charts keep stable colours
+        members = Severity if group_by == TrendGroupBy.SEVERITY else Status
+        labels = {m.value: m.value.replace("_", " ").capitalize() for m in members}
+        keys = list(labels)
+
+    series = []
+    for k in keys:
+        by_bucket = counts.get(k, {})
+        values = [by_bucket.get(b, 0) for b in buckets]
+        series.append(TrendSeries(key=k, label=labels.get(k, k), counts=values, total=sum(values)))
+
+    trends = FindingTrends(
+        granularity=granularity,
+        group_by=group_by,
+        timezone=tz,
+        date_from=first,
+        date_to=end - timedelta(days=1),
+        buckets=buckets,
+        series=series,
+    )
+    trend_cache.put(key, trends)
+    return trends
@@ -0,0 +1,5 @@
+"""HTTP load-testing benchmarks for the API."""
+
+# Credentials of the admin created by benchmarks.seed
+BENCH_ADMIN_STAFF_ID = "BENCH-ADMIN"
+BENCH_ADMIN_PASSWORD = "bench-password"
@@ -0,0 +1,50 @@
+"""Compare two benchmark result files.
+
+Usage (from backend/):
+    python -m benchmarks.compare before.json after.json
+"""
+import argparse
+import json
+
+
+def _delta(before: float | None, after: float | None) -> str:
+    """Format the relative change between two values."""
+    if not before or after is None:
+        return "n/a"
+    return f"{(after - before) / before * 100:+.1f}%"
+
+
+def compare(before: dict, after: dict) -> list[str]:
+    """Build a table of throughput and latency changes per endpoint."""
+    lines = [
+        f"{'scenario':20s} {'rps':>18s} {'p50 ms':>20s} {'p95 ms':>20s} {'p99 ms':>20s}"
+    ]
+    for name, new in after["results"].items():
+        old = before["results"].get(name)
+        if old is None:
+            lines.append(f"{name:20s} (new)")
+            continue
+        cells = [
+            f"{old['throughput_rps']}→{new['throughput_rps']} {_delta(old['throughput_rps'], new['throughput_rps'])}"
+        ]
+        for key in ("p50", "p95", "p99"):
+            old_value = old["latency_ms"][key]
+            new_value = new["latency_ms"][key]
+            cells.append(f"{old_value}→{new_value} {_delta(old_value, new_value)}")
+        lines.append(f"{name:20s} " + " ".join(f"{cell:>20s}" for cell in cells))
+    return lines
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare benchmark results")
+    parser.add_argument("before", help="Baseline results JSON")
+    parser.add_argument("after", help="New results JSON")
+
+    args = parser.parse_args()
+
+    with open(args.before) as f:
+        before = json.load(f)
+    with open(args.after) as f:
+        after = json.load(f)
+
+    print("\n".join(compare(before, after)))
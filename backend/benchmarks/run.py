@@ -0,0 +1,265 @@
+"""Load test the API and report per-endpoint latency as JSON.
+
+Usage (from backend/, after ``python -m benchmarks.seed``):
+    python -m benchmarks.run --concurrency 20 --duration 15 --output before.json
+    python -m benchmarks.run --base-url http://localhost:8000 --scenarios findings_list,login
+
+Without ``--base-url`` the real ``app.main:app`` is driven in-process through
+httpx's ASGI transport, so results exclude network and server worker effects.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+import httpx
+
+from benchmarks import BENCH_ADMIN_PASSWORD, BENCH_ADMIN_STAFF_ID
+
+API = "/api/v1"
+
+
+@dataclass
+class Context:
+    """Data discovered before the run and shared by scenarios."""
+
+    token: str
+    finding_ids: list[str]
+    area_ids: list[str]
+    total_pages: int
+    rng: random.Random = field(default_factory=lambda: random.Random(42))
+
+
+@dataclass
+class Scenario:
+    """One endpoint under test."""
+
+    name: str
+    build: Callable[[Context], tuple[str, str, dict[str, Any]]]
+    authenticated: bool = True
+
+
+SCENARIOS = [
+    Scenario(
+        "findings_list",
+        lambda ctx: ("GET", f"{API}/findings", {"params": {"page": 1, "page_size": 50}}),
+    ),
+    Scenario(
+        "findings_filtered",
+        lambda ctx: ("GET", f"{API}/findings", {"params": {
+            "area_id": ctx.rng.choice(ctx.area_ids),
+            "severity": ctx.rng.choice(["high", "critical"]),
+            "status": "open",
+            "page_size": 50,
+        }}),
+    ),
+    Scenario(
+        "findings_deep_page",
+        lambda ctx: ("GET", f"{API}/findings", {"params": {
+            "page": max(1, ctx.total_pages - ctx.rng.randint(0, 10)),
+            "page_size": 50,
+        }}),
+    ),
+    Scenario(
+        "finding_detail",
+        lambda ctx: ("GET", f"{API}/findings/{ctx.rng.choice(ctx.finding_ids)}", {}),
+    ),
+    Scenario(
+        "findings_summary",
+        lambda ctx: ("POST", f"{API}/findings/summary", {"params": {
+            "date_from": "2000-01-01T00:00:00Z",
+        }}),
+    ),
+    Scenario(
+        "areas_tree",
+        lambda ctx: ("GET", f"{API}/areas/tree", {}),
+    ),
+    Scenario(
+        "login",
+        lambda ctx: ("POST", f"{API}/auth/login", {"json": {
+            "staff_id": BENCH_ADMIN_STAFF_ID,
+            "password": BENCH_ADMIN_PASSWORD,
+        }}),
+        authenticated=False,
+    ),
+]
+
+
+def percentile(sorted_values: list[float], q: float) -> float | None:
+    """Nearest-rank percentile of pre-sorted values."""
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, round(q * len(sorted_values) + 0.5) - 1))
+    return sorted_values[index]
+
+
+def _ms(value: float | None) -> float | None:
+    """Convert seconds to rounded milliseconds."""
+    return round(value * 1000, 3) if value is not None else None
+
+
+def summarize(latencies: list[float], statuses: dict[int, int], errors: int, elapsed: float) -> dict[str, Any]:
+    """Build the per-endpoint result record."""
+    ordered = sorted(latencies)
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "status_counts": {str(code): count for code, count in sorted(statuses.items())},
+        "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        "latency_ms": {
+            "mean": _ms(sum(ordered) / len(ordered)) if ordered else None,
+            "p50": _ms(percentile(ordered, 0.50)),
+            "p95": _ms(percentile(ordered, 0.95)),
+            "p99": _ms(percentile(ordered, 0.99)),
+            "max": _ms(ordered[-1] if ordered else None),
+        },
+    }
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    scenario: Scenario,
+    ctx: Context,
+    concurrency: int,
+    duration: float,
+) -> dict[str, Any]:
+    """Hammer one endpoint with concurrent clients for a fixed duration."""
+    latencies: list[float] = []
+    statuses: dict[int, int] = {}
+    errors = 0
+    headers = {"Authorization": f"Bearer {ctx.token}"} if scenario.authenticated else {}
+    deadline = time.perf_counter() + duration
+
+    async def worker() -> None:
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            method, url, kwargs = scenario.build(ctx)
+            started_at = time.perf_counter()
+            try:
+                response = await client.request(method, url, headers=headers, **kwargs)
+            except httpx.HTTPError:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - started_at)
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+            if response.status_code >= 400:
+                errors += 1
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, statuses, errors, time.perf_counter() - started_at)
+
+
+async def prepare(client: httpx.AsyncClient) -> Context:
+    """Log in and sample IDs used to build requests."""
+    response = await client.post(
+        f"{API}/auth/login",
+        json={"staff_id": BENCH_ADMIN_STAFF_ID, "password": BENCH_ADMIN_PASSWORD},
+    )
+    response.raise_for_status()
+    token = response.json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    response = await client.get(f"{API}/findings", params={"page_size": 100}, headers=headers)
+    response.raise_for_status()
+    findings = response.json()
+    response = await client.get(f"{API}/areas", headers=headers)
+    response.raise_for_status()
+    areas = response.json()
+
+    if not findings["items"] or not areas:
+        raise SystemExit("No data found. Run `python -m benchmarks.seed` first.")
+
+    return Context(
+        token=token,
+        finding_ids=[item["id"] for item in findings["items"]],
+        area_ids=[area["id"] for area in areas],
+        total_pages=max(1, findings["total"] // 50),
+    )
+
+
+def _git_revision() -> str | None:
+    """Get the current commit for labelling results."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def main(args: argparse.Namespace) -> dict[str, Any]:
+    """Run the selected scenarios and return the report."""
+    if args.base_url:
+        transport = None
+        base_url = args.base_url
+    else:
+        # Repeated benchmark logins must not trip the per-IP login throttle
+        os.environ.setdefault("LOGIN_MAX_ATTEMPTS_PER_IP", "1000000000")
+        from app.main import app
+
+        transport = httpx.ASGITransport(app=app)
+        base_url = "http://benchmark"
+
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    selected = set(args.scenarios.split(",")) if args.scenarios else None
+
+    async with httpx.AsyncClient(
+        transport=transport, base_url=base_url, limits=limits, timeout=args.timeout
+    ) as client:
+        ctx = await prepare(client)
+        results = {}
+        for scenario in SCENARIOS:
+            if selected and scenario.name not in selected:
+                continue
+            if args.warmup:
+                await run_scenario(client, scenario, ctx, args.concurrency, args.warmup)
+            results[scenario.name] = await run_scenario(
+                client, scenario, ctx, args.concurrency, args.duration
+            )
+            print(
+                f"{scenario.name:20s} {results[scenario.name]['throughput_rps']:>9} rps  "
+                f"p50={results[scenario.name]['latency_ms']['p50']}ms  "
+                f"p99={results[scenario.name]['latency_ms']['p99']}ms"
+            )
+
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "git_revision": _git_revision(),
+            "target": args.base_url or "in-process",
+            "concurrency": args.concurrency,
+            "duration_seconds": args.duration,
+            "warmup_seconds": args.warmup,
+            "python": platform.python_version(),
+        },
+        "results": results,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark API endpoints")
+    parser.add_argument("--base-url", help="Benchmark a running server instead of in-process")
+    parser.add_argument("--concurrency", type=int, default=10, help="Concurrent clients")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per scenario")
+    parser.add_argument("--warmup", type=float, default=2.0, help="Warm-up seconds per scenario")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Request timeout in seconds")
+    parser.add_argument("--scenarios", help="Comma-separated scenario names (default: all)")
+    parser.add_argument("--output", help="Write JSON results to this file")
+
+    args = parser.parse_args()
+    report = asyncio.run(main(args))
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
@@ -0,0 +1,73 @@
+"""Seed a local database with synthetic data for benchmarks.
+
+Loads the dataset from ``scripts.generate_dataset`` and adds an admin the
+benchmark runner can log in with.
+
+Usage (from backend/):
+    python -m benchmarks.seed --findings 50000 --users 500 --sites 10 --reset
+"""
+import argparse
+import asyncio
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import insert
+
+from app.core.security import get_password_hash
+from app.db.session import engine
+from app.models import User
+from app.models.user import Role
+from benchmarks import BENCH_ADMIN_PASSWORD, BENCH_ADMIN_STAFF_ID
+from scripts.generate_dataset import generate
+
+
+async def seed(users: int, sites: int, findings: int, days: int, seed_value: int, reset: bool) -> None:
+    """Load the synthetic dataset and the benchmark admin."""
+    async with engine.begin() as conn:
+        counts = await generate(
+            conn,
+            findings=findings,
+            users=users,
+            sites=sites,
+            days=days,
+            seed=seed_value,
+            reset=reset,
+        )
+        now = datetime.now(timezone.utc)
+        await conn.execute(insert(User.__table__), [{
+            "id": uuid.uuid4(),
+            "full_name": "Benchmark Admin",
+            "staff_id": BENCH_ADMIN_STAFF_ID,
+            "department": "Administration",
+            "section": "IT",
+            "role": Role.SUPER_ADMIN,
+            "is_active": True,
+            "password_hash": get_password_hash(BENCH_ADMIN_PASSWORD),
+            "created_at": now,
+            "updated_at": now,
+        }])
+
+    await engine.dispose()
+    print(f"Seeded {counts['users']} users, {counts['areas']} areas and {counts['findings']} findings")
+    print(f"Login with staff ID {BENCH_ADMIN_STAFF_ID} / password {BENCH_ADMIN_PASSWORD}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Seed synthetic benchmark data")
+    parser.add_argument("--users", type=int, default=200, help="Number of users")
+    parser.add_argument("--sites", type=int, default=5, help="Number of level-1 areas")
+    parser.add_argument("--findings", type=int, default=10000, help="Number of findings")
+    parser.add_argument("--days", type=int, default=365, help="Spread findings over this many days")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--reset", action="store_true", help="Truncate existing data first")
+
+    args = parser.parse_args()
+
+    asyncio.run(seed(
+        users=args.users,
+        sites=args.sites,
+        findings=args.findings,
+        days=args.days,
+        seed_value=args.seed,
+        reset=args.reset,
+    ))
@@ -7,13 +7,17 @@ case "$SERVICE_TYPE" in
         echo "Starting Telegram Bot worker..."
         exec python -m app.bot.worker
         ;;
+    jobs)
+        echo "Starting background job worker..."
+        exec python -m app.jobs.worker
+        ;;
     api|"")
         echo "Starting API server..."
-        exec uvicorn app.main:app --host 0.0.0.0 --port ${PORT:-8000}
+        exec uvicorn app.main:app --host 0.0.0.0 --port ${PORT:-8000} --timeout-graceful-shutdown 10
         ;;
     *)
         echo "Unknown SERVICE_TYPE: $SERVICE_TYPE"
         echo "Defaulting to API server..."
-        exec uvicorn app.main:app --host 0.0.0.0 --port ${PORT:-8000}
+        exec uvicorn app.main:app --host 0.0.0.0 --port ${PORT:-8000} --timeout-graceful-shutdown 10
         ;;
 esac
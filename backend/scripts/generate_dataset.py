@@ -0,0 +1,434 @@
+"""Generate a large synthetic dataset for scale testing.
+
+Rows are bulk-loaded with PostgreSQL COPY and every value, including UUIDs and
+timestamps, is derived from the seed, so the same arguments always produce the
+same database.
+
+Usage (from backend/):
+    python -m scripts.generate_dataset --findings 1000000 --reset
+    python -m scripts.generate_dataset --findings 5000000 --users 20000 --sites 40 --seed 7
+"""
+import argparse
+import asyncio
+import bisect
+import itertools
+import math
+import random
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.db.base import Base
+from app.db.partitions import ensure_partitions
+from app.models.finding import Severity, Status
+from app.models.user import Role
+
+# Fixed so that the default run is reproducible; findings are spread backwards from here
+DEFAULT_UNTIL = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+DEPARTMENTS = {
+    "IMD": 35,
+    "RSMD": 30,
+    "FMD": 25,
+    "Others": 10,
+}
+SECTIONS_PER_DEPARTMENT = 8
+ADMIN_RATIO = 0.02
+
+SEVERITY_WEIGHTS = {
+    Severity.LOW: 45,
+    Severity.MEDIUM: 35,
+    Severity.HIGH: 16,
+    Severity.CRITICAL: 4,
+}
+# Mean hours a finding spends in each status before moving on, by severity
+STATUS_DWELL_HOURS = {
+    Severity.CRITICAL: {Status.OPEN: 4, Status.IN_PROGRESS: 24, Status.RESOLVED: 24},
+    Severity.HIGH: {Status.OPEN: 24, Status.IN_PROGRESS: 72, Status.RESOLVED: 48},
+    Severity.MEDIUM: {Status.OPEN: 72, Status.IN_PROGRESS: 168, Status.RESOLVED: 72},
+    Severity.LOW: {Status.OPEN: 168, Status.IN_PROGRESS: 336, Status.RESOLVED: 120},
+}
+# Share of findings that stall in a status instead of progressing
+STALL_PROBABILITY = 0.08
+TRANSITIONS = [Status.OPEN, Status.IN_PROGRESS, Status.RESOLVED, Status.CLOSED]
+
+# Reports cluster in working hours and on weekdays
+HOURS = list(range(24))
+HOUR_WEIGHTS = [1, 1, 1, 1, 1, 2, 4, 8, 10, 10, 9, 8, 6, 8, 9, 9, 8, 6, 4, 3, 2, 2, 1, 1]
+WEEKDAY_WEIGHTS = [10, 10, 10, 10, 9, 3, 2]
+PHOTO_COUNT_WEIGHTS = [25, 45, 20, 7, 3]
+PHOTO_TYPES = [("image/jpeg", ".jpg", 85), ("image/png", ".png", 10), ("image/webp", ".webp", 5)]
+
+HAZARDS = [
+    "Oil spill near", "Missing guard on", "Blocked fire exit by", "Exposed wiring at",
+    "Trip hazard next to", "Damaged ladder in", "Unlabelled chemicals near",
+    "Poor lighting around", "Loose handrail on", "PPE not worn at",
+]
+OBJECTS = [
+    "conveyor", "loading bay", "control panel", "stairway", "workbench",
+    "compressor", "forklift route", "storage rack", "platform", "pump house",
+]
+
+USER_COLUMNS = [
+    "id", "telegram_id", "username", "full_name", "staff_id", "department", "section",
+    "role", "is_active", "password_hash", "created_at", "updated_at",
+]
+AREA_COLUMNS = ["id", "name", "description", "parent_id", "level", "created_at"]
+FINDING_COLUMNS = [
+    "id", "report_id", "reporter_id", "area_id", "description", "severity", "status",
+    "location", "reported_at", "closed_at", "assigned_to", "created_at", "updated_at",
+]
+KEY_COLUMNS = ["finding_id", "reported_at", "report_id"]
+HISTORY_COLUMNS = [
+    "id", "finding_id", "finding_reported_at", "old_status", "new_status", "notes", "updated_by", "updated_at",
+]
+LIFECYCLE_COLUMNS = [
+    "finding_id", "finding_reported_at", "status_since", "seconds_open", "seconds_in_progress",
+    "seconds_resolved", "resolved_at", "reopen_count",
+]
+PHOTO_COLUMNS = [
+    "id", "finding_id", "finding_reported_at", "s3_key", "original_filename", "mime_type", "size", "uploaded_at",
+]
+
+
+@dataclass
+class WeightedPool:
+    """Values with precomputed cumulative weights for fast repeated sampling."""
+
+    values: list
+    cum_weights: list[float]
+
+    @classmethod
+    def build(cls, values: list, weights: list[float]) -> "WeightedPool":
+        """Build a pool from values and their relative weights."""
+        return cls(values, list(itertools.accumulate(weights)))
+
+    @classmethod
+    def zipf(cls, values: list, exponent: float = 1.1) -> "WeightedPool":
+        """Build a pool where a few values are picked far more often than the rest."""
+        return cls.build(values, [1 / (rank ** exponent) for rank in range(1, len(values) + 1)])
+
+    def pick(self, rng: random.Random):
+        """Draw one value."""
+        index = bisect.bisect(self.cum_weights, rng.random() * self.cum_weights[-1])
+        return self.values[min(index, len(self.values) - 1)]
+
+
+def _uuid(rng: random.Random) -> uuid.UUID:
+    """Generate a reproducible UUID from the seeded generator."""
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+
+async def _copy(conn: AsyncConnection, table: str, columns: list[str], records: list[tuple]) -> None:
+    """Bulk load records with COPY on the underlying asyncpg connection."""
+    if not records:
+        return
+    raw = await conn.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(table, records=records, columns=columns)
+
+
+def build_users(rng: random.Random, count: int, created_at: datetime) -> list[tuple]:
+    """Generate reporters and admins spread over departments and sections."""
+    departments = WeightedPool.build(list(DEPARTMENTS), list(DEPARTMENTS.values()))
+    rows = []
+    for i in range(count):
+        department = departments.pick(rng)
+        role = Role.ADMIN if rng.random() < ADMIN_RATIO else Role.REPORTER
+        rows.append((
+            _uuid(rng),
+            # Admins manage findings from the dashboard and mostly lack a Telegram account
+            None if role == Role.ADMIN else 900_000_000 + i,
+            f"user{i}" if rng.random() < 0.7 else None,
+            f"Synthetic User {i}",
+            f"GEN-{i:07d}",
+            department,
+            f"{department} Section {rng.randint(1, SECTIONS_PER_DEPARTMENT)}",
+            # Role is a non-native enum column, which stores member names
+            role.name,
+            rng.random() > 0.03,
+            None,
+            created_at,
+            created_at,
+        ))
+    return rows
+
+
+def build_areas(rng: random.Random, sites: int, created_at: datetime) -> list[tuple]:
+    """Generate a site > zone > spot hierarchy up to three levels deep."""
+    rows = []
+    for s in range(1, sites + 1):
+        site_id = _uuid(rng)
+        site_name = f"Site {s:03d}"
+        rows.append((site_id, site_name, f"Synthetic site {s}", None, 1, created_at))
+        for z in range(1, rng.randint(2, 6) + 1):
+            zone_id = _uuid(rng)
+            zone_name = f"{site_name} Zone {z}"
+            rows.append((zone_id, zone_name, None, site_id, 2, created_at))
+            for p in range(1, rng.randint(0, 4) + 1):
+                rows.append((_uuid(rng), f"{zone_name} Spot {p}", None, zone_id, 3, created_at))
+    return rows
+
+
+_HOUR_POOL = WeightedPool.build(HOURS, HOUR_WEIGHTS)
+
+
+def _reported_at(rng: random.Random, until: datetime, days: int) -> datetime:
+    """Pick a report time, favouring weekdays, working hours and recent dates."""
+    # sqrt skews toward recent days, as report volume grows over time
+    day = int(days * (1 - math.sqrt(rng.random())))
+    date = (until - timedelta(days=day + 1)).date()
+    while rng.random() * max(WEEKDAY_WEIGHTS) > WEEKDAY_WEIGHTS[date.weekday()]:
+        date -= timedelta(days=1)
+    hour = _HOUR_POOL.pick(rng)
+    return datetime(date.year, date.month, date.day, hour, tzinfo=timezone.utc) + timedelta(
+        seconds=rng.randint(0, 3599)
+    )
+
+
+def build_finding(
+    rng: random.Random,
+    sequence: dict[int, int],
+    until: datetime,
+    days: int,
+    reporters: WeightedPool,
+    admins: list[uuid.UUID],
+    areas: WeightedPool,
+    severities: WeightedPool,
+    photo_counts: WeightedPool,
+    photo_types: WeightedPool,
+) -> tuple[tuple, list[tuple], tuple, list[tuple]]:
+    """Generate one finding with its status history, lifecycle and photo metadata."""
+    finding_id = _uuid(rng)
+    reported_at = _reported_at(rng, until, days)
+    sequence[reported_at.year] = sequence.get(reported_at.year, 0) + 1
+    report_id = f"SF-{reported_at.year:04d}-{sequence[reported_at.year]:04d}"
+    reporter_id = reporters.pick(rng)
+    severity = severities.pick(rng)
+
+    history = [
+        (_uuid(rng), finding_id, reported_at, None, Status.OPEN.value, "Finding created", reporter_id, reported_at)
+    ]
+    status = Status.OPEN
+    changed_at = reported_at
+    assignee = None
+    seconds_in = {Status.OPEN: 0.0, Status.IN_PROGRESS: 0.0, Status.RESOLVED: 0.0}
+    resolved_at = None
+    for next_status in TRANSITIONS[1:]:
+        if rng.random() < STALL_PROBABILITY:
+            break
+        next_at = changed_at + timedelta(
+            hours=rng.expovariate(1 / STATUS_DWELL_HOURS[severity][status])
+        )
+        if next_at >= until:
+            break
+        admin_id = rng.choice(admins)
+        assignee = assignee or admin_id
+        history.append(
+            (_uuid(rng), finding_id, reported_at, status.value, next_status.value, None, admin_id, next_at)
+        )
+        seconds_in[status] += (next_at - changed_at).total_seconds()
+        if next_status == Status.RESOLVED:
+            resolved_at = next_at
+        status, changed_at = next_status, next_at
+
+    finding = (
+        finding_id,
+        report_id,
+        reporter_id,
+        areas.pick(rng),
+        (f"{rng.choice(HAZARDS)} {rng.choice(OBJECTS)}. " + "Needs follow-up. " * rng.randint(0, 12)).strip(),
+        severity.value,
+        status.value,
+        f"Bay {rng.randint(1, 40)}" if rng.random() < 0.6 else None,
+        reported_at,
+        changed_at if status == Status.CLOSED else None,
+        assignee,
+        reported_at,
+        changed_at,
+    )
+
+    # Statuses only move forward here, so nothing is reopened
+    lifecycle = (
+        finding_id,
+        reported_at,
+        changed_at,
+        seconds_in[Status.OPEN],
+        seconds_in[Status.IN_PROGRESS],
+        seconds_in[Status.RESOLVED],
+        resolved_at,
+        0,
+    )
+
+    photos = []
+    for n in range(photo_counts.pick(rng)):
+        mime_type, ext = photo_types.pick(rng)
+        photo_id = _uuid(rng)
+        photos.append((
+            photo_id,
+            finding_id,
+            reported_at,
+            f"photos/{photo_id}{ext}",
+            f"IMG_{rng.randint(1000, 9999)}{ext}",
+            mime_type,
+            # Phone photos: log-normal around ~1 MB
+            min(int(rng.lognormvariate(13.8, 0.6)), 20 * 1024 * 1024),
+            reported_at + timedelta(seconds=n * rng.randint(5, 60)),
+        ))
+    return finding, history, lifecycle, photos
+
+
+async def generate(
+    conn: AsyncConnection,
+    findings: int,
+    users: int = 5000,
+    sites: int = 20,
+    days: int = 730,
+    seed: int = 42,
+    until: datetime = DEFAULT_UNTIL,
+    batch_size: int = 50_000,
+    reset: bool = False,
+) -> dict[str, int]:
+    """Load a synthetic dataset on an open connection and return row counts."""
+    rng = random.Random(seed)
+    created_at = until - timedelta(days=days + 30)
+
+    await conn.run_sync(Base.metadata.create_all)
+    await ensure_partitions(conn, (until - timedelta(days=days)).year, until.year)
+    if reset:
+        await conn.execute(text(
+            "TRUNCATE status_history, photos, findings, report_id_counters, finding_daily_counts,"
+            " areas, users CASCADE"
+        ))
+    # Losing the load on a crash is fine, and it avoids a WAL flush per batch
+    await conn.execute(text("SET LOCAL synchronous_commit = off"))
+
+    user_rows = build_users(rng, max(users, 2), created_at)
+    await _copy(conn, "users", USER_COLUMNS, user_rows)
+    area_rows = build_areas(rng, max(sites, 1), created_at)
+    await _copy(conn, "areas", AREA_COLUMNS, area_rows)
+
+    reporter_ids = [row[0] for row in user_rows if row[7] == Role.REPORTER.name]
+    admin_ids = [row[0] for row in user_rows if row[7] == Role.ADMIN.name] or reporter_ids[:1]
+    rng.shuffle(reporter_ids)
+    area_ids = [row[0] for row in area_rows]
+    rng.shuffle(area_ids)
+
+    reporters = WeightedPool.zipf(reporter_ids)
+    areas = WeightedPool.zipf(area_ids, exponent=0.8)
+    severities = WeightedPool.build(list(SEVERITY_WEIGHTS), list(SEVERITY_WEIGHTS.values()))
+    photo_counts = WeightedPool.build(list(range(len(PHOTO_COUNT_WEIGHTS))), PHOTO_COUNT_WEIGHTS)
+    photo_types = WeightedPool.build(
+        [(mime, ext) for mime, ext, _ in PHOTO_TYPES], [weight for *_, weight in PHOTO_TYPES]
+    )
+
+    counts = {"users": len(user_rows), "areas": len(area_rows), "findings": 0, "status_history": 0, "photos": 0}
+    # Continues existing report ID numbering, which must stay unique
+    sequence: dict[int, int] = dict(
+        (await conn.execute(text("SELECT year, last_number FROM report_id_counters"))).all()
+    )
+    # Dashboard counters of the loaded findings, added to any already stored
+    counters: Counter[tuple] = Counter()
+    daily_counts: Counter = Counter()
+    clock = time.perf_counter()
+    for start in range(0, findings, batch_size):
+        finding_rows, history_rows, lifecycle_rows, photo_rows = [], [], [], []
+        for _ in range(min(batch_size, findings - start)):
+            finding, history, lifecycle, photos = build_finding(
+                rng, sequence, until, days, reporters, admin_ids, areas,
+                severities, photo_counts, photo_types,
+            )
+            finding_rows.append(finding)
+            counters[(finding[3], finding[6], finding[5])] += 1
+            daily_counts[finding[8].date()] += 1
+            history_rows.extend(history)
+            lifecycle_rows.append(lifecycle)
+            photo_rows.extend(photos)
+
+        await _copy(conn, "findings", FINDING_COLUMNS, finding_rows)
+        await _copy(conn, "finding_keys", KEY_COLUMNS, [(row[0], row[8], row[1]) for row in finding_rows])
+        await _copy(conn, "status_history", HISTORY_COLUMNS, history_rows)
+        await _copy(conn, "finding_lifecycles", LIFECYCLE_COLUMNS, lifecycle_rows)
+        await _copy(conn, "photos", PHOTO_COLUMNS, photo_rows)
+        counts["findings"] += len(finding_rows)
+        counts["status_history"] += len(history_rows)
+        counts["photos"] += len(photo_rows)
+        rate = counts["findings"] / (time.perf_counter() - clock)
+        print(f"  {counts['findings']:>10,} / {findings:,} findings ({rate:,.0f}/s)")
+
+    if sequence:
+        await conn.execute(
+            text("""
+                INSERT INTO report_id_counters (year, last_number) VALUES (:year, :last_number)
+                ON CONFLICT (year) DO UPDATE SET last_number = EXCLUDED.last_number
+            """),
+            [{"year": year, "last_number": number} for year, number in sequence.items()],
+        )
+    if counters:
+        await conn.execute(
+            text("""
+                INSERT INTO finding_counters (area_id, status, severity, count)
+                VALUES (:area_id, :status, :severity, :count)
+                ON CONFLICT (area_id, status, severity)
+                DO UPDATE SET count = finding_counters.count + EXCLUDED.count
+            """),
+            [
+                {"area_id": area_id, "status": status, "severity": severity, "count": count}
+                for (area_id, status, severity), count in counters.items()
+            ],
+        )
+        await conn.execute(
+            text("""
+                INSERT INTO finding_daily_counts (day, count) VALUES (:day, :count)
+                ON CONFLICT (day) DO UPDATE SET count = finding_daily_counts.count + EXCLUDED.count
+            """),
+            [{"day": day, "count": count} for day, count in daily_counts.items()],
+        )
+    await conn.execute(text(
+        "ANALYZE users, areas, findings, finding_keys, finding_counters, finding_daily_counts,"
+        " finding_lifecycles, status_history, photos"
+    ))
+    return counts
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Run the generator in one transaction."""
+    from app.db.session import engine
+
+    until = datetime.fromisoformat(args.until).replace(tzinfo=timezone.utc) if args.until else DEFAULT_UNTIL
+    started_at = time.perf_counter()
+    async with engine.begin() as conn:
+        counts = await generate(
+            conn,
+            findings=args.findings,
+            users=args.users,
+            sites=args.sites,
+            days=args.days,
+            seed=args.seed,
+            until=until,
+            batch_size=args.batch_size,
+            reset=args.reset,
+        )
+    await engine.dispose()
+
+    print(f"✅ Loaded in {time.perf_counter() - started_at:.1f}s:")
+    for table, count in counts.items():
+        print(f"   {table}: {count:,}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a synthetic dataset with COPY")
+    parser.add_argument("--findings", type=int, default=1_000_000, help="Number of findings")
+    parser.add_argument("--users", type=int, default=5000, help="Number of users (about 2%% admins)")
+    parser.add_argument("--sites", type=int, default=20, help="Number of level-1 areas")
+    parser.add_argument("--days", type=int, default=730, help="Spread findings over this many days")
+    parser.add_argument("--until", help="Latest report date, YYYY-MM-DD (default: 2026-01-01)")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--batch-size", type=int, default=50_000, help="Findings per COPY batch")
+    parser.add_argument("--reset", action="store_true", help="Truncate existing data first")
+
+    asyncio.run(main(parser.parse_args()))
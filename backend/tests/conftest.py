@@ -0,0 +1,109 @@
+"""Shared test fixtures.
+
+Tests that need Postgres run against ``TEST_DATABASE_URL``, which is wiped and
+loaded with a small synthetic dataset; they are skipped when it is unset or
+unreachable. Query budgets are enforced in ``raise`` mode throughout.
+"""
+import asyncio
+import os
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+import pytest
+
+# Read by the settings on import, so set before anything imports the app
+os.environ["QUERY_BUDGET_MODE"] = "raise"
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL", "")
+if TEST_DATABASE_URL:
+    os.environ["DATABASE_URL"] = TEST_DATABASE_URL
+    os.environ["DATABASE_REPLICA_URL"] = ""
+
+from sqlalchemy import insert, select, text  # noqa: E402
+
+from app.core.security import create_access_token  # noqa: E402
+from app.db.session import engine  # noqa: E402
+from app.models import Finding, User  # noqa: E402
+from app.models.user import Role  # noqa: E402
+
+
+@dataclass(frozen=True)
+class Dataset:
+    """Rows of the seeded dataset that tests drive requests with."""
+
+    admin_token: str
+    reporter_telegram_id: int
+    finding_id: uuid.UUID
+    finding_reported_at: datetime
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+async def _seed() -> Dataset:
+    from scripts.generate_dataset import generate
+
+    async with engine.begin() as conn:
+        await generate(conn, findings=300, users=40, sites=3, days=60, seed=7, reset=True)
+        admin_id = uuid.uuid4()
+        now = datetime.now(timezone.utc)
+        await conn.execute(insert(User.__table__), [{
+            "id": admin_id,
+            "full_name": "Test Admin",
+            "staff_id": "TEST-ADMIN",
+            "department": "Administration",
+            "section": "IT",
+            "role": Role.SUPER_ADMIN,
+            "is_active": True,
+            "created_at": now,
+            "updated_at": now,
+        }])
+        # The busiest reporter, so list pages are full
+        reporter_id, telegram_id = (await conn.execute(
+            select(User.id, User.telegram_id)
+            .join(Finding, Finding.reporter_id == User.id)
+            .group_by(User.id)
+            .order_by(text("count(*) DESC"))
+            .limit(1)
+        )).one()
+        finding_id, reported_at = (await conn.execute(
+            select(Finding.id, Finding.reported_at).where(Finding.reporter_id == reporter_id).limit(1)
+        )).one()
+    await engine.dispose()
+    return Dataset(create_access_token(subject=str(admin_id)), telegram_id, finding_id, reported_at)
+
+
+@pytest.fixture(scope="session")
+def dataset() -> Dataset:
+    """Load the synthetic dataset into the test database once per run."""
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL is not set")
+    try:
+        return asyncio.run(_seed())
+    except OSError as exc:
+        pytest.skip(f"Test database is unreachable: {exc}")
+
+
+@pytest.fixture
+async def db_engine(dataset: Dataset):
+    """Drop pooled connections after each test, since each test runs its own event loop."""
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def fake_telegram(monkeypatch):
+    """Point the bot at a local fake Bot API and record the calls it makes."""
+    from app.core.config import settings
+    from tests.fake_telegram import FakeTelegram
+
+    telegram = FakeTelegram()
+    await telegram.start()
+    monkeypatch.setattr(settings, "TELEGRAM_API_BASE_URL", telegram.base_url)
+    monkeypatch.setattr(settings, "TELEGRAM_BOT_TOKEN", "123456:TEST-TOKEN")
+    # Built on first use, so from the settings above
+    monkeypatch.setattr("app.bot.bot_app", None)
+    yield telegram
+    await telegram.stop()
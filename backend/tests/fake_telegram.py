@@ -0,0 +1,81 @@
+"""A local stand-in for the Telegram Bot API, for ``TELEGRAM_API_BASE_URL``."""
+import asyncio
+import json
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import parse_qsl
+
+BOT_USER = {"id": 100200300, "is_bot": True, "first_name": "Safety", "username": "safety_test_bot"}
+
+
+@dataclass
+class FakeTelegram:
+    """Answers Bot API calls over plain HTTP and records them as (method, params)."""
+
+    calls: list[tuple[str, dict[str, Any]]] = field(default_factory=list)
+    server: asyncio.AbstractServer | None = None
+    _writers: set[asyncio.StreamWriter] = field(default_factory=set)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    def params(self, method: str) -> list[dict[str, Any]]:
+        """Get the parameters of every call to a method, oldest first."""
+        return [params for called, params in self.calls if called == method]
+
+    async def start(self) -> None:
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+
+    async def stop(self) -> None:
+        self.server.close()
+        for writer in self._writers:
+            writer.close()
+        await self.server.wait_closed()
+
+    def _result(self, method: str, params: dict[str, Any]) -> Any:
+        if method == "getMe":
+            return BOT_USER
+        if method == "sendMessage":
+            return {
+                "message_id": len(self.calls),
+                "date": 0,
+                "chat": {"id": int(params["chat_id"]), "type": "private"},
+                "text": params.get("text", ""),
+            }
+        return True
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._writers.add(writer)
+        try:
+            # Connections are kept alive, so serve requests until the client closes
+            while request_line := await reader.readline():
+                headers = {}
+                while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    name, _, value = line.decode().partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+
+                # Paths are /bot<token>/<method>
+                method = request_line.split(b" ")[1].decode().rsplit("/", 1)[-1]
+                params = {}
+                for key, value in parse_qsl(body.decode()):
+                    try:
+                        params[key] = json.loads(value)
+                    except ValueError:
+                        params[key] = value
+                self.calls.append((method, params))
+
+                payload = json.dumps({"ok": True, "result": self._result(method, params)}).encode()
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    + f"Content-Length: {len(payload)}\r\n\r\n".encode()
+                    + payload
+                )
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
@@ -0,0 +1,74 @@
+"""The process's shared LISTEN connection."""
+import asyncio
+
+import pytest
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.db.listen import listener
+from app.db.session import async_session
+
+pytestmark = pytest.mark.anyio
+
+
+async def _notify(channel: str, payload: str) -> None:
+    async with async_session() as db:
+        await db.execute(text("SELECT pg_notify(:channel, :payload)"), {"channel": channel, "payload": payload})
+        await db.commit()
+
+
+async def _listen_connections() -> int:
+    async with async_session() as db:
+        return await db.scalar(
+            text("SELECT count(*) FROM pg_stat_activity WHERE application_name = :name"),
+            {"name": f"{settings.DB_APPLICATION_NAME}-{listener.name}"},
+        )
+
+
+async def _wait_for(condition, timeout: float = 5.0) -> None:
+    async with asyncio.timeout(timeout):
+        while not await condition():
+            await asyncio.sleep(0.02)
+
+
+async def test_feeds_share_one_connection_and_get_their_own_channels(db_engine) -> None:
+    received: dict[str, list[str]] = {"a": [], "b": [], "both": []}
+    connected = {"a": asyncio.Event(), "b": asyncio.Event()}
+
+    feed_a = listener.subscribe({"test_a": received["a"].append}, on_connect=connected["a"].set)
+    feed_b = listener.subscribe(
+        {"test_b": received["b"].append, "test_a": received["both"].append},
+        on_connect=connected["b"].set,
+    )
+    try:
+        # Each feed resynchronizes once its channels are listened on
+        async with asyncio.timeout(5):
+            await connected["a"].wait()
+            await connected["b"].wait()
+        assert await _listen_connections() == 1
+
+        await _notify("test_a", "one")
+        await _notify("test_b", "two")
+
+        async def delivered() -> bool:
+            return received == {"a": ["one"], "b": ["two"], "both": ["one"]}
+
+        await _wait_for(delivered)
+
+        # Leaving feeds stop getting notifications; the last one closes the connection
+        await listener.unsubscribe(feed_b)
+        await _notify("test_a", "three")
+
+        async def delivered_to_a() -> bool:
+            return received["a"] == ["one", "three"]
+
+        await _wait_for(delivered_to_a)
+        assert received["both"] == ["one"]
+    finally:
+        await listener.unsubscribe(feed_a)
+        await listener.unsubscribe(feed_b)
+
+    async def closed() -> bool:
+        return await _listen_connections() == 0
+
+    await _wait_for(closed)
@@ -0,0 +1,46 @@
+"""Login throttling per staff ID and IP, per staff ID, and per IP."""
+from app.core.rate_limit import LoginThrottle
+
+
+def _throttle() -> LoginThrottle:
+    return LoginThrottle(
+        max_failures_per_staff_id=3,
+        max_failures_per_account=10,
+        max_attempts_per_ip=100,
+        window_seconds=300,
+    )
+
+
+def _fail(throttle: LoginThrottle, staff_id: str, client_ip: str) -> int:
+    retry_after = throttle.check(staff_id, client_ip)
+    if not retry_after:
+        throttle.record_failure(staff_id, client_ip)
+    return retry_after
+
+
+def test_failures_from_one_ip_lock_out_only_that_ip() -> None:
+    throttle = _throttle()
+    for _ in range(3):
+        assert _fail(throttle, "ADM001", "10.0.0.1") == 0
+    assert throttle.check("adm001 ", "10.0.0.1") > 0
+    # The account's owner can still log in from elsewhere
+    assert throttle.check("ADM001", "10.0.0.2") == 0
+
+
+def test_failures_spread_across_ips_lock_out_the_staff_id() -> None:
+    throttle = _throttle()
+    # Two guesses from each address stay under the per-IP limit
+    for n in range(10):
+        assert _fail(throttle, "ADM001", f"10.0.0.{n // 2}") == 0
+    assert throttle.check("ADM001", "10.0.1.1") > 0
+    # Other staff IDs are unaffected
+    assert throttle.check("ADM002", "10.0.1.1") == 0
+
+
+def test_success_keeps_failures_from_other_ips() -> None:
+    throttle = _throttle()
+    for n in range(9):
+        _fail(throttle, "ADM001", f"10.0.0.{n}")
+    throttle.record_success("ADM001", "10.0.0.0")
+    _fail(throttle, "ADM001", "10.0.0.99")
+    assert throttle.check("ADM001", "10.0.1.1") > 0
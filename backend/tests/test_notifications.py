@@ -0,0 +1,78 @@
+"""Admin alerts for new findings, as retried by the outbox."""
+import asyncio
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.bot.notifications import NotificationDispatcher, _on_finding_created, notification_dispatcher
+from app.bot.subscribers import subscriber_index
+from app.core.config import settings
+from app.models.finding import Severity, Status
+
+pytestmark = pytest.mark.anyio
+
+NOW = datetime(2026, 10, 19, 8, 0, tzinfo=timezone.utc)
+PAYLOAD = {
+    "id": str(uuid.uuid4()),
+    "report_id": "SF-2026-0001",
+    "reporter_id": str(uuid.uuid4()),
+    "area_id": str(uuid.uuid4()),
+    "description": "Blocked fire exit",
+    "severity": Severity.CRITICAL.value,
+    "status": Status.OPEN.value,
+    "location": None,
+    "reported_at": NOW.isoformat(),
+    "closed_at": None,
+    "assigned_to": None,
+    "created_at": NOW.isoformat(),
+    "updated_at": NOW.isoformat(),
+}
+
+
+@pytest.fixture
+def admins(monkeypatch):
+    """Three admins subscribed to new findings, and the chats each send went to."""
+    monkeypatch.setattr(settings, "TELEGRAM_BOT_TOKEN", "123456:TEST-TOKEN")
+    monkeypatch.setattr(NotificationDispatcher, "running", True)
+    monkeypatch.setattr(subscriber_index, "refresh", AsyncMock())
+    monkeypatch.setattr(subscriber_index, "area_name", lambda area_id: "Warehouse")
+    monkeypatch.setattr(subscriber_index, "recipients", lambda kind, area_id: [
+        SimpleNamespace(user_id=uuid.uuid4(), telegram_id=chat_id) for chat_id in (101, 102, 103)
+    ])
+    sends: list[list[int]] = []
+    failing = {102}
+
+    def notify(chat_ids: list[int], notice) -> list[asyncio.Future]:
+        sends.append(list(chat_ids))
+        receipts = []
+        for chat_id in chat_ids:
+            receipt = asyncio.get_running_loop().create_future()
+            if chat_id in failing:
+                receipt.set_exception(RuntimeError(f"Chat {chat_id} timed out"))
+            else:
+                receipt.set_result(True)
+            receipts.append(receipt)
+        failing.clear()
+        return receipts
+
+    monkeypatch.setattr(notification_dispatcher, "notify", notify)
+    return sends
+
+
+async def test_retry_alerts_only_the_chats_that_failed(admins) -> None:
+    delivered: set[str] = set()
+    with pytest.raises(RuntimeError, match="not delivered to 1 of 3 chats"):
+        await _on_finding_created(PAYLOAD, delivered)
+    assert delivered == {"101", "103"}
+
+    await _on_finding_created(PAYLOAD, delivered)
+    assert admins == [[101, 102, 103], [102]]
+    assert delivered == {"101", "102", "103"}
+
+
+async def test_alert_skips_chats_delivered_in_earlier_attempts(admins) -> None:
+    await _on_finding_created(PAYLOAD, {"101", "102", "103"})
+    assert admins == []
@@ -0,0 +1,149 @@
+"""Outbox dispatch: leased claims, handlers outside transactions, and settling."""
+import asyncio
+import uuid
+
+import pytest
+from sqlalchemy import delete, select, text
+
+from app.core.config import settings
+from app.db.session import async_session
+from app.models.outbox import OutboxEvent
+from app.repositories.outbox import OutboxRepository
+from app.services.outbox import OutboxDispatcher
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def outbox(db_engine):
+    """Start and end each test with an empty outbox."""
+    async with async_session() as db:
+        await db.execute(delete(OutboxEvent))
+        await db.commit()
+    yield
+    async with async_session() as db:
+        await db.execute(delete(OutboxEvent))
+        await db.commit()
+
+
+async def _add(event_type: str, count: int = 1) -> None:
+    async with async_session() as db:
+        for n in range(count):
+            OutboxRepository(db).add(event_type, uuid.uuid4(), {"n": n})
+        await db.commit()
+
+
+async def _events() -> list[OutboxEvent]:
+    async with async_session() as db:
+        return list((await db.execute(select(OutboxEvent).order_by(OutboxEvent.id))).scalars().all())
+
+
+async def _idle_in_transaction() -> int:
+    async with async_session() as db:
+        return await db.scalar(text(
+            "SELECT count(*) FROM pg_stat_activity "
+            "WHERE datname = current_database() AND state LIKE 'idle in transaction%'"
+        ))
+
+
+async def test_slow_handler_holds_no_transaction_or_other_events(outbox) -> None:
+    release = asyncio.Event()
+    fast_done: list[dict] = []
+
+    async def slow(payload: dict, steps: set[str]) -> None:
+        await release.wait()
+
+    async def fast(payload: dict, steps: set[str]) -> None:
+        fast_done.append(payload)
+
+    dispatcher = OutboxDispatcher(batch_size=10, poll_interval=0.05)
+    dispatcher.register("test.slow", "slow", slow)
+    dispatcher.register("test.fast", "fast", fast)
+    await _add("test.slow")
+    dispatcher.start()
+    try:
+        await asyncio.sleep(0.2)
+        # Claimed and committed; the handler waits without a transaction
+        assert await _idle_in_transaction() == 0
+        [slow_event] = await _events()
+        assert slow_event.attempts == 0
+
+        # Later events are dispatched while the slow one is still running
+        await _add("test.fast", 3)
+        async with asyncio.timeout(5):
+            # Settled after their handlers return, so wait for the events to be gone too
+            while len(fast_done) < 3 or len(await _events()) > 1:
+                await asyncio.sleep(0.02)
+        assert [event.event_type for event in await _events()] == ["test.slow"]
+    finally:
+        release.set()
+        await dispatcher.stop()
+    assert await _events() == []
+
+
+async def test_failed_handler_is_retried_without_the_completed_ones(outbox, monkeypatch) -> None:
+    monkeypatch.setattr(settings, "OUTBOX_RETRY_BASE_SECONDS", 0.0)
+    calls = {"sent": 0, "broken": 0}
+
+    async def sent(payload: dict, steps: set[str]) -> None:
+        calls["sent"] += 1
+
+    async def broken(payload: dict, steps: set[str]) -> None:
+        calls["broken"] += 1
+        if calls["broken"] == 1:
+            raise RuntimeError("Telegram is down")
+
+    dispatcher = OutboxDispatcher(batch_size=10, poll_interval=0.05)
+    dispatcher.register("test.created", "sent", sent)
+    dispatcher.register("test.created", "broken", broken)
+    await _add("test.created")
+    dispatcher.start()
+    try:
+        async with asyncio.timeout(5):
+            while await _events():
+                await asyncio.sleep(0.02)
+    finally:
+        await dispatcher.stop()
+    assert calls == {"sent": 1, "broken": 2}
+
+
+async def test_retry_gets_back_the_steps_done_before_a_failure(outbox, monkeypatch) -> None:
+    monkeypatch.setattr(settings, "OUTBOX_RETRY_BASE_SECONDS", 0.0)
+    attempts: list[set[str]] = []
+
+    async def fan_out(payload: dict, steps: set[str]) -> None:
+        attempts.append(set(steps))
+        steps.update({"101", "103"})
+        if len(attempts) == 1:
+            raise RuntimeError("Chat 102 timed out")
+        steps.add("102")
+
+    dispatcher = OutboxDispatcher(batch_size=10, poll_interval=0.05)
+    dispatcher.register("test.created", "fan_out", fan_out)
+    await _add("test.created")
+    dispatcher.start()
+    try:
+        async with asyncio.timeout(5):
+            while await _events():
+                await asyncio.sleep(0.02)
+    finally:
+        await dispatcher.stop()
+    assert attempts == [set(), {"101", "103"}]
+
+
+async def test_expired_lease_is_taken_over_and_the_late_settle_ignored(outbox) -> None:
+    await _add("test.created")
+    async with async_session() as db:
+        [first] = await OutboxRepository(db).claim(10, lease_seconds=0)
+        await db.commit()
+    async with async_session() as db:
+        # The lease ran out, so another dispatcher takes the event over
+        [second] = await OutboxRepository(db).claim(10, lease_seconds=600)
+        await db.commit()
+    assert second.id == first.id
+
+    async with async_session() as db:
+        assert not await OutboxRepository(db).complete(first)
+        assert await OutboxRepository(db).complete(second)
+        await db.commit()
+    assert await _events() == []
@@ -0,0 +1,42 @@
+"""Finding partitions created ahead when the API starts."""
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.db.partitions import PARTITIONED_TABLES, partition_name
+from app.db.session import engine, init_db
+
+pytestmark = pytest.mark.anyio
+
+
+async def _existing(names: list[str]) -> set[str]:
+    async with engine.connect() as conn:
+        result = await conn.execute(
+            text("SELECT relname FROM pg_class WHERE relname = ANY(:names)"), {"names": names}
+        )
+        return set(result.scalars().all())
+
+
+async def test_startup_creates_upcoming_partitions(db_engine, monkeypatch) -> None:
+    # Further ahead than any partition a migration or earlier run made
+    ahead = 5
+    year = datetime.now(timezone.utc).year + ahead
+    names = [partition_name(table, year) for table in PARTITIONED_TABLES]
+    assert await _existing(names) == set()
+
+    monkeypatch.setattr(settings, "FINDING_PARTITION_YEARS_AHEAD", ahead)
+    try:
+        await init_db()
+        assert await _existing(names) == set(names)
+        # A second start finds them and creates nothing
+        await init_db()
+    finally:
+        # Detached first, since foreign keys to findings depend on its partitions
+        async with engine.begin() as conn:
+            for table in reversed(PARTITIONED_TABLES):
+                name = partition_name(table, year)
+                if name in await _existing([name]):
+                    await conn.execute(text(f"ALTER TABLE {table} DETACH PARTITION {name}"))
+                    await conn.execute(text(f"DROP TABLE {name}"))
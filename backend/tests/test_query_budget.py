@@ -0,0 +1,205 @@
+"""Query budgets of the hot API routes and bot callbacks, enforced in raise mode."""
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+from fastapi import Depends, FastAPI
+from sqlalchemy import event
+
+from app.bot.handlers.common import (
+    encode_reports_cursor,
+    my_reports_back_callback,
+    my_reports_command,
+    my_reports_detail_callback,
+    my_reports_more_callback,
+)
+from app.bot.instrumentation import _timed_callback
+from app.bot.rendering import card_cache, line_cache, page_cache
+from app.bot.user_cache import user_cache
+from app.core import query_budget
+from app.core.instrumentation import MetricsMiddleware, QueryStats, current_query_stats
+from app.core.query_budget import QueryBudget, QueryBudgetExceeded
+from app.main import app
+
+pytestmark = pytest.mark.anyio
+
+
+def _run_statements(count: int) -> None:
+    """Record distinct statements, as the engine hooks would."""
+    stats = current_query_stats.get()
+    for i in range(count):
+        stats.record(f"SELECT {i}", 0.0)
+
+
+def _budget_app() -> FastAPI:
+    budget_app = FastAPI()
+
+    @budget_app.get("/within", dependencies=[Depends(QueryBudget(2))])
+    async def within() -> dict:
+        _run_statements(2)
+        return {}
+
+    @budget_app.get("/over", dependencies=[Depends(QueryBudget(2))])
+    async def over() -> dict:
+        _run_statements(3)
+        return {}
+
+    @budget_app.get("/unbudgeted")
+    async def unbudgeted() -> dict:
+        stats = current_query_stats.get()
+        for _ in range(3):
+            stats.record("SELECT * FROM findings WHERE id = $1::UUID", 0.0)
+        return {}
+
+    return MetricsMiddleware(budget_app)
+
+
+async def _call(asgi_app, path: str) -> list[dict]:
+    """Call an ASGI app directly and return the messages it sent."""
+    sent: list[dict] = []
+
+    async def receive() -> dict:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict) -> None:
+        sent.append(message)
+
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "query_string": b"",
+        "root_path": "", "headers": [], "client": ("127.0.0.1", 1), "server": ("test", 80),
+    }
+    await asgi_app(scope, receive, send)
+    return sent
+
+
+async def test_budget_within_limit_responds() -> None:
+    sent = await _call(_budget_app(), "/within")
+    assert sent[0]["status"] == 200
+
+
+async def test_budget_overrun_fails_before_the_response_is_sent() -> None:
+    sent: list[dict] = []
+    with pytest.raises(QueryBudgetExceeded, match="executed 3 SQL statements, budget is 2"):
+        sent = await _call(_budget_app(), "/over")
+    assert sent == []
+
+
+async def test_unbudgeted_overrun_is_recorded_after_the_response() -> None:
+    query_budget.late_overruns.clear()
+    sent = await _call(_budget_app(), "/unbudgeted")
+    assert sent[0]["status"] == 200
+    assert len(query_budget.late_overruns) == 1
+    assert "possible N+1: 3x" in query_budget.late_overruns[0]
+    query_budget.late_overruns.clear()
+
+
+@pytest.fixture
+def executed(db_engine) -> list[QueryStats]:
+    """Collect the query stats of each request or bot update that runs SQL."""
+    collected: list[QueryStats] = []
+
+    def collect(*args) -> None:
+        stats = current_query_stats.get()
+        if stats is not None and not any(stats is seen for seen in collected):
+            collected.append(stats)
+
+    event.listen(db_engine.sync_engine, "after_cursor_execute", collect)
+    yield collected
+    event.remove(db_engine.sync_engine, "after_cursor_execute", collect)
+
+
+def assert_statements(executed: list[QueryStats], statements: int, budget: int) -> None:
+    """Check the exact statements run, so budgets stay tight as queries change."""
+    [stats] = executed
+    assert stats.count == statements
+    assert stats.budget == budget
+
+
+@pytest.fixture
+async def client(dataset, db_engine):
+    """An API client authenticated as a super-admin."""
+    query_budget.late_overruns.clear()
+    transport = httpx.ASGITransport(app=app)
+    headers = {"Authorization": f"Bearer {dataset.admin_token}"}
+    async with httpx.AsyncClient(transport=transport, base_url="http://test", headers=headers) as client:
+        yield client
+    assert query_budget.late_overruns == []
+
+
+# Every route looks up the current user first. Routes that restore archived
+# findings budget one more statement, for the users those findings refer to.
+@pytest.mark.parametrize(("path", "statements", "budget"), [
+    ("/api/v1/findings", 6, 7),
+    ("/api/v1/findings?page=2&page_size=100", 6, 7),
+    ("/api/v1/findings/stats", 4, 4),
+    ("/api/v1/findings/resolution", 2, 2),
+    ("/api/v1/findings/resolution?group_by=area", 2, 2),
+    ("/api/v1/findings/resolution?group_by=assignee", 2, 2),
+    ("/api/v1/findings/trends", 2, 2),
+    ("/api/v1/admin/users", 3, 3),
+])
+async def test_hot_routes_stay_within_budget(client, executed, path: str, statements: int, budget: int) -> None:
+    response = await client.get(path)
+    assert response.status_code == 200, response.text
+    assert_statements(executed, statements, budget)
+
+
+async def test_finding_detail_stays_within_budget(client, executed, dataset) -> None:
+    response = await client.get(f"/api/v1/findings/{dataset.finding_id}")
+    assert response.status_code == 200, response.text
+    assert_statements(executed, 5, 6)
+
+
+async def test_summary_stays_within_budget(client, executed, dataset) -> None:
+    date_from = (dataset.finding_reported_at - timedelta(days=30)).isoformat()
+    response = await client.post("/api/v1/findings/summary", params={"date_from": date_from})
+    assert response.status_code == 200, response.text
+    assert response.json()["total_findings"] > 0
+    assert_statements(executed, 6, 6)
+
+
+@pytest.fixture
+def cold_bot_caches(dataset, db_engine):
+    """Start bot callbacks from empty caches, their most expensive case."""
+    user_cache.clear()
+    for cache in (card_cache, line_cache, page_cache):
+        cache.discard(lambda key: True)
+
+
+def _update(telegram_id: int, data: str | None = None) -> SimpleNamespace:
+    message = SimpleNamespace(reply_text=AsyncMock())
+    query = SimpleNamespace(data=data, answer=AsyncMock(), edit_message_text=AsyncMock())
+    return SimpleNamespace(
+        effective_user=SimpleNamespace(id=telegram_id),
+        effective_message=message,
+        callback_query=query if data is not None else None,
+    )
+
+
+async def test_my_reports_command_stays_within_budget(dataset, cold_bot_caches, executed) -> None:
+    update = _update(dataset.reporter_telegram_id)
+    await _timed_callback(my_reports_command, "common.my_reports_command")(update, None)
+    update.effective_message.reply_text.assert_awaited_once()
+    assert_statements(executed, 3, 3)
+
+
+@pytest.mark.parametrize(("callback", "statements", "budget"), [
+    (my_reports_detail_callback, 6, 7),
+    (my_reports_back_callback, 3, 3),
+    (my_reports_more_callback, 3, 3),
+])
+async def test_my_reports_callbacks_stay_within_budget(
+    dataset, cold_bot_caches, executed, callback, statements: int, budget: int
+) -> None:
+    data = {
+        my_reports_detail_callback: f"myreports_detail_{dataset.finding_id}",
+        my_reports_back_callback: "myreports_back",
+        my_reports_more_callback: encode_reports_cursor(dataset.finding_reported_at, dataset.finding_id, 5),
+    }[callback]
+    update = _update(dataset.reporter_telegram_id, data)
+    await _timed_callback(callback, f"common.{callback.__name__}")(update, None)
+    update.callback_query.edit_message_text.assert_awaited_once()
+    assert_statements(executed, statements, budget)
@@ -0,0 +1,157 @@
+"""The Telegram webhook route and webhook registration, against a fake Bot API."""
+import asyncio
+
+import httpx
+import pytest
+from sqlalchemy import delete, select
+
+from app.bot.lifecycle import ALLOWED_UPDATES, WebhookRunner, start_webhook, stop_webhook
+from app.core.config import settings
+from app.db.session import async_session
+from app.main import app
+from app.models.telegram_update import TelegramUpdate
+
+pytestmark = pytest.mark.anyio
+
+SECRET = "test-webhook-secret"
+WEBHOOK_URL = "https://safety.example.com/api/v1/telegram/webhook"
+UPDATE = {
+    "update_id": 501,
+    "message": {
+        "message_id": 7,
+        "date": 1760000000,
+        "chat": {"id": 900000001, "type": "private"},
+        "from": {"id": 900000001, "is_bot": False, "first_name": "Reporter"},
+        "text": "/help",
+        "entities": [{"type": "bot_command", "offset": 0, "length": 5}],
+    },
+}
+
+
+@pytest.fixture
+def webhook_settings(monkeypatch):
+    monkeypatch.setattr(settings, "TELEGRAM_WEBHOOK_URL", WEBHOOK_URL)
+    monkeypatch.setattr(settings, "TELEGRAM_WEBHOOK_SECRET", SECRET)
+    monkeypatch.setattr(settings, "TELEGRAM_WEBHOOK_LOCK_CHECK_SECONDS", 0.05)
+
+
+@pytest.fixture
+async def client(webhook_settings):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+async def _post_update(client: httpx.AsyncClient, secret: str | None) -> httpx.Response:
+    headers = {"X-Telegram-Bot-Api-Secret-Token": secret} if secret is not None else {}
+    return await client.post("/api/v1/telegram/webhook", json=UPDATE, headers=headers)
+
+
+@pytest.mark.parametrize("secret", [None, "", "wrong-secret"])
+async def test_webhook_rejects_requests_without_the_secret(client, secret) -> None:
+    response = await _post_update(client, secret)
+    assert response.status_code == 403
+
+
+@pytest.fixture
+async def update_queue(db_engine):
+    """Start and end each test with no queued updates."""
+    async with async_session() as db:
+        await db.execute(delete(TelegramUpdate))
+        await db.commit()
+    yield
+    async with async_session() as db:
+        await db.execute(delete(TelegramUpdate))
+        await db.commit()
+
+
+async def _queued() -> list[int]:
+    async with async_session() as db:
+        return list((await db.execute(select(TelegramUpdate.update_id))).scalars().all())
+
+
+async def test_webhook_queues_updates_while_no_replica_runs_the_bot(client, update_queue) -> None:
+    response = await _post_update(client, SECRET)
+    assert response.status_code == 200
+    assert response.json() == {"ok": True}
+
+    # Telegram redelivers when unsure; the update is stored once
+    response = await _post_update(client, SECRET)
+    assert response.status_code == 200
+    assert await _queued() == [UPDATE["update_id"]]
+
+
+@pytest.mark.parametrize("payload", [{}, {"update_id": "501"}, {"update_id": 501, "message": "hi"}])
+async def test_webhook_rejects_invalid_updates(client, update_queue, payload) -> None:
+    response = await client.post(
+        "/api/v1/telegram/webhook", json=payload, headers={"X-Telegram-Bot-Api-Secret-Token": SECRET}
+    )
+    assert response.status_code == 400
+    assert await _queued() == []
+
+
+async def test_start_webhook_registers_and_keeps_the_webhook(
+    dataset, db_engine, webhook_settings, fake_telegram
+) -> None:
+    application = await start_webhook()
+    try:
+        assert application.running
+        [params] = fake_telegram.params("setWebhook")
+        assert params["url"] == WEBHOOK_URL
+        assert params["secret_token"] == SECRET
+        assert params["allowed_updates"] == ALLOWED_UPDATES
+        assert params["max_connections"] == settings.TELEGRAM_WEBHOOK_MAX_CONNECTIONS
+        assert fake_telegram.params("setMyCommands")
+    finally:
+        await stop_webhook(application)
+    # Left registered, so updates queue at Telegram until the next replica starts
+    assert not fake_telegram.params("deleteWebhook")
+
+
+async def _wait_for(condition, timeout: float = 10.0) -> None:
+    async with asyncio.timeout(timeout):
+        while not condition():
+            await asyncio.sleep(0.02)
+
+
+async def test_only_the_lock_holder_runs_the_bot(
+    dataset, db_engine, webhook_settings, fake_telegram
+) -> None:
+    owner, standby = WebhookRunner(), WebhookRunner()
+    owner.start()
+    try:
+        await _wait_for(lambda: owner.application is not None)
+        standby.start()
+        await asyncio.sleep(settings.TELEGRAM_WEBHOOK_LOCK_CHECK_SECONDS * 5)
+        assert standby.application is None
+        assert len(fake_telegram.params("setWebhook")) == 1
+
+        # The standby takes over once the owner has stopped and released the lock
+        await owner.stop()
+        await _wait_for(lambda: standby.application is not None)
+        assert len(fake_telegram.params("setWebhook")) == 2
+    finally:
+        await owner.stop()
+        await standby.stop()
+
+
+async def test_any_replica_accepts_updates_for_the_lock_holder(
+    dataset, client, update_queue, fake_telegram
+) -> None:
+    # Queued before any replica runs the bot, so picked up once one does
+    response = await _post_update(client, SECRET)
+    assert response.status_code == 200
+
+    owner, standby = WebhookRunner(), WebhookRunner()
+    owner.start()
+    standby.start()
+    try:
+        await _wait_for(lambda: fake_telegram.params("sendMessage"))
+        [reply] = fake_telegram.params("sendMessage")
+        assert int(reply["chat_id"]) == UPDATE["message"]["chat"]["id"]
+        assert "Safety Inspection Bot Help" in reply["text"]
+        assert await _queued() == []
+        assert (owner.application is None) != (standby.application is None)
+    finally:
+        await owner.stop()
+        await standby.stop()
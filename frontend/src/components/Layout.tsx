@@ -1,10 +1,12 @@
 import { Outlet, Link, useLocation, useNavigate } from 'react-router-dom'
 import { useAuth } from '../hooks/useAuth'
+import { useFindingStream } from '../hooks/useFindingStream'
 
 function Layout() {
   const { user, logout } = useAuth()
   const location = useLocation()
   const navigate = useNavigate()
+  useFindingStream(!!user)
 
   const handleLogout = () => {
     logout()
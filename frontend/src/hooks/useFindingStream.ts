@@ -0,0 +1,23 @@
+import { useEffect } from 'react'
+import { useQueryClient } from '@tanstack/react-query'
+import { API_URL } from '../services/api'
+
+const FINDING_EVENTS = ['finding.created', 'finding.status_changed', 'finding.assigned', 'reset']
+
+// Keeps cached findings fresh from the live feed; EventSource reconnects and resumes on its own
+export function useFindingStream(enabled: boolean) {
+  const queryClient = useQueryClient()
+
+  useEffect(() => {
+    const token = localStorage.getItem('access_token')
+    if (!enabled || !token) return
+
+    const source = new EventSource(
+      `${API_URL}/api/v1/findings/stream?access_token=${encodeURIComponent(token)}`
+    )
+    const refresh = () => queryClient.invalidateQueries({ queryKey: ['findings'] })
+    FINDING_EVENTS.forEach((event) => source.addEventListener(event, refresh))
+
+    return () => source.close()
+  }, [enabled, queryClient])
+}
@@ -7,15 +7,20 @@ function DashboardPage() {
     queryFn: () => findingsApi.list({ page_size: 10 }),
   })
 
+  const { data: statsData } = useQuery({
+    queryKey: ['findings', 'stats'],
+    queryFn: () => findingsApi.stats(),
+  })
+
   const findings = findingsData?.items || []
 
-  // Calculate statistics
   const stats = {
-    total: findings.length,
-    open: findings.filter((f) => f.status === 'open').length,
-    inProgress: findings.filter((f) => f.status === 'in_progress').length,
-    critical: findings.filter((f) => f.severity === 'critical').length,
+    total: statsData?.total ?? 0,
+    open: statsData?.by_status.open ?? 0,
+    inProgress: statsData?.by_status.in_progress ?? 0,
+    critical: statsData?.by_severity.critical ?? 0,
   }
+  const oldestCritical = statsData?.oldest_open_critical
 
   const severityColors = {
     low: 'severity-low',
@@ -55,6 +60,21 @@ function DashboardPage() {
         </div>
       </div>
 
+      {statsData && (
+        <div className="mb-8 text-sm text-gray-600">
+          {statsData.reported_today} reported today • {statsData.reported_this_week} this week
+          {oldestCritical && (
+            <>
+              {' • '}Oldest open critical:{' '}
+              <a href={`/findings/${oldestCritical.id}`} className="text-red-600 hover:text-red-800">
+                {oldestCritical.report_id}
+              </a>{' '}
+              ({oldestCritical.area_name}, {new Date(oldestCritical.reported_at).toLocaleDateString()})
+            </>
+          )}
+        </div>
+      )}
+
       {/* Recent Findings */}
       <div className="bg-white rounded-lg shadow">
         <div className="px-6 py-4 border-b border-gray-200">
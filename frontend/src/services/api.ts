@@ -4,14 +4,20 @@ import type {
   LoginResponse,
   Finding,
   FindingListResponse,
+  FindingStats,
+  FindingTrends,
   FindingStatusUpdate,
+  ResolutionGroupBy,
+  ResolutionStats,
+  TrendGranularity,
+  TrendGroupBy,
   User,
   Area,
   NotificationSettings,
 } from '../types'
 
 // API URL from environment variable
-const API_URL = import.meta.env.VITE_API_URL || 'http://localhost:8000'
+export const API_URL = import.meta.env.VITE_API_URL || 'http://localhost:8000'
 
 const api = axios.create({
   baseURL: `${API_URL}/api/v1`,
@@ -70,6 +76,31 @@ export const findingsApi = {
     const response = await api.get<FindingListResponse>('/findings', { params })
     return response.data
   },
+  stats: async (): Promise<FindingStats> => {
+    const response = await api.get<FindingStats>('/findings/stats')
+    return response.data
+  },
+  resolution: async (params?: {
+    group_by?: ResolutionGroupBy
+    date_from?: string
+    date_to?: string
+    area_id?: string
+  }): Promise<ResolutionStats> => {
+    const response = await api.get<ResolutionStats>('/findings/resolution', { params })
+    return response.data
+  },
+  trends: async (params?: {
+    granularity?: TrendGranularity
+    group_by?: TrendGroupBy
+    date_from?: string
+    date_to?: string
+    tz?: string
+    area_id?: string
+    severity?: string
+  }): Promise<FindingTrends> => {
+    const response = await api.get<FindingTrends>('/findings/trends', { params })
+    return response.data
+  },
   get: async (id: string): Promise<Finding> => {
     const response = await api.get<Finding>(`/findings/${id}`)
     return response.data
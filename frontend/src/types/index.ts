@@ -60,6 +60,7 @@ export interface Finding {
   location: string | null
   reported_at: string
   closed_at: string | null
+  archived_at: string | null
   assigned_to: string | null
   created_at: string
   updated_at: string
@@ -78,6 +79,58 @@ export interface FindingListResponse {
   total_pages: number
 }
 
+export interface FindingStats {
+  total: number
+  by_status: Record<Status, number>
+  by_severity: Record<Severity, number>
+  open_by_area: { area_id: string; area_name: string; count: number }[]
+  reported_today: number
+  reported_this_week: number
+  oldest_open_critical: {
+    id: string
+    report_id: string
+    area_id: string
+    area_name: string
+    reported_at: string
+  } | null
+}
+
+export type TrendGranularity = 'day' | 'week' | 'month'
+export type TrendGroupBy = 'severity' | 'status' | 'area'
+
+export interface FindingTrends {
+  granularity: TrendGranularity
+  group_by: TrendGroupBy
+  timezone: string
+  date_from: string
+  date_to: string
+  buckets: string[]
+  series: { key: string; label: string; counts: number[]; total: number }[]
+}
+
+export type ResolutionGroupBy = 'area' | 'severity' | 'assignee'
+
+export interface ResolutionStats {
+  group_by: ResolutionGroupBy
+  date_from: string | null
+  date_to: string | null
+  sla_hours: Record<Severity, number>
+  groups: {
+    key: string | null
+    label: string
+    findings: number
+    resolved: number
+    reopened: number
+    mttr_hours: number | null
+    p50_hours: number | null
+    p90_hours: number | null
+    sla_breached: number
+    sla_breach_rate: number
+    open_hours: number
+    in_progress_hours: number
+  }[]
+}
+
 export interface LoginRequest {
   staff_id: string
   password: string